@@ -0,0 +1,99 @@
+"""
+Benchmark catalog column extraction.
+
+Compares, on synthetic projects, the former ``extract_columns`` (a
+``model_dump()`` of every Pydantic catalog column), reading the Pydantic
+columns attribute by attribute, and the raw catalog fast path, both as
+records only and as property dicts. All paths must produce identical dicts.
+
+Usage:
+    python benchmarks/bench_columns.py [--models 5000 20000] [--columns 20] [--repeat 3]
+"""
+
+import argparse
+import tempfile
+import time
+from collections.abc import Callable
+from typing import Any
+
+from synthetic_project import generate_project
+
+from dbt_to_cypher.catalog import CatalogColumn
+from dbt_to_cypher.extractor import DbtDependencyExtractor
+
+
+def model_dump_columns(extractor: DbtDependencyExtractor) -> dict[str, Any]:
+    """Column extraction as it was before the fast path."""
+    nodes: dict[str, Any] = {}
+    for node_id, catalog_node in extractor.catalog.nodes.items():
+        for column_name, column in (catalog_node.columns or {}).items():
+            name = f"{node_id}.{column_name}"
+            column_dict = column.model_dump()
+            column_dict["name"] = name
+            column_dict["model_name"] = node_id
+            nodes[name] = column_dict
+    return nodes
+
+
+def pydantic_columns(extractor: DbtDependencyExtractor) -> dict[str, Any]:
+    """Columns read from the Pydantic catalog, without the raw catalog."""
+    raw, extractor.catalog_dict = extractor.catalog_dict, None
+    try:
+        return extractor.extract_columns()
+    finally:
+        extractor.catalog_dict = raw
+
+
+def column_records(extractor: DbtDependencyExtractor) -> list[CatalogColumn]:
+    """Columns of the raw catalog fast path, without building dicts."""
+    return list(extractor.iter_columns())
+
+
+def best_of(
+    repeat: int,
+    function: Callable[[DbtDependencyExtractor], Any],
+    extractor: DbtDependencyExtractor,
+) -> tuple[Any, float]:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function(extractor)
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--models", type=int, nargs="+", default=[5000, 20000])
+    parser.add_argument("--columns", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(
+        f"{'columns':>9} {'model_dump':>11} {'pydantic':>9} {'raw records':>12} "
+        f"{'raw dicts':>10} {'speedup':>8}"
+    )
+    for n_models in args.models:
+        with tempfile.TemporaryDirectory() as directory:
+            project = generate_project(directory, n_models, args.columns, depth=1)
+            extractor = DbtDependencyExtractor(str(project), lightweight=True)
+            extractor.load_file()
+
+            legacy, legacy_seconds = best_of(args.repeat, model_dump_columns, extractor)
+            pydantic, pydantic_seconds = best_of(args.repeat, pydantic_columns, extractor)
+            _, records_seconds = best_of(args.repeat, column_records, extractor)
+            fast, fast_seconds = best_of(
+                args.repeat, DbtDependencyExtractor.extract_columns, extractor
+            )
+            if not (fast == pydantic == legacy and list(fast) == list(legacy)):
+                raise SystemExit("Column extraction paths disagree")
+
+            print(
+                f"{len(fast):>9} {legacy_seconds:>10.3f}s {pydantic_seconds:>8.3f}s "
+                f"{records_seconds:>11.3f}s {fast_seconds:>9.3f}s "
+                f"{legacy_seconds / fast_seconds:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Benchmark memory use and build time of the graph backends.
+
+Builds the same synthetic graph (models with columns, each column reading
+from the same column of the previous model) with ``DependencyGraph`` and
+``CompactDependencyGraph`` and reports traced memory after the build.
+
+Usage:
+    python benchmarks/bench_graph_backends.py [--models 1000 5000] [--columns 20]
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+
+from dbt_to_cypher.compact_graph import CompactDependencyGraph
+from dbt_to_cypher.graph import DependencyGraph
+
+
+def build_synthetic_graph(graph: DependencyGraph, n_models: int, n_columns: int) -> None:
+    """Add a chain of models whose columns each read from the previous model."""
+    for i in range(n_models):
+        model = f"model.bench.model_{i}"
+        graph.add_model(
+            model, {"database": "analytics", "schema": "main", "materialization": "table"}
+        )
+        for c in range(n_columns):
+            graph.add_column(model, f"col_{c}", {"type": "INTEGER", "model_name": model})
+            if i:
+                graph.add_dependency(f"{model}.col_{c}", f"model.bench.model_{i - 1}.col_{c}")
+        if i:
+            graph.add_dependency(model, f"model.bench.model_{i - 1}")
+    # Fold pending edges so both backends are measured in their queryable state
+    graph.number_of_edges()
+
+
+def measure(backend: type[DependencyGraph], n_models: int, n_columns: int) -> tuple[float, float]:
+    """Return (build seconds, traced MiB) for a backend."""
+    # Time an untraced build, since tracemalloc slows allocation-heavy code unevenly
+    gc.collect()
+    start = time.perf_counter()
+    build_synthetic_graph(backend(), n_models, n_columns)
+    elapsed = time.perf_counter() - start
+
+    gc.collect()
+    tracemalloc.start()
+    graph = backend()
+    build_synthetic_graph(graph, n_models, n_columns)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del graph
+    return elapsed, size / 2**20
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--models", type=int, nargs="+", default=[1000, 5000])
+    parser.add_argument("--columns", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'models':>8} {'nodes':>9} {'networkx (MiB)':>15} {'compact (MiB)':>14} {'ratio':>6}")
+    for n_models in args.models:
+        nx_time, nx_size = measure(DependencyGraph, n_models, args.columns)
+        compact_time, compact_size = measure(CompactDependencyGraph, n_models, args.columns)
+        print(
+            f"{n_models:>8} {n_models * (args.columns + 1):>9} {nx_size:>15.1f} "
+            f"{compact_size:>14.1f} {nx_size / compact_size:>5.1f}x"
+            f"   build {nx_time:.2f}s vs {compact_time:.2f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Benchmark the pipelined export against the sequential one.
+
+Generates synthetic projects and streams their Cypher script to
+``os.devnull``, measuring the time until the first statement is written and
+the total wall time, best of ``--repeat``. Both modes must write the same
+statements.
+
+Usage:
+    python benchmarks/bench_pipeline.py [--models 1000 3000] [--columns 10] [--jobs 1]
+        [--repeat 3]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from synthetic_project import generate_project
+
+from dbt_to_cypher.dbt_to_cypher import iter_dbt_project_queries
+
+
+def run(project: Path, jobs: int, pipelined: bool) -> tuple[float, float, list[str]]:
+    """Return seconds to the first statement, total seconds and the sorted statements."""
+    start = time.perf_counter()
+    first = None
+    statements = []
+    with open(os.devnull, "w", encoding="utf-8") as fp:
+        for query in iter_dbt_project_queries(project, jobs=jobs, pipelined=pipelined):
+            if first is None:
+                first = time.perf_counter() - start
+            fp.write(query)
+            statements.append(query)
+    return first or 0.0, time.perf_counter() - start, sorted(statements)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--models", type=int, nargs="+", default=[1000, 3000])
+    parser.add_argument("--columns", type=int, default=10)
+    parser.add_argument("--jobs", type=int, default=1)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    # Keep one-off imports of dbt-artifacts-parser and dbt-colibri out of the timings
+    import dbt_artifacts_parser.parser  # noqa: F401
+    import dbt_colibri.lineage_extractor.extractor  # noqa: F401
+
+    print(f"{'models':>7} {'mode':<11} {'first':>8} {'total':>8}")
+    for n_models in args.models:
+        with tempfile.TemporaryDirectory() as directory:
+            project = generate_project(directory, n_models, args.columns)
+            outputs = []
+            for mode, pipelined in (("sequential", False), ("pipelined", True)):
+                runs = [run(project, args.jobs, pipelined) for _ in range(args.repeat)]
+                first = min(result[0] for result in runs)
+                total = min(result[1] for result in runs)
+                outputs.append(runs[0][2])
+                print(f"{n_models:>7} {mode:<11} {first:>7.2f}s {total:>7.2f}s")
+            if outputs[0] != outputs[1]:
+                raise SystemExit("Pipelined and sequential statements differ")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Benchmark upstream table resolution in column lineage transformation.
+
+Compares the previous linear suffix scan over all lineage model IDs with the
+relation index used by ``DbtDependencyExtractor._resolve_lineage_references`` on a
+synthetic manifest and lineage map.
+
+Usage:
+    python benchmarks/bench_relation_index.py [--models 500 1000 2000] [--columns 10]
+"""
+
+import argparse
+import time
+from types import SimpleNamespace
+from typing import Any
+
+from sqlglot import exp
+
+from dbt_to_cypher.extractor import DbtDependencyExtractor
+from dbt_to_cypher.lineage import extract_lineage_references
+from dbt_to_cypher.manifest import LightweightManifest
+
+
+def build_synthetic_lineage(n_models: int, n_columns: int) -> tuple[dict[str, Any], dict]:
+    """Build a manifest and lineage map where each model reads from its predecessor."""
+    manifest: dict[str, Any] = {"metadata": {}, "nodes": {}}
+    lineage: dict[str, dict] = {}
+    for i in range(n_models):
+        name = f"model_{i}"
+        node_id = f"model.bench.{name}"
+        upstream = f"model_{i - 1}" if i else None
+        manifest["nodes"][node_id] = {
+            "name": name,
+            "alias": name,
+            "database": "analytics",
+            "schema": "main",
+            "resource_type": "model",
+            "config": {"materialized": "table"},
+            "depends_on": {"nodes": [f"model.bench.{upstream}"] if upstream else []},
+        }
+        columns = {}
+        for c in range(n_columns):
+            downstream = []
+            if upstream:
+                table = exp.table_(upstream, db="main", catalog="analytics")
+                downstream.append(SimpleNamespace(name=f"{upstream}.col_{c}", expression=table))
+            columns[f"col_{c}"] = SimpleNamespace(downstream=downstream)
+        lineage[node_id] = columns
+    return manifest, lineage
+
+
+def suffix_scan(lineage: dict[str, dict]) -> dict[str, list[str]]:
+    """Reference implementation of the previous O(columns x models) resolution."""
+    column_dependencies: dict[str, list[str]] = {}
+    for model_id, columns in lineage.items():
+        for column_name, node in columns.items():
+            upstream_columns = []
+            for downstream_node in node.downstream:
+                _, col_name = downstream_node.name.split(".")
+                table_name = str(downstream_node.expression.this.this)
+                for mid in lineage.keys():
+                    if mid.endswith(f".{table_name}"):
+                        upstream_columns.append(f"{mid}.{col_name}")
+                        break
+            column_dependencies[f"{model_id}.{column_name}"] = upstream_columns
+    return column_dependencies
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--models", type=int, nargs="+", default=[250, 500, 1000, 2000])
+    parser.add_argument("--columns", type=int, default=10)
+    args = parser.parse_args()
+
+    print(f"{'models':>8} {'columns':>8} {'suffix scan (s)':>16} {'index (s)':>10} {'speedup':>8}")
+    for n_models in args.models:
+        manifest, lineage = build_synthetic_lineage(n_models, args.columns)
+        extractor = DbtDependencyExtractor("/synthetic")
+        extractor.manifest = LightweightManifest.from_dict(manifest)
+
+        start = time.perf_counter()
+        expected = suffix_scan(lineage)
+        scan_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        result = extractor._resolve_lineage_references(extract_lineage_references(lineage))
+        index_time = time.perf_counter() - start
+
+        assert result == expected
+        print(
+            f"{n_models:>8} {n_models * args.columns:>8} {scan_time:>16.3f} "
+            f"{index_time:>10.3f} {scan_time / index_time:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Benchmark saving and opening dependency graphs as binary snapshots.
+
+Builds the synthetic graph of ``bench_graph_backends.py`` and compares
+``snapshot.save``/``snapshot.load`` (with and without mmap) with the
+node-link JSON of ``DependencyGraph.to_dict``/``from_dict``.
+
+Usage:
+    python benchmarks/bench_snapshot.py [--models 5000 25000] [--columns 20]
+"""
+
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+
+from bench_graph_backends import build_synthetic_graph
+
+from dbt_to_cypher import snapshot
+from dbt_to_cypher.compact_graph import CompactDependencyGraph
+from dbt_to_cypher.graph import DependencyGraph
+
+
+def load_json(path: Path) -> DependencyGraph:
+    return DependencyGraph.from_dict(json.loads(path.read_text(encoding="utf-8")))
+
+
+def timed(function, *args, **kwargs):
+    start = time.perf_counter()
+    result = function(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--models", type=int, nargs="+", default=[5000, 25000])
+    parser.add_argument("--columns", type=int, default=20)
+    args = parser.parse_args()
+
+    print(
+        f"{'nodes':>9} {'json MiB':>9} {'json load':>10} {'snap MiB':>9} {'save':>7} "
+        f"{'load':>7} {'mmap load':>10}"
+    )
+    for n_models in args.models:
+        graph = CompactDependencyGraph()
+        build_synthetic_graph(graph, n_models, args.columns)
+        with tempfile.TemporaryDirectory() as directory:
+            json_path = Path(directory) / "graph.json"
+            json_path.write_text(json.dumps(graph.to_dict()), encoding="utf-8")
+            _, json_load = timed(load_json, json_path)
+
+            snapshot_path = Path(directory) / "graph.snapshot"
+            _, save = timed(snapshot.save, graph, snapshot_path)
+            _, load = timed(snapshot.load, snapshot_path)
+            _, mmap_load = timed(snapshot.load, snapshot_path, mmap=True)
+            print(
+                f"{graph.number_of_nodes():>9} {json_path.stat().st_size / 2**20:>9.1f} "
+                f"{json_load:>9.2f}s {snapshot_path.stat().st_size / 2**20:>9.1f} "
+                f"{save:>6.2f}s {load:>6.2f}s {mmap_load:>9.2f}s"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,224 @@
+"""
+Benchmark each pipeline stage on synthetic dbt projects of several sizes.
+
+For every size a project is generated with ``synthetic_project.py`` and the
+stages of ``extract_dbt_project`` are run one after the other: artifact
+loading, model, column and model dependency extraction, column lineage,
+graph build and Cypher generation. Each stage is timed on an untraced run
+(best of ``--repeat``) and its peak traced memory is measured on a separate
+run under tracemalloc.
+
+Results can be written as JSON and compared with a stored baseline; stages
+slower or larger than the baseline by more than ``--tolerance`` are reported
+as regressions and make the script exit with status 1.
+
+Usage:
+    python benchmarks/bench_stages.py [--models 100 300 1000] [--columns 10]
+        [--depth 10] [--fan-in 3] [--lightweight] [--repeat 3]
+        [--output results.json] [--baseline benchmarks/baselines/stages.json]
+        [--save-baseline]
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import Any
+
+from synthetic_project import generate_project
+
+from dbt_to_cypher.cypher import CypherGenerator
+from dbt_to_cypher.dbt_to_cypher import build_dependency_graph
+from dbt_to_cypher.extractor import DbtDependencyExtractor
+
+DEFAULT_BASELINE = Path(__file__).parent / "baselines" / "stages.json"
+
+# Stage name -> function of the pipeline state returning an item count
+Stage = Callable[[dict[str, Any]], int]
+
+
+def _load(state: dict[str, Any]) -> int:
+    state["extractor"].load_file()
+    return len(state["extractor"].manifest.nodes)
+
+
+def _models(state: dict[str, Any]) -> int:
+    state["models"] = state["extractor"].extract_models()
+    return len(state["models"])
+
+
+def _columns(state: dict[str, Any]) -> int:
+    state["columns"] = state["extractor"].extract_columns()
+    return len(state["columns"])
+
+
+def _model_dependencies(state: dict[str, Any]) -> int:
+    state["model_dependencies"] = state["extractor"].extract_model_dependencies()
+    return sum(len(upstreams) for upstreams in state["model_dependencies"].values())
+
+
+def _column_lineage(state: dict[str, Any]) -> int:
+    state["column_dependencies"] = state["extractor"].extract_column_dependencies()
+    return sum(len(upstreams) for upstreams in state["column_dependencies"].values())
+
+
+def _graph_build(state: dict[str, Any]) -> int:
+    dependencies = {
+        key: state[key]
+        for key in ("models", "columns", "model_dependencies", "column_dependencies")
+    }
+    state["graph"] = build_dependency_graph(dependencies, backend=state["graph_backend"])
+    return state["graph"].number_of_nodes()
+
+
+def _cypher(state: dict[str, Any]) -> int:
+    with open(os.devnull, "w", encoding="utf-8") as fp:
+        return CypherGenerator(state["graph"]).write_all_queries(fp)
+
+
+STAGES: dict[str, Stage] = {
+    "load": _load,
+    "models": _models,
+    "columns": _columns,
+    "model_dependencies": _model_dependencies,
+    "column_lineage": _column_lineage,
+    "graph_build": _graph_build,
+    "cypher": _cypher,
+}
+
+
+def _run(project: Path, args: argparse.Namespace, traced: bool) -> Iterator[tuple[str, float, int]]:
+    """Run all stages, yielding (stage, seconds or peak bytes, item count)."""
+    state: dict[str, Any] = {
+        "extractor": DbtDependencyExtractor(str(project), lightweight=args.lightweight),
+        "graph_backend": args.graph_backend,
+    }
+    for name, stage in STAGES.items():
+        gc.collect()
+        if traced:
+            tracemalloc.reset_peak()
+            baseline, _ = tracemalloc.get_traced_memory()
+            count = stage(state)
+            _, peak = tracemalloc.get_traced_memory()
+            yield name, peak - baseline, count
+        else:
+            start = time.perf_counter()
+            count = stage(state)
+            yield name, time.perf_counter() - start, count
+
+
+def measure(project: Path, args: argparse.Namespace) -> dict[str, dict[str, Any]]:
+    """Return seconds, peak traced MiB and item count per stage."""
+    results: dict[str, dict[str, Any]] = {}
+    for _ in range(args.repeat):
+        for name, seconds, count in _run(project, args, traced=False):
+            best = results.setdefault(name, {"seconds": seconds, "count": count})
+            best["seconds"] = min(best["seconds"], seconds)
+
+    tracemalloc.start()
+    try:
+        for name, peak, _ in _run(project, args, traced=True):
+            results[name]["peak_mib"] = peak / 2**20
+    finally:
+        tracemalloc.stop()
+    return results
+
+
+def compare(
+    results: list[dict[str, Any]], baseline: list[dict[str, Any]], tolerance: float
+) -> list[str]:
+    """List the stages whose time or memory exceeds the baseline by more than ``tolerance``."""
+    reference = {(entry["models"], entry["stage"]): entry for entry in baseline}
+    regressions = []
+    for entry in results:
+        previous = reference.get((entry["models"], entry["stage"]))
+        if previous is None:
+            continue
+        for metric in ("seconds", "peak_mib"):
+            # Ignore noise on stages too fast or small to measure reliably
+            floor = 0.01 if metric == "seconds" else 0.5
+            if entry[metric] > max(previous[metric], floor) * (1 + tolerance):
+                regressions.append(
+                    f"{entry['stage']} ({entry['models']} models): {metric} "
+                    f"{previous[metric]:.3f} -> {entry[metric]:.3f}"
+                )
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--models", type=int, nargs="+", default=[100, 300, 1000])
+    parser.add_argument("--columns", type=int, default=10)
+    parser.add_argument("--depth", type=int, default=10)
+    parser.add_argument("--fan-in", type=int, default=3)
+    parser.add_argument("--lightweight", action="store_true")
+    parser.add_argument("--graph-backend", default="networkx")
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--output", type=Path, help="Write results as JSON")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument(
+        "--save-baseline", action="store_true", help="Store the results as the new baseline"
+    )
+    args = parser.parse_args()
+
+    # Keep one-off imports of dbt-artifacts-parser and dbt-colibri out of the timings
+    import dbt_artifacts_parser.parser  # noqa: F401
+    import dbt_colibri.lineage_extractor.extractor  # noqa: F401
+
+    results: list[dict[str, Any]] = []
+    print(f"{'models':>7} {'stage':<19} {'seconds':>9} {'peak MiB':>9} {'items':>9}")
+    for n_models in args.models:
+        with tempfile.TemporaryDirectory() as directory:
+            project = generate_project(directory, n_models, args.columns, args.depth, args.fan_in)
+            for stage, result in measure(project, args).items():
+                results.append({"models": n_models, "stage": stage, **result})
+                print(
+                    f"{n_models:>7} {stage:<19} {result['seconds']:>9.3f} "
+                    f"{result['peak_mib']:>9.1f} {result['count']:>9}"
+                )
+
+    report = {
+        "environment": {
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "processor": platform.machine(),
+        },
+        "parameters": {
+            "columns": args.columns,
+            "depth": args.depth,
+            "fan_in": args.fan_in,
+            "lightweight": args.lightweight,
+            "graph_backend": args.graph_backend,
+        },
+        "results": results,
+    }
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    if args.save_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    if not args.baseline.exists():
+        return 0
+    stored = json.loads(args.baseline.read_text(encoding="utf-8"))
+    if stored["parameters"] != report["parameters"]:
+        print(f"Baseline {args.baseline} was recorded with other parameters; not comparing")
+        return 0
+    regressions = compare(results, stored["results"], args.tolerance)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,65 @@
+"""
+Benchmark CLI startup with ``python -X importtime``.
+
+Runs each command in a fresh interpreter and reports its wall time, the
+cumulative time of all imports and the cumulative time of the
+``dbt_to_cypher`` modules, best of ``--repeat``. ``python -c pass`` is
+included as the interpreter's own baseline.
+
+Usage:
+    python benchmarks/bench_startup.py [--repeat 10]
+"""
+
+import argparse
+import subprocess
+import sys
+import time
+
+COMMANDS = {
+    "python -c pass": ("-c", "pass"),
+    "import dbt_to_cypher.cli": ("-c", "import dbt_to_cypher.cli"),
+    "dbt-to-cypher --version": ("-m", "dbt_to_cypher.cli", "--version"),
+}
+
+
+def run(args: tuple[str, ...]) -> tuple[float, float, float]:
+    """Return wall, import and package import seconds for one interpreter run."""
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    wall = time.perf_counter() - start
+    imports = package = 0
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, total, name = line[len("import time:") :].split("|")
+        # Nested imports are indented further and counted in their importer
+        if name[1:].startswith(" "):
+            continue
+        imports += int(total)
+        if name.strip().split(".")[0] == "dbt_to_cypher":
+            package += int(total)
+    return wall, imports / 1e6, package / 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    print(f"{'command':<26} {'wall':>8} {'imports':>8} {'package':>8}")
+    for label, command in COMMANDS.items():
+        runs = [run(command) for _ in range(args.repeat)]
+        wall, imports, package = (min(values) for values in zip(*runs))
+        print(
+            f"{label:<26} {wall * 1000:>6.1f}ms {imports * 1000:>6.1f}ms {package * 1000:>6.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+"""
+Generate a synthetic compiled dbt project for benchmarks.
+
+Writes ``target/manifest.json`` (v12), ``target/catalog.json`` (v1) and the
+compiled SQL of every model under ``target/compiled``. Models are laid out in
+``depth`` layers: models of the first layer select literals, every other model
+joins ``fan_in`` models of earlier layers (at least one from the previous
+layer, so the DAG has the requested depth), and each of its columns reads one
+column of one of its parents, so column lineage follows the model DAG.
+
+Usage:
+    python benchmarks/synthetic_project.py OUTPUT_DIR [--models 1000] [--columns 20]
+        [--depth 10] [--fan-in 3] [--seed 0]
+"""
+
+import argparse
+import json
+import random
+from pathlib import Path
+from typing import Any, Union
+
+PACKAGE = "bench"
+DATABASE = "analytics"
+SCHEMA = "main"
+
+
+def _relation(name: str) -> str:
+    return f'"{DATABASE}"."{SCHEMA}"."{name}"'
+
+
+def _model_sql(parents: list[str], n_columns: int) -> str:
+    """Build compiled SQL joining the parents on their first column."""
+    if not parents:
+        columns = ",\n".join(f"    {index} as col_{index}" for index in range(n_columns))
+        return f"select\n{columns}\n"
+
+    aliases = [f"p{index}" for index in range(len(parents))]
+    columns = ",\n".join(
+        f"    {aliases[index % len(parents)]}.col_{index} as col_{index}"
+        for index in range(n_columns)
+    )
+    joins = "".join(
+        f"\njoin {_relation(parent)} as {alias} on {alias}.col_0 = p0.col_0"
+        for parent, alias in zip(parents[1:], aliases[1:])
+    )
+    return f"select\n{columns}\nfrom {_relation(parents[0])} as p0{joins}\n"
+
+
+def _layers(n_models: int, depth: int) -> list[list[str]]:
+    """Spread model names evenly over ``depth`` layers."""
+    depth = max(1, min(depth, n_models))
+    layers: list[list[str]] = [[] for _ in range(depth)]
+    for index in range(n_models):
+        layers[index * depth // n_models].append(f"model_{index}")
+    return layers
+
+
+def generate_project(
+    output_dir: Union[Path, str],
+    n_models: int = 1000,
+    n_columns: int = 20,
+    depth: int = 10,
+    fan_in: int = 3,
+    seed: int = 0,
+) -> Path:
+    """
+    Write a synthetic compiled dbt project.
+
+    Args:
+        output_dir: Project directory; artifacts are written to its ``target``
+        n_models: Number of models
+        n_columns: Number of columns per model
+        depth: Number of model layers (length of the longest dependency chain)
+        fan_in: Maximum number of parents per model
+        seed: Random seed, so that the same arguments give the same project
+
+    Returns:
+        The project directory
+    """
+    rng = random.Random(seed)
+    project = Path(output_dir)
+    target = project / "target"
+    compiled_dir = target / "compiled" / PACKAGE / "models"
+    compiled_dir.mkdir(parents=True, exist_ok=True)
+
+    nodes: dict[str, Any] = {}
+    catalog_nodes: dict[str, Any] = {}
+    parent_map: dict[str, list[str]] = {}
+    child_map: dict[str, list[str]] = {}
+    layers = _layers(n_models, depth)
+    earlier: list[str] = []
+    for layer_index, layer in enumerate(layers):
+        for name in layer:
+            parents: list[str] = []
+            if layer_index:
+                # A parent from the previous layer makes the DAG as deep as requested
+                parents.append(rng.choice(layers[layer_index - 1]))
+                extra = min(rng.randint(0, max(0, fan_in - 1)), len(earlier) - 1)
+                parents.extend(rng.sample([m for m in earlier if m != parents[0]], extra))
+
+            unique_id = f"model.{PACKAGE}.{name}"
+            directory = f"layer_{layer_index}"
+            sql = _model_sql(parents, n_columns)
+            (compiled_dir / directory).mkdir(exist_ok=True)
+            compiled_path = compiled_dir / directory / f"{name}.sql"
+            compiled_path.write_text(sql, encoding="utf-8")
+
+            depends_on = [f"model.{PACKAGE}.{parent}" for parent in parents]
+            nodes[unique_id] = {
+                "database": DATABASE,
+                "schema": SCHEMA,
+                "name": name,
+                "resource_type": "model",
+                "package_name": PACKAGE,
+                "path": f"{directory}/{name}.sql",
+                "original_file_path": f"models/{directory}/{name}.sql",
+                "unique_id": unique_id,
+                "fqn": [PACKAGE, directory, name],
+                "alias": name,
+                "checksum": {"name": "sha256", "checksum": name},
+                "config": {"materialized": "table"},
+                "tags": [directory],
+                "depends_on": {"nodes": depends_on, "macros": []},
+                "raw_code": sql,
+                "compiled_code": sql,
+                "compiled_path": str(compiled_path.relative_to(project)),
+                "relation_name": _relation(name),
+                "language": "sql",
+            }
+            catalog_nodes[unique_id] = {
+                "metadata": {
+                    "type": "BASE TABLE",
+                    "schema": SCHEMA,
+                    "name": name,
+                    "database": DATABASE,
+                },
+                "columns": {
+                    f"col_{index}": {"type": "INTEGER", "index": index + 1, "name": f"col_{index}"}
+                    for index in range(n_columns)
+                },
+                "stats": {},
+                "unique_id": unique_id,
+            }
+            parent_map[unique_id] = depends_on
+            child_map.setdefault(unique_id, [])
+            for parent in depends_on:
+                child_map[parent].append(unique_id)
+        earlier.extend(layer)
+
+    manifest = {
+        "metadata": {
+            "dbt_schema_version": "https://schemas.getdbt.com/dbt/manifest/v12.json",
+            "adapter_type": "duckdb",
+        },
+        "nodes": nodes,
+        "sources": {},
+        "macros": {},
+        "docs": {},
+        "exposures": {},
+        "metrics": {},
+        "groups": {},
+        "selectors": {},
+        "disabled": {},
+        "parent_map": parent_map,
+        "child_map": child_map,
+        "group_map": {},
+        "saved_queries": {},
+        "semantic_models": {},
+        "unit_tests": {},
+    }
+    catalog = {
+        "metadata": {"dbt_schema_version": "https://schemas.getdbt.com/dbt/catalog/v1.json"},
+        "nodes": catalog_nodes,
+        "sources": {},
+    }
+    (target / "manifest.json").write_text(json.dumps(manifest), encoding="utf-8")
+    (target / "catalog.json").write_text(json.dumps(catalog), encoding="utf-8")
+    return project
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("output_dir", type=Path)
+    parser.add_argument("--models", type=int, default=1000)
+    parser.add_argument("--columns", type=int, default=20)
+    parser.add_argument("--depth", type=int, default=10)
+    parser.add_argument("--fan-in", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    project = generate_project(
+        args.output_dir, args.models, args.columns, args.depth, args.fan_in, args.seed
+    )
+    print(f"Wrote {args.models} models with {args.columns} columns to {project / 'target'}")
+
+
+if __name__ == "__main__":
+    main()
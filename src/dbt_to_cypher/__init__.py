@@ -5,12 +5,32 @@ This library provides tools to parse dbt projects, extract model and column-leve
 dependencies, and generate Cypher queries for visualization and analysis in graph databases.
 """
 
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 __version__ = "0.1.0"
 
-from dbt_to_cypher.cypher import CypherGenerator
-from dbt_to_cypher.dbt_to_cypher import extract_dbt_project, extract_dependencies
-from dbt_to_cypher.extractor import DbtDependencyExtractor
-from dbt_to_cypher.graph import DependencyGraph
+if TYPE_CHECKING:
+    from dbt_to_cypher.cypher import CypherGenerator
+    from dbt_to_cypher.dbt_to_cypher import (
+        extract_dbt_project,
+        extract_dependencies,
+        write_dbt_project,
+    )
+    from dbt_to_cypher.extractor import DbtDependencyExtractor
+    from dbt_to_cypher.graph import DependencyGraph
+
+# Public names -> defining module. They are imported on first access, so that
+# importing the package (e.g. for ``dbt-to-cypher --version``) does not load
+# networkx, dbt-artifacts-parser or dbt-colibri.
+_LAZY_ATTRIBUTES = {
+    "DbtDependencyExtractor": "dbt_to_cypher.extractor",
+    "DependencyGraph": "dbt_to_cypher.graph",
+    "CypherGenerator": "dbt_to_cypher.cypher",
+    "extract_dbt_project": "dbt_to_cypher.dbt_to_cypher",
+    "extract_dependencies": "dbt_to_cypher.dbt_to_cypher",
+    "write_dbt_project": "dbt_to_cypher.dbt_to_cypher",
+}
 
 __all__ = [
     "DbtDependencyExtractor",
@@ -18,4 +38,19 @@ __all__ = [
     "CypherGenerator",
     "extract_dbt_project",
     "extract_dependencies",
+    "write_dbt_project",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_LAZY_ATTRIBUTES])
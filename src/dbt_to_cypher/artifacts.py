@@ -0,0 +1,259 @@
+"""
+Module for reading dbt artifacts from files or memory.
+
+An artifact source is a path to ``manifest.json``/``catalog.json``, possibly
+gzip or Zstandard compressed, or the artifact's bytes already in memory
+(e.g. downloaded from object storage), compressed or not. Compression is
+detected from the leading magic bytes, not the file suffix.
+
+JSON is decoded with msgspec when installed, which decodes documents the
+way the standard library does, integers of any size included, and with the
+standard library otherwise; orjson, which turns integers beyond 64 bits into
+floats, is only used when selected by name. Documents a fast backend rejects
+but the standard library accepts (``NaN``, ``Infinity``, out-of-range
+floats) are decoded again with the standard library. Plain files are
+memory-mapped for backends that decode any buffer, so the file is never
+copied into a ``bytes`` object.
+"""
+
+import gzip
+import io
+import json
+import mmap
+import os
+from collections.abc import Callable, Iterator
+from contextlib import ExitStack, contextmanager
+from pathlib import Path
+from typing import IO, Any, NamedTuple, Optional, TextIO, Union, cast
+
+# A path to an artifact, or the artifact's (possibly compressed) bytes
+ArtifactSource = Union[Path, str, bytes, bytearray, memoryview]
+
+# Environment variable selecting the JSON backend when none is given
+JSON_BACKEND_ENV = "DBT_TO_CYPHER_JSON_BACKEND"
+
+# File name suffixes tried, in order, when looking for an artifact
+ARTIFACT_SUFFIXES = ("", ".gz", ".zst")
+
+_GZIP_MAGIC = b"\x1f\x8b"
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+
+class JsonBackend(NamedTuple):
+    """JSON decoder used to load artifacts."""
+
+    name: str
+    loads: Callable[[Any], Any]
+    # Whether loads accepts any buffer (memoryview, mmap) and not only bytes
+    accepts_buffers: bool
+
+
+def _with_stdlib_fallback(
+    name: str, loads: Callable[[Any], Any], error: type[Exception]
+) -> JsonBackend:
+    """Wrap a fast decoder so that documents it rejects are decoded by the standard library."""
+
+    def loads_or_stdlib(data: Any) -> Any:
+        try:
+            return loads(data)
+        except error:
+            # Accepts what the stdlib accepts, and raises json.JSONDecodeError otherwise
+            return json.loads(bytes(data))
+
+    return JsonBackend(name, loads_or_stdlib, True)
+
+
+def _orjson_backend() -> JsonBackend:
+    import orjson
+
+    return _with_stdlib_fallback("orjson", orjson.loads, orjson.JSONDecodeError)
+
+
+def _msgspec_backend() -> JsonBackend:
+    import msgspec
+
+    return _with_stdlib_fallback("msgspec", msgspec.json.Decoder().decode, msgspec.DecodeError)
+
+
+def _stdlib_backend() -> JsonBackend:
+    return JsonBackend("json", json.loads, False)
+
+
+# Backend name -> factory
+_BACKENDS: dict[str, Callable[[], JsonBackend]] = {
+    "orjson": _orjson_backend,
+    "msgspec": _msgspec_backend,
+    "json": _stdlib_backend,
+}
+
+# Backends tried by "auto", in order; they decode like the standard library
+_AUTO_BACKENDS = ("msgspec", "json")
+
+JSON_BACKENDS = ("auto", *_BACKENDS)
+
+
+def get_json_backend(name: Optional[str] = None) -> JsonBackend:
+    """
+    Return a JSON backend by name.
+
+    Args:
+        name: One of ``JSON_BACKENDS``; ``"auto"`` picks msgspec if installed,
+            else json. orjson is faster on some documents but decodes integers
+            beyond 64 bits as floats, so it must be named. Defaults to the value of
+            ``$DBT_TO_CYPHER_JSON_BACKEND``, then ``"auto"``
+
+    Returns:
+        JsonBackend
+
+    Raises:
+        ValueError: If the name is unknown
+        ImportError: If the named backend is not installed
+    """
+    name = name or os.environ.get(JSON_BACKEND_ENV) or "auto"
+    if name == "auto":
+        for candidate in _AUTO_BACKENDS:
+            try:
+                return _BACKENDS[candidate]()
+            except ImportError:
+                continue
+    factory = _BACKENDS.get(name)
+    if factory is None:
+        raise ValueError(f"Unknown JSON backend '{name}', expected one of {list(JSON_BACKENDS)}")
+    try:
+        return factory()
+    except ImportError as e:
+        raise ImportError(f"The {name} JSON backend is not installed: pip install {name}") from e
+
+
+def find_artifact(directory: Union[Path, str], name: str) -> Path:
+    """
+    Locate an artifact that may be stored compressed.
+
+    Args:
+        directory: Directory holding the artifact, e.g. a project's ``target``
+        name: Artifact file name, e.g. ``manifest.json``
+
+    Returns:
+        The first existing of ``name``, ``name.gz`` and ``name.zst``; ``name``
+        if none exists
+    """
+    directory = Path(directory)
+    for suffix in ARTIFACT_SUFFIXES:
+        path = directory / f"{name}{suffix}"
+        if path.exists():
+            return path
+    return directory / name
+
+
+def _compression(head: bytes) -> Optional[str]:
+    """Detect the compression of data from its first bytes."""
+    if head.startswith(_GZIP_MAGIC):
+        return "gzip"
+    if head.startswith(_ZSTD_MAGIC):
+        return "zstd"
+    return None
+
+
+def _open_zstd(fp: IO[bytes]) -> IO[bytes]:
+    """Decompress a Zstandard stream with the standard library (3.14+) or zstandard."""
+    try:
+        from compression import zstd
+
+        return cast(IO[bytes], zstd.open(fp, "rb"))
+    except ImportError:
+        pass
+    try:
+        import zstandard
+    except ImportError as e:
+        raise ImportError(
+            "Reading Zstandard-compressed artifacts requires zstandard: "
+            "pip install 'dbt-to-cypher[zstd]'"
+        ) from e
+    return cast(IO[bytes], zstandard.open(fp, "rb", closefd=False))  # type: ignore[arg-type]
+
+
+@contextmanager
+def _open(source: ArtifactSource) -> Iterator[tuple[IO[bytes], Optional[str]]]:
+    """Open an artifact once, yielding a decompressing stream and the compression."""
+    with ExitStack() as stack:
+        fp: IO[bytes]
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            fp = io.BytesIO(source)
+        else:
+            fp = stack.enter_context(open(source, "rb"))
+        compression = _compression(fp.read(4))
+        fp.seek(0)
+        if compression == "gzip":
+            fp = cast(IO[bytes], stack.enter_context(gzip.GzipFile(fileobj=fp, mode="rb")))
+        elif compression == "zstd":
+            fp = stack.enter_context(_open_zstd(fp))
+        yield fp, compression
+
+
+@contextmanager
+def open_artifact(source: ArtifactSource) -> Iterator[IO[bytes]]:
+    """
+    Open an artifact as a binary stream, decompressing it on the fly.
+
+    Args:
+        source: Path or bytes, plain, gzip or Zstandard compressed
+
+    Yields:
+        Readable binary file object, closed when the context exits
+
+    Raises:
+        FileNotFoundError: If a path does not exist
+        ImportError: If the source is Zstandard compressed and no Zstandard
+            decoder is installed
+    """
+    with _open(source) as (fp, _):
+        yield fp
+
+
+@contextmanager
+def open_artifact_text(source: ArtifactSource) -> Iterator[TextIO]:
+    """
+    Open an artifact as a UTF-8 text stream, decompressing it on the fly.
+
+    Args:
+        source: Path or bytes, plain, gzip or Zstandard compressed
+
+    Yields:
+        Readable text file object, closed when the context exits
+    """
+    with open_artifact(source) as fp:
+        yield io.TextIOWrapper(fp, encoding="utf-8")
+
+
+def load_artifact(source: ArtifactSource, json_backend: Optional[str] = None) -> Any:
+    """
+    Decode an artifact's JSON.
+
+    Plain files are memory-mapped when the backend accepts buffers, and
+    uncompressed in-memory bytes are decoded without a copy; compressed
+    artifacts are decompressed in memory.
+
+    Args:
+        source: Path or bytes, plain, gzip or Zstandard compressed
+        json_backend: Name of the JSON backend (see ``get_json_backend``)
+
+    Returns:
+        Decoded JSON document
+
+    Raises:
+        FileNotFoundError: If a path does not exist
+        json.JSONDecodeError: If the artifact is not valid JSON
+    """
+    backend = get_json_backend(json_backend)
+    if isinstance(source, (bytes, bytearray, memoryview)) and not _compression(bytes(source[:4])):
+        if backend.accepts_buffers or not isinstance(source, memoryview):
+            return backend.loads(source)
+        return backend.loads(bytes(source))
+
+    with _open(source) as (fp, compression):
+        if compression is None and backend.accepts_buffers and os.fstat(fp.fileno()).st_size:
+            with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                # The view must be released before the mapping is closed
+                with memoryview(mapped) as view:
+                    return backend.loads(view)
+        return backend.loads(fp.read())
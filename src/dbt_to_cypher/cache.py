@@ -0,0 +1,311 @@
+"""
+Module for caching per-model column lineage on disk.
+
+Entries are keyed by a hash of the model's compiled SQL together with the
+catalog schemas of the model and its upstream relations, so a model is only
+re-parsed when its SQL or the columns it reads from change.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from abc import ABC, abstractmethod
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from dbt_to_cypher.lineage import ColumnReference
+
+logger = logging.getLogger(__name__)
+
+# Bump when the entry layout or key derivation changes
+CACHE_FORMAT_VERSION = 1
+
+DEFAULT_CACHE_DIRNAME = ".dbt_to_cypher_cache"
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+_ENTRY_SUFFIX = ".json"
+_TMP_SUFFIX = ".tmp"
+_VERSION_FILE = "VERSION"
+
+
+def _package_version(package: str) -> str:
+    try:
+        return version(package)
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def cache_version() -> str:
+    """Return the version stamp; a library upgrade invalidates existing entries."""
+    return (
+        f"{CACHE_FORMAT_VERSION}"
+        f"-dbt-to-cypher={_package_version('dbt-to-cypher')}"
+        f"-dbt-colibri={_package_version('dbt-colibri')}"
+        f"-sqlglot={_package_version('sqlglot')}"
+    )
+
+
+class BaseLineageCache(ABC):
+    """
+    Cache of column lineage references per model.
+
+    Keys come from ``model_key``; ``hits`` and ``misses`` count lookups.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the hit/miss counters."""
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def model_key(manifest: dict[str, Any], catalog: dict[str, Any], model_id: str) -> str:
+        """
+        Compute the cache key of a model.
+
+        The key covers the adapter, the model's compiled SQL and catalog columns,
+        and for each upstream node its catalog columns (or compiled SQL for
+        ephemeral nodes, which are not in the catalog).
+
+        Args:
+            manifest: Raw manifest dict
+            catalog: Raw catalog dict
+            model_id: Unique ID of the model
+
+        Returns:
+            Hex digest identifying the model's lineage inputs
+        """
+        nodes = manifest.get("nodes", {})
+        catalog_nodes = catalog.get("nodes", {})
+        catalog_sources = catalog.get("sources", {})
+
+        def schema_of(node_id: str) -> Any:
+            entry = catalog_nodes.get(node_id) or catalog_sources.get(node_id)
+            if entry is not None:
+                return entry.get("columns")
+            return (nodes.get(node_id) or {}).get("compiled_code")
+
+        model = nodes.get(model_id, {})
+        parents = sorted((model.get("depends_on") or {}).get("nodes") or [])
+        payload = {
+            "adapter_type": manifest.get("metadata", {}).get("adapter_type"),
+            "model_id": model_id,
+            "path": model.get("path"),
+            "resource_type": model.get("resource_type"),
+            "compiled_code": model.get("compiled_code"),
+            "columns": schema_of(model_id),
+            "manifest_columns": model.get("columns"),
+            "parents": {parent: schema_of(parent) for parent in parents},
+        }
+        encoded = json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()
+
+    @abstractmethod
+    def get(self, key: str) -> tuple[bool, Optional[dict[str, list[ColumnReference]]]]:
+        """
+        Look up the lineage references stored under a key.
+
+        Returns:
+            Tuple of (hit, references); references is None for models that
+            produced no lineage
+        """
+
+    @abstractmethod
+    def put(self, key: str, references: Optional[dict[str, list[ColumnReference]]]) -> None:
+        """
+        Store the lineage references of a model.
+
+        Args:
+            key: Cache key from ``model_key``
+            references: Column references of the model, or None if it has no lineage
+        """
+
+    @abstractmethod
+    def prune(self) -> None:
+        """Evict entries, after a run has used the ones it needs."""
+
+    def log_stats(self) -> None:
+        """Log hit/miss counters."""
+        logger.info(f"Column lineage cache: {self.hits} hits, {self.misses} misses")
+
+
+class LineageCache(BaseLineageCache):
+    """
+    Size-bounded on-disk cache of column lineage references per model.
+
+    Each entry is a small JSON file named after its key. Hits refresh the
+    entry's modification time and ``prune()`` evicts the least recently used
+    entries once the cache grows beyond ``max_bytes``.
+    """
+
+    def __init__(self, directory: Union[Path, str], max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Initialize the cache, clearing it if it was written by another version.
+
+        Args:
+            directory: Directory holding cache entries
+            max_bytes: Maximum total size of cache entries
+
+        Raises:
+            ValueError: If the directory is not empty and holds no cache
+        """
+        super().__init__()
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self._open()
+
+    def _open(self) -> None:
+        stamp = cache_version()
+        version_file = self.directory / _VERSION_FILE
+        if self.directory.exists():
+            if not version_file.exists():
+                # Never clear a directory the cache did not create
+                if any(self.directory.iterdir()):
+                    raise ValueError(
+                        f"{self.directory} is not empty and is not a lineage cache directory"
+                    )
+            elif version_file.read_text() == stamp:
+                return
+            else:
+                logger.info(f"Lineage cache version changed, clearing {self.directory}")
+                self._clear()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        version_file.write_text(stamp)
+
+    def _clear(self) -> None:
+        """Remove the entries of the cache, leaving any other file in place."""
+        for entry in os.scandir(self.directory):
+            if entry.is_file() and entry.name.endswith((_ENTRY_SUFFIX, _TMP_SUFFIX)):
+                try:
+                    os.remove(entry.path)
+                except FileNotFoundError:
+                    pass
+
+    def _entry_path(self, key: str) -> Path:
+        return self.directory / f"{key}{_ENTRY_SUFFIX}"
+
+    def get(self, key: str) -> tuple[bool, Optional[dict[str, list[ColumnReference]]]]:
+        """
+        Look up the lineage references stored under a key.
+
+        Returns:
+            Tuple of (hit, references); references is None for models that
+            produced no lineage
+        """
+        path = self._entry_path(key)
+        try:
+            with open(path, encoding="utf-8") as fp:
+                entry = json.load(fp)
+        except (OSError, ValueError):
+            self.misses += 1
+            return False, None
+
+        self.hits += 1
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            # Evicted by another process sharing the cache
+            pass
+        references = entry.get("references")
+        if references is None:
+            return True, None
+        return True, {
+            column: [ColumnReference(*reference) for reference in column_references]
+            for column, column_references in references.items()
+        }
+
+    def put(self, key: str, references: Optional[dict[str, list[ColumnReference]]]) -> None:
+        """
+        Store the lineage references of a model.
+
+        Args:
+            key: Cache key from ``model_key``
+            references: Column references of the model, or None if it has no lineage
+        """
+        path = self._entry_path(key)
+        # Unique per process, so that processes sharing the cache never write the same file
+        tmp_path = path.with_name(f"{key}.{os.getpid()}{_TMP_SUFFIX}")
+        tmp_path.write_text(json.dumps({"references": references}), encoding="utf-8")
+        os.replace(tmp_path, path)
+
+    def prune(self) -> None:
+        """Evict least recently used entries until the cache fits in ``max_bytes``."""
+        entries = []
+        total = 0
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(_ENTRY_SUFFIX):
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total += stat.st_size
+
+        evicted = 0
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+            evicted += 1
+
+        if evicted:
+            logger.info(f"Evicted {evicted} lineage cache entries")
+
+
+class MemoryLineageCache(BaseLineageCache):
+    """
+    In-process cache of column lineage references per model.
+
+    Used by watch mode, where the process stays alive between rebuilds.
+    ``prune()`` drops the entries not used since the previous prune, that is
+    models that were removed or whose lineage inputs changed.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty cache."""
+        super().__init__()
+        self._entries: dict[str, Optional[dict[str, list[ColumnReference]]]] = {}
+        self._used: set[str] = set()
+
+    def get(self, key: str) -> tuple[bool, Optional[dict[str, list[ColumnReference]]]]:
+        """
+        Look up the lineage references stored under a key.
+
+        Returns:
+            Tuple of (hit, references); references is None for models that
+            produced no lineage
+        """
+        if key not in self._entries:
+            self.misses += 1
+            return False, None
+        self.hits += 1
+        self._used.add(key)
+        return True, self._entries[key]
+
+    def put(self, key: str, references: Optional[dict[str, list[ColumnReference]]]) -> None:
+        """
+        Store the lineage references of a model.
+
+        Args:
+            key: Cache key from ``model_key``
+            references: Column references of the model, or None if it has no lineage
+        """
+        self._entries[key] = references
+        self._used.add(key)
+
+    def prune(self) -> None:
+        """Evict entries not used since the previous prune."""
+        for key in self._entries.keys() - self._used:
+            del self._entries[key]
+        self._used = set()
+
+    def log_stats(self) -> None:
+        """Log and reset hit/miss counters, so that each rebuild reports its own."""
+        super().log_stats()
+        self.hits = 0
+        self.misses = 0
@@ -0,0 +1,74 @@
+"""
+Module for reading catalog columns without Pydantic models.
+
+``catalog.json`` holds one entry per column of every relation, so on large
+projects it is by far the largest source of nodes. Columns are read straight
+from the raw catalog dict into small ``CatalogColumn`` records; dicts are only
+built when node properties are needed.
+"""
+
+from collections.abc import Collection, Iterator
+from typing import Any, Optional
+
+
+class CatalogColumn:
+    """
+    Column of a catalog node.
+
+    Attribute names match the column properties produced by
+    ``DbtDependencyExtractor.extract_columns``.
+    """
+
+    __slots__ = ("type", "index", "name", "comment", "model_name")
+
+    def __init__(
+        self,
+        type: Optional[str],
+        index: Optional[int],
+        name: str,
+        comment: Optional[str],
+        model_name: str,
+    ):
+        self.type = type
+        self.index = index
+        # Column ID: ``<node unique ID>.<column name>``
+        self.name = name
+        self.comment = comment
+        self.model_name = model_name
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the column properties as a dict, in ``__slots__`` order."""
+        return {
+            "type": self.type,
+            "index": self.index,
+            "name": self.name,
+            "comment": self.comment,
+            "model_name": self.model_name,
+        }
+
+
+def iter_catalog_columns(
+    catalog: dict[str, Any], selected: Optional[Collection[str]] = None
+) -> Iterator[CatalogColumn]:
+    """
+    Iterate over the columns of the nodes of a raw catalog dict.
+
+    Args:
+        catalog: Raw catalog dict, as loaded from ``catalog.json``
+        selected: Unique IDs of the nodes to read (all if None)
+
+    Yields:
+        CatalogColumn per column, in catalog order
+    """
+    for node_id, node in (catalog.get("nodes") or {}).items():
+        if selected is not None and node_id not in selected:
+            continue
+        prefix = f"{node_id}."
+        for column_name, column in (node.get("columns") or {}).items():
+            yield CatalogColumn(
+                column.get("type"),
+                column.get("index"),
+                prefix + column_name,
+                column.get("comment"),
+                node_id,
+            )
@@ -4,17 +4,30 @@ Command-line interface for dbt-to-cypher.
 
 import argparse
 import logging
+import os
 import sys
 from pathlib import Path
 
 from dbt_to_cypher import __version__
-from dbt_to_cypher.dbt_to_cypher import extract_dbt_project
+from dbt_to_cypher.artifacts import JSON_BACKEND_ENV, JSON_BACKENDS
+from dbt_to_cypher.loader import DEFAULT_WORKERS
+from dbt_to_cypher.metrics import MetricsRecorder
+from dbt_to_cypher.projection import COLUMN_PROPERTIES, MODEL_PROPERTIES, PropertyProjection
+from dbt_to_cypher.watch import DEFAULT_DEBOUNCE
 
 logger = logging.getLogger(__name__)
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
-)
+
+# Names of dbt_to_cypher.GRAPH_BACKENDS, listed here so that --help and
+# --version answer without importing the graph libraries
+GRAPH_BACKEND_CHOICES = ["networkx", "compact"]
+
+
+def configure_logging(level: int = logging.INFO) -> None:
+    """Send log records to stderr; called by the CLI only, never at import."""
+    logging.basicConfig(
+        level=level,
+        format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+    )
 
 
 def main():
@@ -33,27 +46,401 @@ def main():
     parser.add_argument(
         "project_path",
         type=Path,
-        help="Path to the dbt project directory",
+        nargs="+",
+        help=(
+            "Path to the dbt project directory, whose target/manifest.json and "
+            "target/catalog.json may be gzip (.gz) or Zstandard (.zst) compressed; several "
+            "projects (a dbt mesh) are extracted concurrently with --jobs and combined "
+            "into one graph"
+        ),
     )
 
     parser.add_argument(
         "-o",
         "--output",
         type=Path,
-        help="Output file for Cypher queries (default: stdout)",
+        help=(
+            "Output file for Cypher queries (default: stdout), or output directory "
+            "with --format neo4j-csv"
+        ),
+    )
+
+    parser.add_argument(
+        "--format",
+        choices=["cypher", "neo4j-csv"],
+        default="cypher",
+        help=(
+            "Output format: a Cypher script, or node/relationship CSV files for "
+            "neo4j-admin database import (default: cypher)"
+        ),
+    )
+
+    parser.add_argument(
+        "-s",
+        "--select",
+        nargs="+",
+        metavar="SELECTOR",
+        help=(
+            "Only extract these nodes, using dbt selection syntax (e.g. +orders, "
+            "stg_orders+, tag:finance, path:models/marts); column lineage is only "
+            "computed for the selected models"
+        ),
+    )
+
+    parser.add_argument(
+        "--exclude",
+        nargs="+",
+        metavar="SELECTOR",
+        help="Leave out these nodes, using dbt selection syntax",
+    )
+
+    parser.add_argument(
+        "--properties",
+        nargs="+",
+        metavar="TYPE:PROPS",
+        help=(
+            "Only extract these node properties instead of the defaults, e.g. "
+            "model:name,schema column:type (model: "
+            f"{','.join(MODEL_PROPERTIES)}; column: {','.join(COLUMN_PROPERTIES)})"
+        ),
+    )
+
+    parser.add_argument(
+        "--exclude-properties",
+        nargs="+",
+        metavar="TYPE:PROPS",
+        help="Do not extract these node properties, e.g. column:comment,index",
+    )
+
+    parser.add_argument(
+        "--lightweight",
+        action="store_true",
+        help="Stream manifest.json and skip full Pydantic validation (faster on large projects)",
+    )
+
+    parser.add_argument(
+        "--json-backend",
+        choices=JSON_BACKENDS,
+        help=(
+            "JSON decoder for manifest.json and catalog.json (default: auto, msgspec if "
+            "installed, else json; orjson decodes integers beyond 64 bits as floats; "
+            f"also set with {JSON_BACKEND_ENV})"
+        ),
+    )
+
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help=(
+            "Number of worker processes for column lineage, or for extracting several "
+            "projects (default: 1, 0: all CPUs). Each lineage worker builds its own parse "
+            "state, so peak memory grows with N; where processes are forked (Linux) the "
+            "loaded artifacts are shared, elsewhere each worker also gets its own copy"
+        ),
+    )
+
+    parser.add_argument(
+        "--cache",
+        nargs="?",
+        const=True,
+        default=False,
+        type=Path,
+        metavar="DIR",
+        help="Cache column lineage per model on disk (default DIR: target/.dbt_to_cypher_cache)",
+    )
+
+    parser.add_argument(
+        "--state",
+        type=Path,
+        help=(
+            "Previous run to diff against: a saved graph state file or a directory "
+            "with previous manifest.json/catalog.json; only changes are emitted"
+        ),
+    )
+
+    parser.add_argument(
+        "--save-state",
+        type=Path,
+        help=(
+            "Save the current graph state for use with --state in a later run "
+            "(as a fast-loading binary snapshot if FILE ends in .snapshot)"
+        ),
+    )
+
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        metavar="N",
+        help="Emit batched UNWIND statements with up to N rows each",
+    )
+
+    parser.add_argument(
+        "--graph-backend",
+        choices=GRAPH_BACKEND_CHOICES,
+        default="networkx",
+        help=(
+            "In-memory graph implementation; 'compact' uses much less memory on "
+            "very large projects (default: networkx)"
+        ),
+    )
+
+    parser.add_argument(
+        "--neo4j-uri",
+        metavar="URI",
+        help=(
+            "Load the graph straight into Neo4j (e.g. neo4j://localhost:7687) instead of "
+            "writing a script; the password is read from NEO4J_PASSWORD"
+        ),
+    )
+
+    parser.add_argument(
+        "--neo4j-user",
+        default="neo4j",
+        help="Neo4j user (default: neo4j)",
+    )
+
+    parser.add_argument(
+        "--neo4j-database",
+        help="Neo4j database to load into (default: the server's default database)",
+    )
+
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=f"Number of concurrent Neo4j writers for node batches (default: {DEFAULT_WORKERS})",
+    )
+
+    parser.add_argument(
+        "--impact",
+        nargs="+",
+        metavar="NODE",
+        help=(
+            "Instead of Cypher, write JSON listing every node affected by changes to "
+            "these model or column IDs, with its minimum distance and the changed "
+            "nodes that reach it"
+        ),
+    )
+
+    parser.add_argument(
+        "--impact-relationships",
+        nargs="+",
+        metavar="TYPE",
+        help="Only follow these relationship types for --impact (e.g. depends_on)",
+    )
+
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help=(
+            "Keep running and rebuild the output whenever target/manifest.json or "
+            "target/catalog.json change; the whole graph is rebuilt, but column lineage is "
+            "only recomputed for changed models, and on stdout each rebuild only emits "
+            "the changes"
+        ),
+    )
+
+    parser.add_argument(
+        "--debounce",
+        type=float,
+        default=DEFAULT_DEBOUNCE,
+        metavar="SECONDS",
+        help=(
+            "With --watch, wait until the artifacts have not changed for this long "
+            f"before rebuilding (default: {DEFAULT_DEBOUNCE})"
+        ),
+    )
+
+    parser.add_argument(
+        "--pipelined",
+        action="store_true",
+        help=(
+            "Overlap the stages of a run: load manifest.json and catalog.json concurrently, "
+            "compute column lineage in the background while model-level statements are "
+            "written or loaded, and write output on a separate thread"
+        ),
+    )
+
+    parser.add_argument(
+        "--metrics",
+        type=Path,
+        metavar="FILE",
+        help=(
+            "Write a JSON report with the wall time, CPU time, peak memory and item "
+            "counts of each stage (load, extraction, lineage, graph build, output)"
+        ),
+    )
+
+    parser.add_argument(
+        "--metrics-trace-memory",
+        action="store_true",
+        help="Also measure peak allocations per stage with tracemalloc for --metrics (slower)",
     )
 
     args = parser.parse_args()
 
+    if args.impact and (args.neo4j_uri or args.format != "cypher" or args.state):
+        parser.error("--impact cannot be used with --neo4j-uri, --format or --state")
+
+    if args.watch and (args.impact or args.neo4j_uri or args.format != "cypher"):
+        parser.error("--watch cannot be used with --impact, --neo4j-uri or --format")
+
+    if args.watch and len(args.project_path) > 1:
+        parser.error("--watch accepts a single project")
+
+    if args.pipelined and (args.impact or args.watch or args.state or args.format != "cypher"):
+        parser.error("--pipelined cannot be used with --impact, --watch, --state or --format")
+
+    if args.pipelined and len(args.project_path) > 1:
+        parser.error("--pipelined accepts a single project")
+
+    if args.batch_size is not None and args.batch_size < 1:
+        parser.error("--batch-size must be a positive integer")
+
+    if args.neo4j_uri and (args.output or args.format != "cypher"):
+        parser.error("--neo4j-uri cannot be used with --output or --format")
+
+    if args.format == "neo4j-csv":
+        if not args.output:
+            parser.error("--format neo4j-csv requires --output DIR")
+        if args.state:
+            parser.error("--state cannot be used with --format neo4j-csv")
+
+    try:
+        projection = PropertyProjection.parse(args.properties or (), args.exclude_properties or ())
+    except ValueError as e:
+        parser.error(str(e))
+
+    if args.json_backend:
+        # Through the environment, so that worker processes use it too
+        os.environ[JSON_BACKEND_ENV] = args.json_backend
+
+    configure_logging()
+    # The pipeline, and with it networkx, dbt-artifacts-parser and dbt-colibri,
+    # is only imported once there is work to do
+    from dbt_to_cypher.dbt_to_cypher import (
+        analyze_impact,
+        export_dbt_project_csv,
+        load_dbt_project,
+        watch_dbt_project,
+        write_dbt_project,
+        write_impact_json,
+    )
+
+    # A list of projects is extracted as a mesh into one graph
+    project = args.project_path[0] if len(args.project_path) == 1 else args.project_path
+    metrics = MetricsRecorder(trace_memory=args.metrics_trace_memory) if args.metrics else None
+
     try:
-        cypher_script = extract_dbt_project(args.project_path, args.output)
-        logger.info(cypher_script)
+        if args.impact:
+            impact = analyze_impact(
+                project,
+                args.impact,
+                relationships=args.impact_relationships,
+                lightweight=args.lightweight,
+                jobs=args.jobs,
+                cache=args.cache,
+                graph_backend=args.graph_backend,
+                select=args.select,
+                exclude=args.exclude,
+                metrics=metrics,
+                projection=projection,
+            )
+            write_impact_json(impact, args.output)
+            return 0
+
+        if args.neo4j_uri:
+            password = os.environ.get("NEO4J_PASSWORD")
+            load_dbt_project(
+                project,
+                args.neo4j_uri,
+                auth=(args.neo4j_user, password) if password is not None else None,
+                database=args.neo4j_database,
+                workers=args.workers,
+                lightweight=args.lightweight,
+                jobs=args.jobs,
+                cache=args.cache,
+                state=args.state,
+                save_state=args.save_state,
+                graph_backend=args.graph_backend,
+                select=args.select,
+                exclude=args.exclude,
+                metrics=metrics,
+                projection=projection,
+                batch_size=args.batch_size,
+                pipelined=args.pipelined,
+            )
+            return 0
+
+        if args.format == "neo4j-csv":
+            export_dbt_project_csv(
+                project,
+                args.output,
+                lightweight=args.lightweight,
+                jobs=args.jobs,
+                cache=args.cache,
+                save_state=args.save_state,
+                graph_backend=args.graph_backend,
+                select=args.select,
+                exclude=args.exclude,
+                metrics=metrics,
+                projection=projection,
+            )
+            return 0
+
+        if args.watch:
+            try:
+                watch_dbt_project(
+                    project,
+                    args.output,
+                    lightweight=args.lightweight,
+                    jobs=args.jobs,
+                    cache=args.cache,
+                    state=args.state,
+                    save_state=args.save_state,
+                    graph_backend=args.graph_backend,
+                    batch_size=args.batch_size,
+                    select=args.select,
+                    exclude=args.exclude,
+                    metrics=metrics,
+                    projection=projection,
+                    debounce=args.debounce,
+                )
+            except KeyboardInterrupt:
+                # Ctrl-C is the way to leave watch mode
+                pass
+            return 0
+
+        # The script goes to stdout or --output; logs go to stderr
+        write_dbt_project(
+            project,
+            args.output,
+            lightweight=args.lightweight,
+            jobs=args.jobs,
+            cache=args.cache,
+            state=args.state,
+            save_state=args.save_state,
+            graph_backend=args.graph_backend,
+            batch_size=args.batch_size,
+            select=args.select,
+            exclude=args.exclude,
+            metrics=metrics,
+            projection=projection,
+            pipelined=args.pipelined,
+        )
         return 0
 
     except Exception as e:
         logger.error(f"Error: {e}")
         return 1
 
+    finally:
+        # Stages that ran before a failure are reported too
+        if metrics is not None:
+            metrics.write_json(args.metrics)
+
 
 if __name__ == "__main__":
     sys.exit(main())
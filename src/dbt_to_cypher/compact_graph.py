@@ -0,0 +1,441 @@
+"""
+Module for a memory-compact, integer-indexed dependency graph backend.
+
+``DependencyGraph`` keeps a dict of attributes per node and per edge in a
+``networkx.DiGraph``, which takes gigabytes for graphs with hundreds of
+thousands of column nodes. ``CompactDependencyGraph`` interns node IDs to
+integer indices and stores:
+
+- node types and relationship types as small integer codes,
+- node attributes in one column list per attribute name,
+- edges in CSR (compressed sparse row) arrays, both outgoing and incoming.
+
+Edges are appended to pending arrays. Reads fold them into the CSR arrays
+once they outnumber a fraction of the folded edges, and otherwise look them
+up in a per-node overlay index, so interleaved additions and reads (e.g.
+adding column lineage to a built graph) cost amortized O(1) per edge rather
+than a rebuild per read.
+"""
+
+import copy
+import sys
+from array import array
+from collections.abc import Iterator
+from typing import Any, Optional
+
+import networkx as nx
+
+from dbt_to_cypher.graph import DependencyGraph
+
+# Placeholder for attributes a node does not have
+_MISSING = object()
+
+# Pending edges are folded into the CSR arrays on read once there are more
+# than max(_MIN_FOLD_EDGES, folded edges // _FOLD_RATIO) of them
+_MIN_FOLD_EDGES = 1024
+_FOLD_RATIO = 4
+
+
+class CompactDependencyGraph(DependencyGraph):
+    """
+    Dependency graph with interned node IDs and array-backed adjacency.
+
+    Offers the same API as ``DependencyGraph`` and iterates nodes and edges in
+    the same order. The ``graph`` attribute is materialized as a
+    ``networkx.DiGraph`` on first access, for analyses that need networkx,
+    and cached until the graph is next modified.
+    """
+
+    def __init__(self):
+        """Initialize an empty compact dependency graph."""
+        self._clear()
+
+    def _clear(self) -> None:
+        self._reachability = {}
+        self._ids: list[str] = []
+        self._index: dict[str, int] = {}
+        # Node type code per node; code 0 means no node type
+        self._node_type_codes = array("H")
+        self._node_types: list[Optional[str]] = [None]
+        # Attribute name -> values by node index, padded with _MISSING
+        self._attributes: dict[str, list[Any]] = {}
+        self._relationships: list[str] = []
+        # Edges in CSR form: targets of node i are out_targets[out_offsets[i]:out_offsets[i + 1]]
+        self._out_offsets = array("q", [0])
+        self._out_targets = array("q")
+        self._out_relationships = array("H")
+        self._in_offsets = array("q", [0])
+        self._in_sources = array("q")
+        self._in_relationships = array("H")
+        # Edges added since the CSR arrays were built
+        self._pending_sources = array("q")
+        self._pending_targets = array("q")
+        self._pending_relationships = array("H")
+        self._clear_overlay()
+        self._networkx: Optional[nx.DiGraph] = None
+
+    def _clear_overlay(self) -> None:
+        # Index of the first _indexed pending edges, read together with the CSR arrays:
+        # source -> {target: relationship code} and target -> {source: relationship code}
+        self._overlay_out: dict[int, dict[int, int]] = {}
+        self._overlay_in: dict[int, dict[int, int]] = {}
+        self._indexed = 0
+        # Number of overlay edges that are not in the CSR arrays
+        self._overlay_new = 0
+
+    def _modified(self) -> None:
+        """Invalidate what is derived from the graph's contents."""
+        self._reachability.clear()
+        self._networkx = None
+
+    @staticmethod
+    def _code(table: list, value: Any) -> int:
+        """Return the code of a value in a small lookup table, adding it if needed."""
+        try:
+            return table.index(value)
+        except ValueError:
+            table.append(value)
+            return len(table) - 1
+
+    def _intern(self, node: str) -> int:
+        """Return the index of a node, adding the node if needed."""
+        index = self._index.get(node)
+        if index is None:
+            index = len(self._ids)
+            node = sys.intern(node)
+            self._ids.append(node)
+            self._index[node] = index
+            self._node_type_codes.append(0)
+        return index
+
+    def _set_node(self, node: str, node_type: Optional[str], metadata: Optional[dict]) -> None:
+        self._modified()
+        index = self._intern(node)
+        if node_type is not None:
+            self._node_type_codes[index] = self._code(self._node_types, node_type)
+        for name, value in (metadata or {}).items():
+            column = self._attributes.setdefault(name, [])
+            if len(column) <= index:
+                column.extend([_MISSING] * (index + 1 - len(column)))
+            column[index] = sys.intern(value) if type(value) is str else value
+
+    def add_model(self, model_name: str, metadata: Optional[dict] = None):
+        """
+        Add a model node to the graph.
+
+        Args:
+            model_name: Unique identifier for the model
+            metadata: Additional model metadata
+        """
+        self._set_node(model_name, "model", metadata)
+
+    def add_column(self, model_name: str, column_name: str, metadata: Optional[dict] = None):
+        """
+        Add a column node to the graph and connect it to its parent model.
+
+        Args:
+            model_name: Name of the model the column belongs to
+            column_name: Column name (without model prefix)
+            metadata: Additional column metadata
+        """
+        column_id = f"{model_name}.{column_name}"
+        self._set_node(column_id, "column", metadata)
+        if model_name not in self._index:
+            self.add_model(model_name)
+        self.add_dependency(model_name, column_id, relationship="has_column")
+
+    def add_dependency(self, source: str, target: str, relationship: str = "depends_on"):
+        """
+        Add a dependency edge between nodes.
+
+        Args:
+            source: Source node identifier
+            target: Target node identifier
+            relationship: Type of relationship
+        """
+        self._modified()
+        self._pending_sources.append(self._intern(source))
+        self._pending_targets.append(self._intern(target))
+        self._pending_relationships.append(self._code(self._relationships, relationship))
+
+    def _adjacency(self) -> None:
+        """Make pending edges visible to reads, folding them or indexing them in the overlay."""
+        pending = len(self._pending_sources)
+        if pending == self._indexed:
+            return
+        if pending > max(_MIN_FOLD_EDGES, len(self._out_targets) // _FOLD_RATIO):
+            self._fold()
+            return
+
+        for edge in range(self._indexed, pending):
+            source = self._pending_sources[edge]
+            target = self._pending_targets[edge]
+            relationship = self._pending_relationships[edge]
+            targets = self._overlay_out.setdefault(source, {})
+            if target not in targets:
+                start, end = self._row(self._out_offsets, source)
+                if target not in self._out_targets[start:end]:
+                    self._overlay_new += 1
+            # Re-adding an edge updates its relationship, as in networkx
+            targets[target] = relationship
+            self._overlay_in.setdefault(target, {})[source] = relationship
+        self._indexed = pending
+
+    @staticmethod
+    def _row(offsets: Any, index: int) -> tuple[int, int]:
+        """Return the CSR range of a node; nodes added since the last fold have none."""
+        if index + 1 < len(offsets):
+            return offsets[index], offsets[index + 1]
+        return 0, 0
+
+    def _fold(self) -> None:
+        """Fold pending edges into the CSR arrays, which then cover every node."""
+        if not self._pending_sources and len(self._out_offsets) == len(self._ids) + 1:
+            return
+
+        pending_sources = self._pending_sources
+        pending_targets = self._pending_targets
+        pending_relationships = self._pending_relationships
+        # Stable sort keeps the insertion order of the edges of each source
+        order = sorted(range(len(pending_sources)), key=pending_sources.__getitem__)
+
+        old_offsets, old_targets = self._out_offsets, self._out_targets
+        old_relationships = self._out_relationships
+        offsets, targets, relationships = array("q", [0]), array("q"), array("H")
+        j = 0
+        for source in range(len(self._ids)):
+            row_start = len(targets)
+            if source + 1 < len(old_offsets):
+                start, end = old_offsets[source], old_offsets[source + 1]
+                targets.extend(old_targets[start:end])
+                relationships.extend(old_relationships[start:end])
+
+            positions: Optional[dict[int, int]] = None
+            while j < len(order) and pending_sources[order[j]] == source:
+                if positions is None:
+                    positions = {targets[k]: k for k in range(row_start, len(targets))}
+                edge = order[j]
+                position = positions.get(pending_targets[edge])
+                if position is None:
+                    positions[pending_targets[edge]] = len(targets)
+                    targets.append(pending_targets[edge])
+                    relationships.append(pending_relationships[edge])
+                else:
+                    # Re-adding an edge updates its relationship, as in networkx
+                    relationships[position] = pending_relationships[edge]
+                j += 1
+            offsets.append(len(targets))
+
+        self._out_offsets, self._out_targets = offsets, targets
+        self._out_relationships = relationships
+        self._pending_sources = array("q")
+        self._pending_targets = array("q")
+        self._pending_relationships = array("H")
+        self._clear_overlay()
+        self._build_incoming()
+
+    def _folded(self) -> "CompactDependencyGraph":
+        """Return a graph with every edge in the CSR arrays, without modifying this one."""
+        if not self._pending_sources and len(self._out_offsets) == len(self._ids) + 1:
+            return self
+        folded = copy.copy(self)
+        # _fold rebinds the arrays and overlay it replaces, leaving this graph's intact
+        folded._fold()
+        return folded
+
+    def _build_incoming(self) -> None:
+        """Build the incoming CSR arrays from the outgoing ones with a counting sort."""
+        node_count = len(self._ids)
+        in_offsets = array("q", [0]) * (node_count + 1)
+        for target in self._out_targets:
+            in_offsets[target + 1] += 1
+        for i in range(node_count):
+            in_offsets[i + 1] += in_offsets[i]
+
+        next_position = in_offsets[:-1]
+        in_sources = array("q", [0]) * len(self._out_targets)
+        in_relationships = array("H", [0]) * len(self._out_targets)
+        for source in range(node_count):
+            for k in range(self._out_offsets[source], self._out_offsets[source + 1]):
+                target = self._out_targets[k]
+                position = next_position[target]
+                in_sources[position] = source
+                in_relationships[position] = self._out_relationships[k]
+                next_position[target] = position + 1
+
+        self._in_offsets, self._in_sources = in_offsets, in_sources
+        self._in_relationships = in_relationships
+
+    def _node_index(self, node: str) -> int:
+        index = self._index.get(node)
+        if index is None:
+            raise nx.NetworkXError(f"The node {node} is not in the digraph.")
+        return index
+
+    def get_upstream_dependencies(self, node: str) -> set[str]:
+        """
+        Get all upstream dependencies for a node.
+
+        Args:
+            node: Node identifier
+
+        Returns:
+            Set of upstream node identifiers
+        """
+        index = self._node_index(node)
+        self._adjacency()
+        start, end = self._row(self._in_offsets, index)
+        upstream = {self._ids[source] for source in self._in_sources[start:end]}
+        upstream.update(self._ids[source] for source in self._overlay_in.get(index, ()))
+        return upstream
+
+    def get_downstream_dependencies(self, node: str) -> set[str]:
+        """
+        Get all downstream dependencies for a node.
+
+        Args:
+            node: Node identifier
+
+        Returns:
+            Set of downstream node identifiers
+        """
+        index = self._node_index(node)
+        self._adjacency()
+        start, end = self._row(self._out_offsets, index)
+        downstream = {self._ids[target] for target in self._out_targets[start:end]}
+        downstream.update(self._ids[target] for target in self._overlay_out.get(index, ()))
+        return downstream
+
+    def __contains__(self, node: object) -> bool:
+        """Return True if the node is in the graph."""
+        return node in self._index
+
+    def number_of_nodes(self) -> int:
+        """Return the number of nodes."""
+        return len(self._ids)
+
+    def number_of_edges(self) -> int:
+        """Return the number of edges."""
+        self._adjacency()
+        return len(self._out_targets) + self._overlay_new
+
+    def nodes(self) -> Iterator[tuple[str, dict[str, Any]]]:
+        """
+        Iterate over nodes in insertion order.
+
+        Yields:
+            (node, attributes) pairs; attributes are built on the fly
+        """
+        for index, node in enumerate(self._ids):
+            yield node, self._attributes_of(index)
+
+    def node_attributes(self, node: str) -> dict[str, Any]:
+        """
+        Get the attributes of a node.
+
+        Args:
+            node: Node identifier
+
+        Returns:
+            A new dict of node attributes, including ``node_type`` when set
+        """
+        return self._attributes_of(self._node_index(node))
+
+    def _attributes_of(self, index: int) -> dict[str, Any]:
+        attrs: dict[str, Any] = {}
+        node_type = self._node_types[self._node_type_codes[index]]
+        if node_type is not None:
+            attrs["node_type"] = node_type
+        for name, column in self._attributes.items():
+            if index < len(column) and column[index] is not _MISSING:
+                attrs[name] = column[index]
+        return attrs
+
+    def node_type(self, node: str) -> Optional[str]:
+        """
+        Get the type of a node.
+
+        Args:
+            node: Node identifier
+
+        Returns:
+            ``"model"``, ``"column"``, or None for unknown or untyped nodes
+        """
+        index = self._index.get(node)
+        if index is None:
+            return None
+        return self._node_types[self._node_type_codes[index]]
+
+    def edges(self) -> Iterator[tuple[str, str, str]]:
+        """
+        Iterate over edges, grouped by source node in insertion order.
+
+        Yields:
+            (source, target, relationship) tuples
+        """
+        self._adjacency()
+        ids, targets = self._ids, self._out_targets
+        offsets, relationships = self._out_offsets, self._out_relationships
+        names = self._relationships
+        for source in range(len(ids)):
+            start, end = self._row(offsets, source)
+            overlay = self._overlay_out.get(source)
+            if overlay is None:
+                for k in range(start, end):
+                    yield ids[source], ids[targets[k]], names[relationships[k]]
+                continue
+            # Edges re-added since the fold keep their position with the new relationship
+            for k in range(start, end):
+                relationship = overlay.get(targets[k], relationships[k])
+                yield ids[source], ids[targets[k]], names[relationship]
+            folded = set(targets[start:end])
+            for target, relationship in overlay.items():
+                if target not in folded:
+                    yield ids[source], ids[target], names[relationship]
+
+    @classmethod
+    def from_graph(cls, graph: DependencyGraph) -> "CompactDependencyGraph":
+        """
+        Copy a dependency graph of any backend.
+
+        Args:
+            graph: Graph to copy
+
+        Returns:
+            CompactDependencyGraph with the same nodes, attributes and edges
+        """
+        compact = cls()
+        for node, attrs in graph.nodes():
+            metadata = {name: value for name, value in attrs.items() if name != "node_type"}
+            compact._set_node(node, attrs.get("node_type"), metadata)
+        for source, target, relationship in graph.edges():
+            compact.add_dependency(source, target, relationship)
+        return compact
+
+    @property
+    def graph(self) -> nx.DiGraph:
+        """
+        Materialize the graph as a ``networkx.DiGraph``.
+
+        The DiGraph is cached until the graph is modified and must be treated
+        as read-only; assign to ``graph`` to replace the contents instead.
+        """
+        if self._networkx is None:
+            graph = nx.DiGraph()
+            graph.add_nodes_from(self.nodes())
+            graph.add_edges_from(
+                (source, target, {"relationship": relationship})
+                for source, target, relationship in self.edges()
+            )
+            self._networkx = graph
+        return self._networkx
+
+    @graph.setter
+    def graph(self, graph: nx.DiGraph) -> None:
+        """Replace the contents with those of a ``networkx.DiGraph``."""
+        self._clear()
+        for node, attrs in graph.nodes(data=True):
+            metadata = {name: value for name, value in attrs.items() if name != "node_type"}
+            self._set_node(node, attrs.get("node_type"), metadata)
+        for source, target, relationship in graph.edges(data="relationship"):
+            self.add_dependency(source, target, relationship or "depends_on")
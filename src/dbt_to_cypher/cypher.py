@@ -2,7 +2,148 @@
 Module for generating Cypher queries from dependency graphs.
 """
 
-from dbt_to_cypher.graph import DependencyGraph
+import json
+import math
+import re
+from collections.abc import Callable, Hashable, Iterable, Iterator
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Optional, TextIO, TypeVar
+
+if TYPE_CHECKING:
+    from dbt_to_cypher.diff import GraphDiff
+    from dbt_to_cypher.graph import DependencyGraph
+
+DEFAULT_BATCH_SIZE = 1000
+
+# Node type -> (label, key property) used by batched statements
+NODE_LABELS = {
+    "model": ("Model", "name"),
+    "column": ("Column", "id"),
+}
+
+# Uniqueness constraints backing the key lookups of node and relationship statements
+CONSTRAINT_QUERIES = [
+    "CREATE CONSTRAINT model_name IF NOT EXISTS FOR (m:Model) REQUIRE m.name IS UNIQUE",
+    "CREATE CONSTRAINT column_id IF NOT EXISTS FOR (c:Column) REQUIRE c.id IS UNIQUE",
+]
+
+_T = TypeVar("_T")
+
+_IDENTIFIER = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+
+def cypher_literal(value: Any) -> str:
+    """
+    Format a Python value as a Cypher literal.
+
+    Strings are written as double-quoted JSON strings, which Cypher accepts;
+    map keys that are not plain identifiers are backtick-quoted. NaN and
+    infinite floats have no Cypher literal and are written as ``null``.
+
+    Args:
+        value: str, number, bool, None, list or dict
+
+    Returns:
+        Cypher literal
+    """
+    if isinstance(value, dict):
+        entries = []
+        for key, item in value.items():
+            key = str(key)
+            if not _IDENTIFIER.match(key):
+                key = "`" + key.replace("`", "``") + "`"
+            entries.append(f"{key}: {cypher_literal(item)}")
+        return "{" + ", ".join(entries) + "}"
+    if isinstance(value, (list, tuple)):
+        return "[" + ", ".join(cypher_literal(item) for item in value) + "]"
+    if isinstance(value, float) and not math.isfinite(value):
+        return "null"
+    return json.dumps(value)
+
+
+def _check_batch_size(batch_size: int) -> None:
+    if batch_size < 1:
+        raise ValueError("batch_size must be a positive integer")
+
+
+def _grouped_batches(
+    items: Callable[[], Iterable[_T]],
+    group_of: Callable[[_T], Optional[Hashable]],
+    row_of: Callable[[_T], dict[str, Any]],
+    statement_of: Callable[[Any], str],
+    batch_size: int,
+) -> Iterator[tuple[str, dict[str, Any]]]:
+    """
+    Emit the rows of each group in batches, groups in the order they first appear.
+
+    Items are read once per group, so only the batch being built is held in
+    memory; items whose group is None are skipped.
+    """
+    groups: list[Hashable] = []
+    seen: set[Hashable] = set()
+    index = 0
+    while index == 0 or index < len(groups):
+        # The first pass discovers every group and handles the first one
+        current = groups[index] if index < len(groups) else None
+
+        def rows() -> Iterator[dict[str, Any]]:
+            nonlocal current
+            for item in items():
+                group = group_of(item)
+                if group is None:
+                    continue
+                if group not in seen:
+                    seen.add(group)
+                    groups.append(group)
+                if current is None:
+                    current = group
+                if group == current:
+                    yield row_of(item)
+
+        batches = rows()
+        while batch := list(islice(batches, batch_size)):
+            yield statement_of(current), {"rows": batch}
+        if not groups:
+            return
+        index += 1
+
+
+def exportable_properties(attrs: dict) -> dict[str, Any]:
+    """
+    Select the node properties that are written to Cypher.
+
+    Args:
+        attrs: Node attributes from the dependency graph
+
+    Returns:
+        Scalar properties, excluding internal keys
+    """
+    # Filter out non-serializable or internal properties
+    exclude_keys = {"node_type"}
+    return {
+        k: v
+        for k, v in attrs.items()
+        if k not in exclude_keys and isinstance(v, (str, int, float, bool))
+    }
+
+
+def write_queries(queries: Iterable[str], fp: TextIO) -> int:
+    """
+    Stream Cypher statements to a file handle, one ``;``-terminated statement per line.
+
+    Args:
+        queries: Cypher statements, typically from one of the ``iter_*`` methods
+        fp: Writable text file handle (e.g. an open file or ``sys.stdout``)
+
+    Returns:
+        Number of statements written
+    """
+    count = 0
+    for query in queries:
+        fp.write(query)
+        fp.write(";\n")
+        count += 1
+    return count
 
 
 class CypherGenerator:
@@ -13,7 +154,7 @@ class CypherGenerator:
     and MERGE statements for loading into Neo4j or other graph databases.
     """
 
-    def __init__(self, graph: DependencyGraph):
+    def __init__(self, graph: "DependencyGraph"):
         """
         Initialize the generator with a dependency graph.
 
@@ -22,6 +163,37 @@ class CypherGenerator:
         """
         self.graph = graph
 
+    def generate_constraint_queries(self) -> list[str]:
+        """
+        Generate Cypher schema statements for the node keys.
+
+        The constraints make ``MERGE``/``MATCH`` on ``Model(name)`` and
+        ``Column(id)`` index seeks instead of label scans.
+
+        Returns:
+            List of ``CREATE CONSTRAINT ... IF NOT EXISTS`` statements
+        """
+        return list(CONSTRAINT_QUERIES)
+
+    def iter_node_queries(self) -> Iterator[str]:
+        """
+        Lazily generate Cypher queries to create nodes.
+
+        Yields:
+            Cypher MERGE statements for nodes
+        """
+        for node, attrs in self.graph.nodes():
+            yield from self._node_queries(node, attrs)
+
+    def _node_queries(self, node: str, attrs: dict) -> Iterator[str]:
+        """Generate the MERGE statement of a node, if it has a known type."""
+        node_type = attrs.get("node_type", "unknown")
+
+        if node_type == "model":
+            yield self._generate_model_node_query(node, attrs)
+        elif node_type == "column":
+            yield self._generate_column_node_query(node, attrs)
+
     def generate_node_queries(self) -> list[str]:
         """
         Generate Cypher queries to create nodes.
@@ -29,21 +201,17 @@ class CypherGenerator:
         Returns:
             List of Cypher CREATE/MERGE statements for nodes
         """
-        queries = []
+        return list(self.iter_node_queries())
 
-        for node, attrs in self.graph.graph.nodes(data=True):
-            node_type = attrs.get("node_type", "unknown")
-
-            if node_type == "model":
-                query = self._generate_model_node_query(node, attrs)
-            elif node_type == "column":
-                query = self._generate_column_node_query(node, attrs)
-            else:
-                continue
-
-            queries.append(query)
+    def iter_relationship_queries(self) -> Iterator[str]:
+        """
+        Lazily generate Cypher queries to create relationships.
 
-        return queries
+        Yields:
+            Cypher MERGE statements for relationships
+        """
+        for source, target, relationship in self.graph.edges():
+            yield self._generate_relationship_query(source, target, relationship)
 
     def generate_relationship_queries(self) -> list[str]:
         """
@@ -52,14 +220,18 @@ class CypherGenerator:
         Returns:
             List of Cypher MERGE statements for relationships
         """
-        queries = []
+        return list(self.iter_relationship_queries())
 
-        for source, target, attrs in self.graph.graph.edges(data=True):
-            relationship = attrs.get("relationship", "DEPENDS_ON")
-            query = self._generate_relationship_query(source, target, relationship)
-            queries.append(query)
+    def iter_all_queries(self) -> Iterator[str]:
+        """
+        Lazily generate all statements for the graph: constraints, nodes, relationships.
 
-        return queries
+        Yields:
+            Cypher statements
+        """
+        yield from self.generate_constraint_queries()
+        yield from self.iter_node_queries()
+        yield from self.iter_relationship_queries()
 
     def generate_all_queries(self) -> str:
         """
@@ -68,39 +240,317 @@ class CypherGenerator:
         Returns:
             Complete Cypher script as a string
         """
-        node_queries = self.generate_node_queries()
-        relationship_queries = self.generate_relationship_queries()
+        return ";\n".join(self.iter_all_queries()) + ";"
+
+    def write_all_queries(self, fp: TextIO) -> int:
+        """
+        Stream the complete Cypher script for the graph to a file handle.
+
+        Args:
+            fp: Writable text file handle
+
+        Returns:
+            Number of statements written
+        """
+        return write_queries(self.iter_all_queries(), fp)
+
+    def iter_subgraph_queries(
+        self,
+        nodes: Iterable[str],
+        edges: Iterable[tuple[str, str, str]],
+        batch_size: Optional[int] = None,
+    ) -> Iterator[str]:
+        """
+        Lazily generate statements for some nodes and edges of the graph.
+
+        Used to emit a graph in parts, e.g. column lineage once it has been
+        added to an already emitted model-level graph. Nodes come before
+        relationships; constraint statements are not generated.
+
+        Args:
+            nodes: Node identifiers
+            edges: (source, target, relationship) triples
+            batch_size: If set, emit batched ``UNWIND`` statements with row
+                data inlined, as ``iter_batched_script_queries`` does
+
+        Yields:
+            Cypher statements
+        """
+        if batch_size is None:
+            for node in nodes:
+                yield from self._node_queries(node, self.graph.node_attributes(node))
+            for source, target, relationship in edges:
+                yield self._generate_relationship_query(source, target, relationship)
+            return
+
+        yield from self._inline_rows(self.iter_node_batches(batch_size, nodes=nodes))
+        yield from self._inline_rows(self.iter_relationship_batches(batch_size, edges=edges))
+
+    def iter_batched_queries(
+        self, batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> Iterator[tuple[str, dict[str, Any]]]:
+        """
+        Lazily generate parameterized ``UNWIND $rows`` statements for drivers.
+
+        Nodes are grouped by label and relationships by type and endpoint
+        labels, so there is one statement shape per group and Neo4j plans each
+        shape once. Constraint statements (without rows) come first, then
+        nodes, then relationships. Groups come in the order they first appear
+        and each group's batches are contiguous. The graph is re-read for each
+        group, so only the batch being built is kept in memory.
+
+        Args:
+            batch_size: Maximum number of rows per statement
+
+        Yields:
+            (statement, parameters) pairs, parameters being ``{"rows": [...]}``
+            for node and relationship statements
+        """
+        _check_batch_size(batch_size)
 
-        all_queries = node_queries + relationship_queries
-        return ";\n".join(all_queries) + ";"
+        for query in self.generate_constraint_queries():
+            yield query, {}
+        yield from self.iter_node_batches(batch_size)
+        yield from self.iter_relationship_batches(batch_size)
+
+    def iter_node_batches(
+        self, batch_size: int = DEFAULT_BATCH_SIZE, nodes: Optional[Iterable[str]] = None
+    ) -> Iterator[tuple[str, dict[str, Any]]]:
+        """
+        Lazily generate the parameterized node statements of ``iter_batched_queries``.
+
+        Args:
+            batch_size: Maximum number of rows per statement
+            nodes: Only generate rows for these node identifiers (all if None)
+
+        Yields:
+            (statement, ``{"rows": [...]}``) pairs
+        """
+        _check_batch_size(batch_size)
+        return self._node_batches(batch_size, nodes)
+
+    def iter_relationship_batches(
+        self,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        edges: Optional[Iterable[tuple[str, str, str]]] = None,
+    ) -> Iterator[tuple[str, dict[str, Any]]]:
+        """
+        Lazily generate the parameterized relationship statements of ``iter_batched_queries``.
+
+        Args:
+            batch_size: Maximum number of rows per statement
+            edges: Only generate rows for these (source, target, relationship)
+                triples (all edges if None)
+
+        Yields:
+            (statement, ``{"rows": [...]}``) pairs
+        """
+        _check_batch_size(batch_size)
+        return self._relationship_batches(batch_size, edges)
+
+    def generate_batched_queries(
+        self, batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> list[tuple[str, dict[str, Any]]]:
+        """
+        Generate parameterized ``UNWIND $rows`` statements for drivers.
+
+        See ``iter_batched_queries``.
+
+        Args:
+            batch_size: Maximum number of rows per statement
+
+        Returns:
+            List of (statement, parameters) pairs
+        """
+        return list(self.iter_batched_queries(batch_size))
+
+    def iter_batched_script_queries(self, batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[str]:
+        """
+        Lazily generate batched statements with row data inlined as literals.
+
+        Args:
+            batch_size: Maximum number of rows per statement
+
+        Yields:
+            Cypher statements
+        """
+        return self._inline_rows(self.iter_batched_queries(batch_size))
+
+    @staticmethod
+    def _inline_rows(statements: Iterable[tuple[str, dict[str, Any]]]) -> Iterator[str]:
+        """Inline the ``$rows`` parameter of statements as a Cypher literal."""
+        for statement, parameters in statements:
+            if "rows" in parameters:
+                statement = statement.replace("$rows", cypher_literal(parameters["rows"]), 1)
+            yield statement
+
+    def generate_batched_script(self, batch_size: int = DEFAULT_BATCH_SIZE) -> str:
+        """
+        Generate a batched Cypher script with row data inlined as literals.
+
+        Args:
+            batch_size: Maximum number of rows per statement
+
+        Returns:
+            Complete Cypher script as a string
+        """
+        return ";\n".join(self.iter_batched_script_queries(batch_size)) + ";"
+
+    def _node_batches(
+        self, batch_size: int, nodes: Optional[Iterable[str]] = None
+    ) -> Iterator[tuple[str, dict[str, Any]]]:
+        """Group node rows by label."""
+        # Read once per label, so given nodes are kept (only their identifiers)
+        node_ids = None if nodes is None else list(nodes)
+
+        def items() -> Iterable[tuple[str, dict[str, Any]]]:
+            if node_ids is None:
+                return self.graph.nodes()
+            return ((node, self.graph.node_attributes(node)) for node in node_ids)
+
+        def group_of(item: tuple[str, dict[str, Any]]) -> Optional[str]:
+            node_type = item[1].get("node_type", "unknown")
+            return node_type if node_type in NODE_LABELS else None
+
+        def row_of(item: tuple[str, dict[str, Any]]) -> dict[str, Any]:
+            node, attrs = item
+            key = NODE_LABELS[attrs["node_type"]][1]
+            return {**exportable_properties(attrs), key: node}
+
+        def statement_of(node_type: str) -> str:
+            label, key = NODE_LABELS[node_type]
+            return f"UNWIND $rows AS row MERGE (n:{label} {{{key}: row.{key}}}) SET n += row"
+
+        return _grouped_batches(items, group_of, row_of, statement_of, batch_size)
+
+    def _relationship_batches(
+        self, batch_size: int, edges: Optional[Iterable[tuple[str, str, str]]] = None
+    ) -> Iterator[tuple[str, dict[str, Any]]]:
+        """Group relationship rows by type and endpoint labels."""
+        # Read once per group, so given edges are kept
+        edge_list = None if edges is None else list(edges)
+
+        def items() -> Iterable[tuple[str, str, str]]:
+            return self.graph.edges() if edge_list is None else edge_list
+
+        def group_of(edge: tuple[str, str, str]) -> tuple[str, str, str]:
+            source, target, relationship = edge
+            return (
+                relationship.upper().replace(" ", "_"),
+                self.graph.node_type(source) or "unknown",
+                self.graph.node_type(target) or "unknown",
+            )
+
+        def statement_of(group: tuple[str, str, str]) -> str:
+            rel_type, source_type, target_type = group
+            source_pattern = self._node_pattern("s", source_type, "row.source")
+            target_pattern = self._node_pattern("t", target_type, "row.target")
+            return (
+                f"UNWIND $rows AS row MATCH {source_pattern}, {target_pattern} "
+                f"MERGE (s)-[:{rel_type}]->(t)"
+            )
+
+        return _grouped_batches(
+            items,
+            group_of,
+            lambda edge: {"source": edge[0], "target": edge[1]},
+            statement_of,
+            batch_size,
+        )
+
+    def generate_diff_queries(self, diff: "GraphDiff") -> list[str]:
+        """
+        Generate Cypher queries that bring a previously loaded graph up to date.
+
+        See ``iter_diff_queries``.
+
+        Args:
+            diff: Differences between the previous graph and ``self.graph``
+
+        Returns:
+            List of Cypher statements
+        """
+        return list(self.iter_diff_queries(diff))
+
+    def iter_diff_queries(self, diff: "GraphDiff") -> Iterator[str]:
+        """
+        Lazily generate Cypher queries that bring a previously loaded graph up to date.
+
+        Removed relationships and nodes are deleted first, then added or
+        changed nodes are merged (replacing their properties), and finally
+        added relationships are merged.
+
+        Args:
+            diff: Differences between the previous graph and ``self.graph``
+
+        Yields:
+            Cypher statements
+        """
+        for source, target, relationship in diff.removed_edges:
+            yield self._generate_relationship_delete_query(source, target, relationship)
+
+        for node, node_type in diff.removed_nodes.items():
+            if node_type == "model":
+                yield f"MATCH (m:Model {{name: '{node}'}}) DETACH DELETE m"
+            elif node_type == "column":
+                yield f"MATCH (c:Column {{id: '{node}'}}) DETACH DELETE c"
+
+        for node in diff.added_nodes + diff.changed_nodes:
+            attrs = self.graph.node_attributes(node)
+            node_type = attrs.get("node_type", "unknown")
+            props = self._format_properties(attrs)
+            if node_type == "model":
+                yield f"MERGE (m:Model {{name: '{node}'}}) SET m = {{name: '{node}'{props}}}"
+            elif node_type == "column":
+                yield f"MERGE (c:Column {{id: '{node}'}}) SET c = {{id: '{node}'{props}}}"
+
+        for source, target, relationship in diff.added_edges:
+            yield self._generate_relationship_query(source, target, relationship)
 
     def _generate_model_node_query(self, node_id: str, attrs: dict) -> str:
         """Generate Cypher for a model node."""
+        # Merge on the constrained key only, so changed properties update the node
         props = self._format_properties(attrs)
-        return f"MERGE (m:Model {{name: '{node_id}'{props}}})"
+        query = f"MERGE (m:Model {{name: '{node_id}'}})"
+        return f"{query} SET m += {{{props[2:]}}}" if props else query
 
     def _generate_column_node_query(self, node_id: str, attrs: dict) -> str:
         """Generate Cypher for a column node."""
         props = self._format_properties(attrs)
-        return f"MERGE (c:Column {{id: '{node_id}'{props}}})"
+        query = f"MERGE (c:Column {{id: '{node_id}'}})"
+        return f"{query} SET c += {{{props[2:]}}}" if props else query
+
+    def _node_pattern(self, variable: str, node_type: str, value: str) -> str:
+        """Build a label-qualified node pattern matching on the node key."""
+        if node_type in NODE_LABELS:
+            label, key = NODE_LABELS[node_type]
+            return f"({variable}:{label} {{{key}: {value}}})"
+        return f"({variable} {{name: {value}}})"
+
+    def _match_pattern(self, variable: str, node: str) -> str:
+        """Build the node pattern for a graph node identifier."""
+        node_type = self.graph.node_type(node) or "unknown"
+        return self._node_pattern(variable, node_type, f"'{node}'")
 
     def _generate_relationship_query(self, source: str, target: str, rel_type: str) -> str:
         """Generate Cypher for a relationship."""
         rel_type_upper = rel_type.upper().replace(" ", "_")
         return (
-            f"MATCH (s {{name: '{source}'}}), (t {{name: '{target}'}}) "
+            f"MATCH {self._match_pattern('s', source)}, {self._match_pattern('t', target)} "
             f"MERGE (s)-[:{rel_type_upper}]->(t)"
         )
 
+    def _generate_relationship_delete_query(self, source: str, target: str, rel_type: str) -> str:
+        """Generate Cypher to delete a relationship."""
+        rel_type_upper = rel_type.upper().replace(" ", "_")
+        return (
+            f"MATCH {self._match_pattern('s', source)}-[r:{rel_type_upper}]->"
+            f"{self._match_pattern('t', target)} DELETE r"
+        )
+
     def _format_properties(self, attrs: dict) -> str:
         """Format node properties for Cypher."""
-        # Filter out non-serializable or internal properties
-        exclude_keys = {"node_type"}
-        props = {
-            k: v
-            for k, v in attrs.items()
-            if k not in exclude_keys and isinstance(v, (str, int, float, bool))
-        }
+        props = exportable_properties(attrs)
 
         if not props:
             return ""
@@ -4,46 +4,117 @@ Core module for dbt-to-cypher conversion.
 This module provides the main API for extracting dbt dependencies and generating Cypher queries.
 """
 
+import io
+import json
 import logging
+import sys
+from collections.abc import Collection, Iterator, Sequence
 from pathlib import Path
-from typing import Any, Optional, Union
+from typing import Any, Optional, TextIO, Union
 
-from dbt_to_cypher.cypher import CypherGenerator
+from dbt_to_cypher.artifacts import find_artifact
+from dbt_to_cypher.cache import BaseLineageCache, MemoryLineageCache
+from dbt_to_cypher.compact_graph import CompactDependencyGraph
+from dbt_to_cypher.cypher import DEFAULT_BATCH_SIZE, CypherGenerator, write_queries
+from dbt_to_cypher.diff import diff_graphs, load_graph_state, save_graph_state
 from dbt_to_cypher.extractor import DbtDependencyExtractor
 from dbt_to_cypher.graph import DependencyGraph
+from dbt_to_cypher.loader import DEFAULT_WORKERS, LoadSummary, Neo4jLoader
+from dbt_to_cypher.mesh import extract_projects
+from dbt_to_cypher.metrics import MetricsRecorder, measure_stage
+from dbt_to_cypher.neo4j_csv import Neo4jCsvExporter
+from dbt_to_cypher.pipeline import (
+    PipelinedExtraction,
+    PipelinedQueries,
+    write_queries_in_background,
+)
+from dbt_to_cypher.projection import PropertyProjection
+from dbt_to_cypher.reachability import Impact
+from dbt_to_cypher.watch import DEFAULT_DEBOUNCE, DEFAULT_POLL_INTERVAL, ArtifactWatcher
 
 logger = logging.getLogger(__name__)
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
-)
 
+# A dbt project directory, or several project directories extracted into one graph
+ProjectPath = Union[Path, str, Sequence[Union[Path, str]]]
+
+# Graph implementations selectable with graph_backend: networkx-based, or
+# integer-indexed with array-backed adjacency for very large projects
+GRAPH_BACKENDS: dict[str, type[DependencyGraph]] = {
+    "networkx": DependencyGraph,
+    "compact": CompactDependencyGraph,
+}
 
-def extract_dependencies(project_path: Union[Path, str]) -> dict[str, Any]:
+
+def extract_dependencies(
+    project_path: ProjectPath,
+    lightweight: bool = False,
+    jobs: int = 1,
+    cache: Union[bool, Path, str, BaseLineageCache] = False,
+    select: Optional[Sequence[str]] = None,
+    exclude: Optional[Sequence[str]] = None,
+    metrics: Optional[MetricsRecorder] = None,
+    projection: Optional[PropertyProjection] = None,
+) -> dict[str, Any]:
     """
     Extract all dependencies from a dbt project.
 
     Args:
-        project_path: Path to the dbt project directory
+        project_path: Path to the dbt project directory, or a list of projects
+            (a dbt mesh) extracted into one graph (see ``extract_projects``)
+        lightweight: Stream the manifest instead of validating it with Pydantic
+        jobs: Number of worker processes for column lineage, or for extracting
+            the projects of a mesh; 0 uses all CPUs
+        cache: Cache column lineage per model on disk (True for the default
+            ``target/.dbt_to_cypher_cache`` directory, or a directory path)
+        select: dbt selection expressions; only selected nodes are extracted
+        exclude: dbt selection expressions of nodes to leave out
+        metrics: Optional recorder measuring the time, memory and item counts of each stage
+        projection: Node properties to extract (default: ``PropertyProjection()``)
 
     Returns:
         Dictionary containing models, columns, model_dependencies, and column_dependencies
     """
-    extractor = DbtDependencyExtractor(str(project_path))
+    if not isinstance(project_path, (Path, str)):
+        return extract_projects(
+            project_path,
+            lightweight=lightweight,
+            jobs=jobs,
+            cache=cache,
+            select=select,
+            exclude=exclude,
+            metrics=metrics,
+            projection=projection,
+        )
+
+    extractor = DbtDependencyExtractor(
+        str(project_path),
+        lightweight=lightweight,
+        jobs=jobs,
+        cache=cache,
+        select=select,
+        exclude=exclude,
+        metrics=metrics,
+        projection=projection,
+    )
     return extractor.extract_all()
 
 
-def build_dependency_graph(dependencies: dict[str, Any]) -> DependencyGraph:
+def build_dependency_graph(
+    dependencies: dict[str, Any], backend: str = "networkx"
+) -> DependencyGraph:
     """
     Build a dependency graph from extracted dependencies.
 
     Args:
         dependencies: Dictionary of dependencies from extract_dependencies()
+        backend: Graph implementation, one of ``GRAPH_BACKENDS``
 
     Returns:
         DependencyGraph instance
     """
-    graph = DependencyGraph()
+    if backend not in GRAPH_BACKENDS:
+        raise ValueError(f"Unknown graph backend: {backend}")
+    graph = GRAPH_BACKENDS[backend]()
 
     # Add model nodes
     models = dependencies.get("models", {}) if isinstance(dependencies, dict) else {}
@@ -53,7 +124,10 @@ def build_dependency_graph(dependencies: dict[str, Any]) -> DependencyGraph:
     # Add column nodes
     columns = dependencies.get("columns", {}) if isinstance(dependencies, dict) else {}
     for column, col_data in columns.items():
-        model_name = col_data.get("model_name", "")
+        # model_name may be projected away; the column ID starts with the model ID
+        model_name = col_data.get("model_name") or (
+            column.rsplit(".", 1)[0] if "." in column else ""
+        )
         if model_name:
             # Extract column name from full identifier (e.g., "model.column" -> "column")
             col_name = column.split(".")[-1] if "." in column else column
@@ -78,50 +152,875 @@ def build_dependency_graph(dependencies: dict[str, Any]) -> DependencyGraph:
     return graph
 
 
-def generate_cypher_queries(graph: DependencyGraph) -> str:
+def iter_cypher_queries(graph: DependencyGraph, batch_size: Optional[int] = None) -> Iterator[str]:
+    """
+    Lazily generate Cypher statements from a dependency graph.
+
+    Args:
+        graph: DependencyGraph instance
+        batch_size: If set, emit batched ``UNWIND`` statements with up to this
+            many rows each instead of one statement per node and relationship
+
+    Yields:
+        Cypher statements without trailing ``;``
+    """
+    generator = CypherGenerator(graph)
+    if batch_size is not None:
+        return generator.iter_batched_script_queries(batch_size)
+    return generator.iter_all_queries()
+
+
+def generate_cypher_queries(graph: DependencyGraph, batch_size: Optional[int] = None) -> str:
     """
     Generate Cypher queries from a dependency graph.
 
     Args:
         graph: DependencyGraph instance
+        batch_size: If set, emit batched ``UNWIND`` statements with up to this
+            many rows each instead of one statement per node and relationship
 
     Returns:
         Cypher query script as a string
     """
     generator = CypherGenerator(graph)
+    if batch_size is not None:
+        return generator.generate_batched_script(batch_size)
     return generator.generate_all_queries()
 
 
-def extract_dbt_project(
-    project_path: Union[Path, str],
-    output_path: Optional[Union[Path, str]] = None,
-) -> str:
+def generate_cypher_diff(previous: DependencyGraph, current: DependencyGraph) -> str:
     """
-    Main process: extract dbt dependencies, build graph, and generate Cypher.
+    Generate Cypher that updates a graph loaded from ``previous`` to ``current``.
 
     Args:
-        project_path: Path to the dbt project directory
-        output_path: Optional path to write Cypher queries to file
+        previous: Graph from a previous run
+        current: Graph from the current run
 
     Returns:
-        Cypher query script as a string
+        Cypher query script as a string (empty if nothing changed)
+    """
+    queries = list(iter_cypher_diff(previous, current))
+    return ";\n".join(queries) + ";" if queries else ""
+
+
+def iter_cypher_diff(previous: DependencyGraph, current: DependencyGraph) -> Iterator[str]:
+    """
+    Lazily generate Cypher that updates a graph loaded from ``previous`` to ``current``.
+
+    Args:
+        previous: Graph from a previous run
+        current: Graph from the current run
+
+    Returns:
+        Iterator of Cypher statements without trailing ``;``
+    """
+    diff = diff_graphs(previous, current)
+    logger.info(
+        f"Graph diff: {len(diff.added_nodes)} added, {len(diff.changed_nodes)} changed, "
+        f"{len(diff.removed_nodes)} removed nodes; {len(diff.added_edges)} added, "
+        f"{len(diff.removed_edges)} removed relationships"
+    )
+    return CypherGenerator(current).iter_diff_queries(diff)
+
+
+def load_previous_graph(
+    state_path: Union[Path, str],
+    lightweight: bool = False,
+    jobs: int = 1,
+    cache: Union[bool, Path, str] = False,
+    select: Optional[Sequence[str]] = None,
+    exclude: Optional[Sequence[str]] = None,
+    projection: Optional[PropertyProjection] = None,
+) -> DependencyGraph:
+    """
+    Load the graph of a previous run.
+
+    Args:
+        state_path: A graph JSON file saved with ``save_graph_state``, a directory
+            holding previous ``manifest.json``/``catalog.json`` artifacts, or a
+            previous dbt project directory
+        lightweight: Stream the previous manifest instead of validating it
+        jobs: Number of worker processes for column lineage; 0 uses all CPUs
+        cache: Cache column lineage per model on disk
+        select: dbt selection expressions applied to previous artifacts, so a
+            diff compares the same subgraph (saved graph files are used as is)
+        exclude: dbt selection expressions of nodes to leave out
+        projection: Node properties to extract from previous artifacts
+
+    Returns:
+        DependencyGraph of the previous run
     """
+    state_path = Path(state_path)
+    if state_path.is_file():
+        return load_graph_state(state_path)
+
+    extractor = DbtDependencyExtractor(
+        str(state_path),
+        lightweight=lightweight,
+        jobs=jobs,
+        cache=cache,
+        select=select,
+        exclude=exclude,
+        projection=projection,
+    )
+    manifest_path = find_artifact(state_path, "manifest.json")
+    if manifest_path.exists():
+        # Artifacts directory, as used by dbt --state
+        extractor.manifest_path = manifest_path
+        extractor.catalog_path = find_artifact(state_path, "catalog.json")
+    return build_dependency_graph(extractor.extract_all())
+
+
+def _build_project_graph(
+    project_path: ProjectPath,
+    lightweight: bool = False,
+    jobs: int = 1,
+    cache: Union[bool, Path, str, BaseLineageCache] = False,
+    save_state: Optional[Union[Path, str]] = None,
+    graph_backend: str = "networkx",
+    select: Optional[Sequence[str]] = None,
+    exclude: Optional[Sequence[str]] = None,
+    metrics: Optional[MetricsRecorder] = None,
+    projection: Optional[PropertyProjection] = None,
+) -> DependencyGraph:
+    """Extract a dbt project into a graph, optionally saving its state."""
     logger.info(f"Loading dbt project from: {project_path}")
 
     # Extract dependencies
-    dependencies = extract_dependencies(project_path)
+    dependencies = extract_dependencies(
+        project_path,
+        lightweight=lightweight,
+        jobs=jobs,
+        cache=cache,
+        select=select,
+        exclude=exclude,
+        metrics=metrics,
+        projection=projection,
+    )
 
     # Build graph
-    graph = build_dependency_graph(dependencies)
+    with measure_stage(metrics, "graph_build") as stage:
+        graph = build_dependency_graph(dependencies, backend=graph_backend)
+        stage.count("nodes", graph.number_of_nodes())
+        stage.count("edges", graph.number_of_edges())
+
+    if save_state:
+        save_graph_state(graph, save_state)
+        logger.info(f"Graph state written to {save_state}")
+
+    return graph
+
+
+def _start_pipelined_graph(
+    project_path: ProjectPath,
+    state: Optional[Union[Path, str]] = None,
+    lightweight: bool = False,
+    jobs: int = 1,
+    cache: Union[bool, Path, str, BaseLineageCache] = False,
+    graph_backend: str = "networkx",
+    select: Optional[Sequence[str]] = None,
+    exclude: Optional[Sequence[str]] = None,
+    metrics: Optional[MetricsRecorder] = None,
+    projection: Optional[PropertyProjection] = None,
+) -> tuple[PipelinedExtraction, DependencyGraph]:
+    """Build the model-level graph of a project while its column lineage is computed."""
+    if not isinstance(project_path, (Path, str)):
+        raise ValueError("Pipelined extraction supports a single dbt project")
+    if state:
+        raise ValueError("Pipelined extraction cannot be combined with state")
+    logger.info(f"Loading dbt project from: {project_path} (pipelined)")
+
+    pipeline = PipelinedExtraction(
+        project_path,
+        lightweight=lightweight,
+        jobs=jobs,
+        cache=cache,
+        select=select,
+        exclude=exclude,
+        metrics=metrics,
+        projection=projection,
+    )
+    try:
+        dependencies = pipeline.extract_model_level()
+        with measure_stage(metrics, "graph_build") as stage:
+            graph = build_dependency_graph(dependencies, backend=graph_backend)
+            stage.count("nodes", graph.number_of_nodes())
+            stage.count("edges", graph.number_of_edges())
+    except BaseException:
+        pipeline.close()
+        raise
+    return pipeline, graph
+
+
+def _add_column_dependencies(
+    graph: DependencyGraph, column_dependencies: dict[str, list[str]]
+) -> tuple[list[str], list[tuple[str, str, str]]]:
+    """Add column lineage to a graph and return the nodes and edges it added."""
+    nodes: list[str] = []
+    edges: dict[tuple[str, str, str], None] = {}
+    for column, upstreams in column_dependencies.items():
+        for upstream in upstreams:
+            # Lineage may reference columns missing from the catalog
+            nodes.extend(node for node in (column, upstream) if node not in graph)
+            graph.add_dependency(column, upstream)
+            edges[(column, upstream, "depends_on")] = None
+    return list(dict.fromkeys(nodes)), list(edges)
+
+
+def _iter_pipelined_queries(
+    pipeline: PipelinedExtraction,
+    graph: DependencyGraph,
+    batch_size: Optional[int] = None,
+    save_state: Optional[Union[Path, str]] = None,
+) -> Iterator[str]:
+    """Generate the model-level graph, then column lineage once it is computed."""
+    with pipeline:
+        yield from iter_cypher_queries(graph, batch_size=batch_size)
+        nodes, edges = _add_column_dependencies(graph, pipeline.extract_column_dependencies())
+        yield from CypherGenerator(graph).iter_subgraph_queries(nodes, edges, batch_size=batch_size)
+
+    if save_state:
+        save_graph_state(graph, save_state)
+        logger.info(f"Graph state written to {save_state}")
+
+
+def iter_dbt_project_queries(
+    project_path: ProjectPath,
+    lightweight: bool = False,
+    jobs: int = 1,
+    cache: Union[bool, Path, str] = False,
+    state: Optional[Union[Path, str]] = None,
+    save_state: Optional[Union[Path, str]] = None,
+    graph_backend: str = "networkx",
+    batch_size: Optional[int] = None,
+    select: Optional[Sequence[str]] = None,
+    exclude: Optional[Sequence[str]] = None,
+    metrics: Optional[MetricsRecorder] = None,
+    projection: Optional[PropertyProjection] = None,
+    pipelined: bool = False,
+) -> Iterator[str]:
+    """
+    Extract dbt dependencies, build the graph, and lazily generate Cypher.
+
+    Extraction runs when this function is called; statements are generated
+    one at a time as the returned iterator is consumed.
+
+    With ``pipelined``, column lineage is computed in the background (see
+    ``PipelinedExtraction``): statements of the model-level graph are
+    generated right away and those of column lineage once it is computed.
+    Waiting for lineage then happens while the iterator is consumed. The
+    returned ``PipelinedQueries`` holds the lineage process until it is
+    exhausted or closed; close it when not consuming it to the end.
+
+    Args:
+        project_path: Path to the dbt project directory, or a list of projects
+            (a dbt mesh) extracted into one graph (see ``extract_projects``)
+        lightweight: Stream the manifest instead of validating it with Pydantic
+        jobs: Number of worker processes for column lineage; 0 uses all CPUs
+        cache: Cache column lineage per model on disk (True for the default
+            ``target/.dbt_to_cypher_cache`` directory, or a directory path)
+        state: Optional previous run to diff against (see ``load_previous_graph``)
+        save_state: Optional path to save the current graph for a later diff
+        graph_backend: Graph implementation, one of ``GRAPH_BACKENDS``
+        batch_size: If set, emit batched ``UNWIND`` statements (ignored with ``state``)
+        select: dbt selection expressions; only selected nodes are extracted
+        exclude: dbt selection expressions of nodes to leave out
+        metrics: Optional recorder measuring the time, memory and item counts of each stage
+        projection: Node properties to extract (default: ``PropertyProjection()``)
+        pipelined: Overlap artifact loading, column lineage and output; only
+            for a single project and without ``state``
+
+    Returns:
+        Iterator of Cypher statements without trailing ``;``
+
+    Raises:
+        ValueError: If ``pipelined`` is combined with ``state`` or several projects
+    """
+    if pipelined:
+        pipeline, graph = _start_pipelined_graph(
+            project_path,
+            state=state,
+            lightweight=lightweight,
+            jobs=jobs,
+            cache=cache,
+            graph_backend=graph_backend,
+            select=select,
+            exclude=exclude,
+            metrics=metrics,
+            projection=projection,
+        )
+        return PipelinedQueries(
+            _iter_pipelined_queries(pipeline, graph, batch_size=batch_size, save_state=save_state),
+            pipeline,
+        )
+
+    graph = _build_project_graph(
+        project_path,
+        lightweight=lightweight,
+        jobs=jobs,
+        cache=cache,
+        save_state=save_state,
+        graph_backend=graph_backend,
+        select=select,
+        exclude=exclude,
+        metrics=metrics,
+        projection=projection,
+    )
 
     # Generate Cypher
-    cypher_script = generate_cypher_queries(graph)
+    if state:
+        with measure_stage(metrics, "previous_graph") as stage:
+            previous = load_previous_graph(
+                state,
+                lightweight=lightweight,
+                jobs=jobs,
+                cache=cache,
+                select=select,
+                exclude=exclude,
+                projection=projection,
+            )
+            stage.count("nodes", previous.number_of_nodes())
+        return iter_cypher_diff(previous, graph)
+    return iter_cypher_queries(graph, batch_size=batch_size)
+
+
+def write_dbt_project(
+    project_path: ProjectPath,
+    output: Optional[Union[Path, str, TextIO]] = None,
+    lightweight: bool = False,
+    jobs: int = 1,
+    cache: Union[bool, Path, str] = False,
+    state: Optional[Union[Path, str]] = None,
+    save_state: Optional[Union[Path, str]] = None,
+    graph_backend: str = "networkx",
+    batch_size: Optional[int] = None,
+    select: Optional[Sequence[str]] = None,
+    exclude: Optional[Sequence[str]] = None,
+    metrics: Optional[MetricsRecorder] = None,
+    projection: Optional[PropertyProjection] = None,
+    pipelined: bool = False,
+) -> int:
+    """
+    Extract a dbt project and stream the Cypher script to a file or handle.
+
+    Statements are written as they are generated, so the full script is
+    never held in memory. With ``pipelined``, model-level statements are
+    written while column lineage is computed, by a writer thread.
+
+    Args:
+        project_path: Path to the dbt project directory, or a list of projects
+            (a dbt mesh) extracted into one graph (see ``extract_projects``)
+        output: Path or writable text handle to write to; defaults to stdout
+        lightweight: Stream the manifest instead of validating it with Pydantic
+        jobs: Number of worker processes for column lineage; 0 uses all CPUs
+        cache: Cache column lineage per model on disk
+        state: Optional previous run to diff against (see ``load_previous_graph``)
+        save_state: Optional path to save the current graph for a later diff
+        graph_backend: Graph implementation, one of ``GRAPH_BACKENDS``
+        batch_size: If set, emit batched ``UNWIND`` statements (ignored with ``state``)
+        select: dbt selection expressions; only selected nodes are extracted
+        exclude: dbt selection expressions of nodes to leave out
+        metrics: Optional recorder measuring the time, memory and item counts of each stage
+        projection: Node properties to extract (default: ``PropertyProjection()``)
+        pipelined: Overlap artifact loading, column lineage and output (see
+            ``iter_dbt_project_queries``)
+
+    Returns:
+        Number of statements written
+    """
+    queries = iter_dbt_project_queries(
+        project_path,
+        lightweight=lightweight,
+        jobs=jobs,
+        cache=cache,
+        state=state,
+        save_state=save_state,
+        graph_backend=graph_backend,
+        batch_size=batch_size,
+        select=select,
+        exclude=exclude,
+        metrics=metrics,
+        projection=projection,
+        pipelined=pipelined,
+    )
+
+    try:
+        return _write_output(queries, output, metrics, background=pipelined)
+    finally:
+        if isinstance(queries, PipelinedQueries):
+            queries.close()
+
+
+def _write_output(
+    queries: Iterator[str],
+    output: Optional[Union[Path, str, TextIO]],
+    metrics: Optional[MetricsRecorder] = None,
+    background: bool = False,
+) -> int:
+    """Write statements to a path, a text handle or stdout and return their number."""
+    write = write_queries_in_background if background else write_queries
+    # Statements are generated lazily, so this stage covers generation and writing
+    with measure_stage(metrics, "cypher_generation") as stage:
+        if output is None or not isinstance(output, (Path, str)):
+            count = write(queries, output or sys.stdout)
+        else:
+            with open(output, "w", encoding="utf-8") as fp:
+                count = write(queries, fp)
+        stage.count("statements", count)
+
+    if output is None or not isinstance(output, (Path, str)):
+        logger.info(f"{count} Cypher statements generated")
+    else:
+        logger.info(f"{count} Cypher statements written to {output}")
+    return count
+
+
+def watch_dbt_project(
+    project_path: Union[Path, str],
+    output: Optional[Union[Path, str, TextIO]] = None,
+    lightweight: bool = False,
+    jobs: int = 1,
+    cache: Union[bool, Path, str] = False,
+    state: Optional[Union[Path, str]] = None,
+    save_state: Optional[Union[Path, str]] = None,
+    graph_backend: str = "networkx",
+    batch_size: Optional[int] = None,
+    select: Optional[Sequence[str]] = None,
+    exclude: Optional[Sequence[str]] = None,
+    metrics: Optional[MetricsRecorder] = None,
+    projection: Optional[PropertyProjection] = None,
+    debounce: float = DEFAULT_DEBOUNCE,
+    poll_interval: float = DEFAULT_POLL_INTERVAL,
+    max_rebuilds: Optional[int] = None,
+) -> None:
+    """
+    Write the Cypher of a dbt project, then rebuild it whenever its artifacts change.
+
+    Every rebuild reads the artifacts again and builds the whole graph from
+    them; only column lineage is incremental. The process stays alive between
+    rebuilds, so imports and the column lineage of models whose compiled SQL
+    and upstream schemas did not change are reused (kept in memory unless
+    ``cache`` selects an on-disk cache). A rebuild starts once
+    ``manifest.json`` and ``catalog.json`` have stayed unchanged for
+    ``debounce`` seconds. An output file is rewritten with the full script
+    (or the diff against ``state``) on every rebuild; on a text handle or
+    stdout, each rebuild appends only the statements that update the
+    previous graph, so piping them into ``cypher-shell`` keeps a database
+    in sync. A failed rebuild is logged and the previous graph kept.
+
+    Args:
+        project_path: Path to the dbt project directory
+        output: Path or writable text handle to write to; defaults to stdout
+        lightweight: Stream the manifest instead of validating it with Pydantic
+        jobs: Number of worker processes for column lineage; 0 uses all CPUs
+        cache: Cache column lineage per model on disk instead of in memory
+        state: Optional previous run to diff against (see ``load_previous_graph``)
+        save_state: Optional path to save the current graph after each rebuild
+        graph_backend: Graph implementation, one of ``GRAPH_BACKENDS``
+        batch_size: If set, emit batched ``UNWIND`` statements (ignored with ``state``)
+        select: dbt selection expressions; only selected nodes are extracted
+        exclude: dbt selection expressions of nodes to leave out
+        metrics: Optional recorder measuring the time, memory and item counts of each stage
+        projection: Node properties to extract (default: ``PropertyProjection()``)
+        debounce: Seconds the artifacts must stay unchanged before a rebuild
+        poll_interval: Seconds between two checks of the artifacts
+        max_rebuilds: Return after this many rebuilds (default: watch until interrupted)
+    """
+    lineage_cache: Union[bool, Path, str, BaseLineageCache] = cache or MemoryLineageCache()
+    target = Path(project_path) / "target"
+    watcher = ArtifactWatcher(
+        [find_artifact(target, "manifest.json"), find_artifact(target, "catalog.json")],
+        debounce=debounce,
+        poll_interval=poll_interval,
+    )
+    # Handle that rebuilds are appended to, None when rewriting a file
+    stream = None if isinstance(output, (Path, str)) else output or sys.stdout
+    previous: Optional[DependencyGraph] = None
+    if state:
+        previous = load_previous_graph(
+            state,
+            lightweight=lightweight,
+            jobs=jobs,
+            cache=cache,
+            select=select,
+            exclude=exclude,
+            projection=projection,
+        )
+    graph: Optional[DependencyGraph] = None
+    rebuilds = 0
+    while True:
+        try:
+            current = _build_project_graph(
+                project_path,
+                lightweight=lightweight,
+                jobs=jobs,
+                cache=lineage_cache,
+                save_state=save_state,
+                graph_backend=graph_backend,
+                select=select,
+                exclude=exclude,
+                metrics=metrics,
+                projection=projection,
+            )
+        except Exception as e:
+            logger.error(f"Rebuild failed, keeping the previous graph: {e}")
+        else:
+            if stream is None or graph is None:
+                # The same output as a one-shot run
+                if previous is None:
+                    queries = iter_cypher_queries(current, batch_size=batch_size)
+                else:
+                    queries = iter_cypher_diff(previous, current)
+                _write_output(queries, output, metrics)
+            else:
+                diff = diff_graphs(graph, current)
+                if diff.is_empty():
+                    logger.info("Graph unchanged")
+                else:
+                    _write_output(CypherGenerator(current).iter_diff_queries(diff), output, metrics)
+            if stream is not None:
+                # Make each rebuild visible to a reading pipe right away
+                stream.flush()
+            graph = current
+
+        if max_rebuilds is not None and rebuilds >= max_rebuilds:
+            return
+        logger.info(f"Watching {target} for changes")
+        watcher.wait_for_change()
+        rebuilds += 1
+
+
+def extract_dbt_project(
+    project_path: ProjectPath,
+    output_path: Optional[Union[Path, str]] = None,
+    lightweight: bool = False,
+    jobs: int = 1,
+    cache: Union[bool, Path, str] = False,
+    state: Optional[Union[Path, str]] = None,
+    save_state: Optional[Union[Path, str]] = None,
+    graph_backend: str = "networkx",
+    batch_size: Optional[int] = None,
+    select: Optional[Sequence[str]] = None,
+    exclude: Optional[Sequence[str]] = None,
+    metrics: Optional[MetricsRecorder] = None,
+    projection: Optional[PropertyProjection] = None,
+) -> str:
+    """
+    Main process: extract dbt dependencies, build graph, and generate Cypher.
+
+    With ``state``, only the changes relative to a previous run are emitted.
+    Use ``write_dbt_project`` to stream large scripts instead of building a string.
+
+    Args:
+        project_path: Path to the dbt project directory, or a list of projects
+            (a dbt mesh) extracted into one graph (see ``extract_projects``)
+        output_path: Optional path to write Cypher queries to file
+        lightweight: Stream the manifest instead of validating it with Pydantic
+        jobs: Number of worker processes for column lineage; 0 uses all CPUs
+        cache: Cache column lineage per model on disk (True for the default
+            ``target/.dbt_to_cypher_cache`` directory, or a directory path)
+        state: Optional previous run to diff against (see ``load_previous_graph``)
+        save_state: Optional path to save the current graph for a later diff
+        graph_backend: Graph implementation, one of ``GRAPH_BACKENDS``
+        batch_size: If set, emit batched ``UNWIND`` statements (ignored with ``state``)
+        select: dbt selection expressions; only selected nodes are extracted
+        exclude: dbt selection expressions of nodes to leave out
+        metrics: Optional recorder measuring the time, memory and item counts of each stage
+        projection: Node properties to extract (default: ``PropertyProjection()``)
+
+    Returns:
+        Cypher query script as a string
+    """
+    buffer = io.StringIO()
+    write_dbt_project(
+        project_path,
+        buffer,
+        lightweight=lightweight,
+        jobs=jobs,
+        cache=cache,
+        state=state,
+        save_state=save_state,
+        graph_backend=graph_backend,
+        batch_size=batch_size,
+        select=select,
+        exclude=exclude,
+        metrics=metrics,
+        projection=projection,
+    )
+    # Same layout as generate_cypher_queries: no newline after the last statement
+    cypher_script = buffer.getvalue().rstrip("\n")
 
     # Optionally write to file
     if output_path:
         Path(output_path).write_text(cypher_script)
         logger.info(f"Cypher queries written to {output_path}")
-    else:
-        logger.info("Cypher queries generated successfully")
 
     return cypher_script
+
+
+def export_dbt_project_csv(
+    project_path: ProjectPath,
+    output_dir: Union[Path, str],
+    lightweight: bool = False,
+    jobs: int = 1,
+    cache: Union[bool, Path, str] = False,
+    save_state: Optional[Union[Path, str]] = None,
+    graph_backend: str = "networkx",
+    select: Optional[Sequence[str]] = None,
+    exclude: Optional[Sequence[str]] = None,
+    metrics: Optional[MetricsRecorder] = None,
+    projection: Optional[PropertyProjection] = None,
+) -> dict[str, Path]:
+    """
+    Extract a dbt project and write ``neo4j-admin database import`` CSV files.
+
+    Args:
+        project_path: Path to the dbt project directory, or a list of projects
+            (a dbt mesh) extracted into one graph (see ``extract_projects``)
+        output_dir: Directory to write the CSV files to
+        lightweight: Stream the manifest instead of validating it with Pydantic
+        jobs: Number of worker processes for column lineage; 0 uses all CPUs
+        cache: Cache column lineage per model on disk
+        save_state: Optional path to save the current graph for a later diff
+        graph_backend: Graph implementation, one of ``GRAPH_BACKENDS``
+        select: dbt selection expressions; only selected nodes are extracted
+        exclude: dbt selection expressions of nodes to leave out
+        metrics: Optional recorder measuring the time, memory and item counts of each stage
+        projection: Node properties to extract (default: ``PropertyProjection()``)
+
+    Returns:
+        Mapping of label (or ``"relationships"``) to the written file
+    """
+    graph = _build_project_graph(
+        project_path,
+        lightweight=lightweight,
+        jobs=jobs,
+        cache=cache,
+        save_state=save_state,
+        graph_backend=graph_backend,
+        select=select,
+        exclude=exclude,
+        metrics=metrics,
+        projection=projection,
+    )
+    with measure_stage(metrics, "csv_export") as stage:
+        files = Neo4jCsvExporter(graph).write(output_dir)
+        stage.count("files", len(files))
+    logger.info(f"Import with: {Neo4jCsvExporter.import_command(files)}")
+    return files
+
+
+def load_dbt_project(
+    project_path: ProjectPath,
+    uri: str,
+    auth: Optional[tuple[str, str]] = None,
+    database: Optional[str] = None,
+    workers: int = DEFAULT_WORKERS,
+    lightweight: bool = False,
+    jobs: int = 1,
+    cache: Union[bool, Path, str] = False,
+    state: Optional[Union[Path, str]] = None,
+    save_state: Optional[Union[Path, str]] = None,
+    graph_backend: str = "networkx",
+    batch_size: Optional[int] = None,
+    select: Optional[Sequence[str]] = None,
+    exclude: Optional[Sequence[str]] = None,
+    metrics: Optional[MetricsRecorder] = None,
+    projection: Optional[PropertyProjection] = None,
+    pipelined: bool = False,
+) -> LoadSummary:
+    """
+    Extract a dbt project and write it straight into Neo4j over Bolt.
+
+    With ``state``, only the changes relative to a previous run are applied.
+    With ``pipelined``, the model-level graph is loaded while column lineage
+    is computed, and column lineage is loaded once it is computed.
+
+    Args:
+        project_path: Path to the dbt project directory, or a list of projects
+            (a dbt mesh) extracted into one graph (see ``extract_projects``)
+        uri: Bolt or neo4j URI of the database server
+        auth: Optional (user, password) pair
+        database: Database to write to (default: the server's default database)
+        workers: Number of concurrent writers for node batches
+        lightweight: Stream the manifest instead of validating it with Pydantic
+        jobs: Number of worker processes for column lineage; 0 uses all CPUs
+        cache: Cache column lineage per model on disk
+        state: Optional previous run to diff against (see ``load_previous_graph``)
+        save_state: Optional path to save the current graph for a later diff
+        graph_backend: Graph implementation, one of ``GRAPH_BACKENDS``
+        batch_size: Maximum number of rows per transaction
+        select: dbt selection expressions; only selected nodes are extracted
+        exclude: dbt selection expressions of nodes to leave out
+        metrics: Optional recorder measuring the time, memory and item counts of each stage
+        projection: Node properties to extract (default: ``PropertyProjection()``)
+        pipelined: Overlap artifact loading, column lineage and the load; only
+            for a single project and without ``state``
+
+    Returns:
+        LoadSummary of the load
+
+    Raises:
+        ValueError: If ``pipelined`` is combined with ``state`` or several projects
+    """
+    if pipelined:
+        pipeline, graph = _start_pipelined_graph(
+            project_path,
+            state=state,
+            lightweight=lightweight,
+            jobs=jobs,
+            cache=cache,
+            graph_backend=graph_backend,
+            select=select,
+            exclude=exclude,
+            metrics=metrics,
+            projection=projection,
+        )
+        with pipeline:
+            with Neo4jLoader.connect(
+                uri,
+                auth=auth,
+                workers=workers,
+                database=database,
+                batch_size=DEFAULT_BATCH_SIZE if batch_size is None else batch_size,
+            ) as loader:
+                # Column lineage is still being computed while the model-level graph is loaded
+                with measure_stage(metrics, "neo4j_load") as stage:
+                    summary = loader.load(graph)
+                    stage.count("transactions", summary.transactions)
+                    stage.count("rows", summary.rows)
+                    stage.count("retries", summary.retries)
+                with measure_stage(metrics, "column_lineage") as stage:
+                    nodes, edges = _add_column_dependencies(
+                        graph, pipeline.extract_column_dependencies()
+                    )
+                    stage.count("dependencies", len(edges))
+                with measure_stage(metrics, "neo4j_lineage_load") as stage:
+                    lineage_summary = loader.load(graph, nodes=nodes, edges=edges)
+                    stage.count("transactions", lineage_summary.transactions)
+                    stage.count("rows", lineage_summary.rows)
+                    stage.count("retries", lineage_summary.retries)
+                summary = LoadSummary(*(a + b for a, b in zip(summary, lineage_summary)))
+
+        if save_state:
+            save_graph_state(graph, save_state)
+            logger.info(f"Graph state written to {save_state}")
+        return summary
+
+    graph = _build_project_graph(
+        project_path,
+        lightweight=lightweight,
+        jobs=jobs,
+        cache=cache,
+        save_state=save_state,
+        graph_backend=graph_backend,
+        select=select,
+        exclude=exclude,
+        metrics=metrics,
+        projection=projection,
+    )
+
+    with Neo4jLoader.connect(
+        uri,
+        auth=auth,
+        workers=workers,
+        database=database,
+        batch_size=DEFAULT_BATCH_SIZE if batch_size is None else batch_size,
+    ) as loader:
+        if state:
+            with measure_stage(metrics, "previous_graph") as stage:
+                previous = load_previous_graph(
+                    state,
+                    lightweight=lightweight,
+                    jobs=jobs,
+                    cache=cache,
+                    select=select,
+                    exclude=exclude,
+                    projection=projection,
+                )
+                stage.count("nodes", previous.number_of_nodes())
+        # Statements are generated while they are loaded
+        with measure_stage(metrics, "neo4j_load") as stage:
+            if state:
+                queries = iter_cypher_diff(previous, graph)
+                summary = loader.run_statements((query, {}) for query in queries)
+            else:
+                summary = loader.load(graph)
+            stage.count("transactions", summary.transactions)
+            stage.count("rows", summary.rows)
+            stage.count("retries", summary.retries)
+        return summary
+
+
+def analyze_impact(
+    project_path: ProjectPath,
+    nodes: Sequence[str],
+    relationships: Optional[Collection[str]] = None,
+    lightweight: bool = False,
+    jobs: int = 1,
+    cache: Union[bool, Path, str] = False,
+    graph_backend: str = "networkx",
+    select: Optional[Sequence[str]] = None,
+    exclude: Optional[Sequence[str]] = None,
+    metrics: Optional[MetricsRecorder] = None,
+    projection: Optional[PropertyProjection] = None,
+) -> dict[str, Impact]:
+    """
+    Extract a dbt project and find the nodes affected by changes to ``nodes``.
+
+    Args:
+        project_path: Path to the dbt project directory, or a list of projects
+            (a dbt mesh) extracted into one graph (see ``extract_projects``)
+        nodes: Changed model or column identifiers
+        relationships: Only follow these relationship types (e.g. ``{"depends_on"}``)
+        lightweight: Stream the manifest instead of validating it with Pydantic
+        jobs: Number of worker processes for column lineage; 0 uses all CPUs
+        cache: Cache column lineage per model on disk
+        graph_backend: Graph implementation, one of ``GRAPH_BACKENDS``
+        select: dbt selection expressions; only selected nodes are extracted
+        exclude: dbt selection expressions of nodes to leave out
+        metrics: Optional recorder measuring the time, memory and item counts of each stage
+        projection: Node properties to extract (default: ``PropertyProjection()``)
+
+    Returns:
+        Mapping of each affected node to its Impact (see ``DependencyGraph.get_impact``)
+    """
+    graph = _build_project_graph(
+        project_path,
+        lightweight=lightweight,
+        jobs=jobs,
+        cache=cache,
+        graph_backend=graph_backend,
+        select=select,
+        exclude=exclude,
+        metrics=metrics,
+        projection=projection,
+    )
+    with measure_stage(metrics, "impact") as stage:
+        impact = graph.get_impact(nodes, relationships=relationships)
+        stage.count("affected", len(impact))
+    logger.info(f"{len(impact)} nodes affected by {len(nodes)} changed nodes")
+    return impact
+
+
+def write_impact_json(
+    impact: dict[str, Impact], output: Optional[Union[Path, str, TextIO]] = None
+) -> None:
+    """
+    Write an impact analysis as JSON, ordered by distance.
+
+    Args:
+        impact: Result of ``analyze_impact`` or ``DependencyGraph.get_impact``
+        output: Path or writable text handle to write to; defaults to stdout
+    """
+    data = {
+        node: node_impact._asdict()
+        for node, node_impact in sorted(
+            impact.items(), key=lambda item: (item[1].distance, item[0])
+        )
+    }
+    if output is None or not isinstance(output, (Path, str)):
+        json.dump(data, output or sys.stdout, indent=2)
+        (output or sys.stdout).write("\n")
+        return
+    Path(output).write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
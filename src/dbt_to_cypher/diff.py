@@ -0,0 +1,143 @@
+"""
+Module for comparing dependency graphs between runs.
+"""
+
+import json
+from pathlib import Path
+from typing import NamedTuple, Union
+
+import networkx as nx
+
+from dbt_to_cypher import snapshot
+from dbt_to_cypher.compact_graph import CompactDependencyGraph
+from dbt_to_cypher.cypher import exportable_properties
+from dbt_to_cypher.graph import DependencyGraph
+
+# (source, target, relationship)
+Edge = tuple[str, str, str]
+
+
+class GraphDiff(NamedTuple):
+    """Differences between a previous and a current dependency graph."""
+
+    added_nodes: list[str]
+    changed_nodes: list[str]
+    # Node identifier -> node type in the previous graph
+    removed_nodes: dict[str, str]
+    added_edges: list[Edge]
+    removed_edges: list[Edge]
+
+    def is_empty(self) -> bool:
+        """Return True if the graphs are equivalent."""
+        return not (
+            self.added_nodes
+            or self.changed_nodes
+            or self.removed_nodes
+            or self.added_edges
+            or self.removed_edges
+        )
+
+
+def _node_state(attrs: dict) -> tuple:
+    return attrs.get("node_type"), exportable_properties(attrs)
+
+
+def _edges(graph: DependencyGraph) -> dict[tuple[str, str], str]:
+    return {(source, target): relationship for source, target, relationship in graph.edges()}
+
+
+def diff_graphs(previous: DependencyGraph, current: DependencyGraph) -> GraphDiff:
+    """
+    Compare two dependency graphs.
+
+    Nodes are compared on their node type and exported properties. An edge
+    whose relationship type changed is reported as removed and added.
+
+    Args:
+        previous: Graph from a previous run
+        current: Graph from the current run
+
+    Returns:
+        GraphDiff describing how to go from ``previous`` to ``current``
+    """
+    added_nodes = []
+    changed_nodes = []
+    for node, attrs in current.nodes():
+        if node not in previous:
+            added_nodes.append(node)
+        elif _node_state(previous.node_attributes(node)) != _node_state(attrs):
+            changed_nodes.append(node)
+
+    removed_nodes = {
+        node: attrs.get("node_type", "unknown")
+        for node, attrs in previous.nodes()
+        if node not in current
+    }
+
+    previous_edges = _edges(previous)
+    current_edges = _edges(current)
+    added_edges = [
+        (source, target, relationship)
+        for (source, target), relationship in current_edges.items()
+        if previous_edges.get((source, target)) != relationship
+    ]
+    removed_edges = [
+        (source, target, relationship)
+        for (source, target), relationship in previous_edges.items()
+        if current_edges.get((source, target)) != relationship
+        # Edges of removed nodes are dropped by DETACH DELETE
+        and source not in removed_nodes
+        and target not in removed_nodes
+    ]
+
+    return GraphDiff(
+        added_nodes=added_nodes,
+        changed_nodes=changed_nodes,
+        removed_nodes=removed_nodes,
+        added_edges=added_edges,
+        removed_edges=removed_edges,
+    )
+
+
+def save_graph_state(graph: DependencyGraph, path: Union[Path, str]) -> None:
+    """
+    Save the exported view of a graph, for diffing in a later run.
+
+    Only node types, exported properties and relationships are kept. Paths
+    ending in ``.snapshot`` are written as binary snapshots (see
+    ``snapshot.save``), which load much faster than JSON on large graphs.
+
+    Args:
+        graph: DependencyGraph to save
+        path: Output JSON or ``.snapshot`` file
+    """
+    if Path(path).suffix == snapshot.SUFFIX:
+        compact = CompactDependencyGraph()
+        for node, attrs in graph.nodes():
+            compact._set_node(node, attrs.get("node_type"), exportable_properties(attrs))
+        for source, target, relationship in graph.edges():
+            compact.add_dependency(source, target, relationship)
+        snapshot.save(compact, path)
+        return
+
+    state = nx.DiGraph()
+    for node, attrs in graph.nodes():
+        state.add_node(node, node_type=attrs.get("node_type"), **exportable_properties(attrs))
+    for source, target, relationship in graph.edges():
+        state.add_edge(source, target, relationship=relationship)
+    Path(path).write_text(json.dumps(nx.node_link_data(state)), encoding="utf-8")
+
+
+def load_graph_state(path: Union[Path, str]) -> DependencyGraph:
+    """
+    Load a graph saved with ``save_graph_state``, ``DependencyGraph.to_dict`` or ``snapshot.save``.
+
+    Args:
+        path: JSON or binary snapshot file
+
+    Returns:
+        DependencyGraph instance
+    """
+    if snapshot.is_snapshot(path):
+        return snapshot.load(path)
+    return DependencyGraph.from_dict(json.loads(Path(path).read_text(encoding="utf-8")))
@@ -2,12 +2,58 @@
 Module for extracting dependencies from dbt projects.
 """
 
-import json
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
-
-from dbt_artifacts_parser.parser import parse_catalog, parse_manifest
-from dbt_colibri.lineage_extractor.extractor import DbtColumnLineageExtractor
+from typing import Any, Optional, Union
+
+from dbt_to_cypher.artifacts import ArtifactSource, find_artifact, load_artifact
+from dbt_to_cypher.cache import DEFAULT_CACHE_DIRNAME, BaseLineageCache, LineageCache
+from dbt_to_cypher.catalog import CatalogColumn, iter_catalog_columns
+from dbt_to_cypher.lineage import (
+    Artifact,
+    ColumnReference,
+    LineageReferences,
+    RelationIndex,
+    build_lineage_references,
+)
+from dbt_to_cypher.manifest import (
+    LightweightManifest,
+    load_lightweight_manifest,
+    read_manifest_sections,
+)
+from dbt_to_cypher.metrics import MetricsRecorder, measure_stage
+from dbt_to_cypher.projection import PropertyProjection
+from dbt_to_cypher.selection import NodeSelector
+
+
+def _database(node: Any) -> Optional[str]:
+    return getattr(node, "database", None) or getattr(node, "database_name", None)
+
+
+def _schema(node: Any) -> Optional[str]:
+    return getattr(node, "schema_", None) or getattr(node, "schema", None)
+
+
+# Model property -> value of a dbt-artifacts-parser node or lightweight ManifestNode
+_MODEL_PROPERTY_GETTERS: dict[str, Callable[[Any], Any]] = {
+    "fqn": lambda node: f"{_database(node)}.{_schema(node)}.{getattr(node, 'name', None)}",
+    "materialization": lambda node: getattr(getattr(node, "config", None), "materialized", None),
+    "database": _database,
+    "schema": _schema,
+    "resource_type": lambda node: getattr(node, "resource_type", None),
+    "name": lambda node: getattr(node, "name", None),
+    "alias": lambda node: getattr(node, "alias", None),
+    "package_name": lambda node: getattr(node, "package_name", None),
+    "original_file_path": lambda node: getattr(node, "original_file_path", None),
+}
+
+
+def _catalog_value(column: Any, name: str) -> Any:
+    """Read a property of a catalog column, given as a Pydantic model or a dict."""
+    if isinstance(column, dict):
+        return column.get(name)
+    return getattr(column, name, None)
 
 
 class DbtDependencyExtractor:
@@ -19,25 +65,80 @@ class DbtDependencyExtractor:
     column-level lineage.
     """
 
-    def __init__(self, project_path: str):
+    def __init__(
+        self,
+        project_path: str,
+        lightweight: bool = False,
+        jobs: int = 1,
+        cache: Union[bool, Path, str, BaseLineageCache] = False,
+        select: Optional[Sequence[str]] = None,
+        exclude: Optional[Sequence[str]] = None,
+        metrics: Optional[MetricsRecorder] = None,
+        projection: Optional[PropertyProjection] = None,
+        manifest: Optional[ArtifactSource] = None,
+        catalog: Optional[ArtifactSource] = None,
+        json_backend: Optional[str] = None,
+    ):
         """
         Initialize the extractor with a dbt project path.
 
+        Artifacts are read from ``target/manifest.json`` and
+        ``target/catalog.json``, or their ``.gz``/``.zst`` compressed variants.
+
         Args:
             project_path: Path to the dbt project directory
+            lightweight: Stream the manifest and keep only the node fields used
+                for model extraction instead of validating it with Pydantic
+            jobs: Number of worker processes for column lineage; 0 uses all CPUs
+            cache: Cache column lineage per model on disk. True uses
+                ``target/.dbt_to_cypher_cache``; a path or LineageCache selects
+                another location, and a MemoryLineageCache keeps entries in memory
+            select: dbt selection expressions (e.g. ``+orders``, ``tag:finance``);
+                only selected nodes are extracted
+            exclude: dbt selection expressions of nodes to leave out
+            metrics: Optional recorder measuring each stage of ``extract_all``
+            projection: Node properties to extract (default: ``PropertyProjection()``)
+            manifest: Manifest to read instead of the project's, as a path or
+                bytes (e.g. downloaded from object storage), possibly compressed
+            catalog: Catalog to read instead of the project's, like ``manifest``
+            json_backend: JSON backend decoding the artifacts (see
+                ``artifacts.get_json_backend``; default: the fastest installed)
         """
         self.project_path = Path(project_path)
-        self.manifest_path = self.project_path / "target" / "manifest.json"
-        self.catalog_path = self.project_path / "target" / "catalog.json"
+        self.lightweight = lightweight
+        self.jobs = jobs
+        self.cache = cache
+        self.select = select
+        self.exclude = exclude
+        self._selected_nodes: Optional[set[str]] = None
+        self.metrics = metrics
+        self.projection = projection or PropertyProjection()
+        self.json_backend = json_backend
+        # Paths, or bytes when the artifacts are given in memory
+        target = self.project_path / "target"
+        self.manifest_path: ArtifactSource = (
+            manifest if manifest is not None else find_artifact(target, "manifest.json")
+        )
+        self.catalog_path: ArtifactSource = (
+            catalog if catalog is not None else find_artifact(target, "catalog.json")
+        )
         self.manifest: Any
         self.catalog: Any
-
-    def load_file(self) -> None:
+        # Raw artifacts shared with the column lineage stage
+        self.manifest_dict: Optional[dict[str, Any]] = None
+        self.catalog_dict: Optional[dict[str, Any]] = None
+        # Column ID -> references to tables that are not nodes of this project,
+        # e.g. public models of another project in a dbt mesh
+        self.unresolved_references: dict[str, list[ColumnReference]] = {}
+
+    def load_file(self, column_lineage: bool = True, concurrent: bool = False) -> None:
         """
         Load a dbt JSON file.
 
         Args:
-            file_path: Path to the JSON file
+            column_lineage: Keep the raw artifacts so that column lineage can
+                reuse them instead of reading the files again
+            concurrent: Load the manifest and the catalog in two threads
 
         Returns:
             Dictionary containing the parsed JSON data
@@ -46,89 +147,134 @@ class DbtDependencyExtractor:
             FileNotFoundError: If the file does not exist
             json.JSONDecodeError: If the file is not valid JSON
         """
-        if not self.manifest_path.exists():
-            raise FileNotFoundError(f"File not found: {self.manifest_path}")
-        if not self.catalog_path.exists():
-            raise FileNotFoundError(f"File not found: {self.catalog_path}")
-
-        with open(self.manifest_path, encoding="utf-8") as fp:
-            manifest_dict = json.load(fp)
+        for source in (self.manifest_path, self.catalog_path):
+            # Artifacts given as bytes are always readable
+            if isinstance(source, (Path, str)) and not Path(source).exists():
+                raise FileNotFoundError(f"File not found: {source}")
+
+        if not concurrent:
+            self._load_manifest_artifact(column_lineage)
+            self._load_catalog(column_lineage)
+            return
+
+        # File reads and the dbt-artifacts-parser import of one artifact
+        # overlap with parsing the other
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            loads = [
+                executor.submit(self._load_manifest_artifact, column_lineage),
+                executor.submit(self._load_catalog, column_lineage),
+            ]
+            for load in loads:
+                load.result()
+
+    def _load_manifest_artifact(self, column_lineage: bool) -> None:
+        """Load the manifest, streamed or validated depending on ``lightweight``."""
+        if self.lightweight and column_lineage:
+            # Test nodes and sections unused by lineage are skipped while streaming
+            self.manifest_dict = read_manifest_sections(self.manifest_path)
+            self.manifest = LightweightManifest.from_dict(self.manifest_dict)
+        elif self.lightweight:
+            self.manifest = load_lightweight_manifest(self.manifest_path)
+        else:
+            self._load_manifest(column_lineage)
+
+    def _load_catalog(self, column_lineage: bool) -> None:
+        """Load the catalog and validate it with dbt-artifacts-parser."""
+        # Importing dbt-artifacts-parser loads every manifest schema version
+        from dbt_artifacts_parser.parser import parse_catalog
+
+        catalog_dict = load_artifact(self.catalog_path, self.json_backend)
+
+        # Remove extra metadata fields to avoid Pydantic validation errors in dbt-artifacts-parser, remove after dbt-artifacts-parser fix
+        if "metadata" in catalog_dict:
+            if "invocation_started_at" in catalog_dict["metadata"]:
+                del catalog_dict["metadata"]["invocation_started_at"]
+
+        self.catalog = parse_catalog(catalog=catalog_dict)
+        if column_lineage:
+            self.catalog_dict = catalog_dict
+
+    def _load_manifest(self, keep_raw: bool) -> None:
+        """Load the manifest and validate it with dbt-artifacts-parser."""
+        from dbt_artifacts_parser.parser import parse_manifest
+
+        manifest_dict = load_artifact(self.manifest_path, self.json_backend)
+
+        # Filter out test nodes to avoid Pydantic validation errors in dbt-artifacts-parser, remove after dbt-artifacts-parser fix
+        if "nodes" in manifest_dict:
+            manifest_dict["nodes"] = {
+                k: v for k, v in manifest_dict["nodes"].items() if not k.startswith("test.")
+            }
 
-            # Filter out test nodes to avoid Pydantic validation errors in dbt-artifacts-parser, remove after dbt-artifacts-parser fix
-            if "nodes" in manifest_dict:
-                manifest_dict["nodes"] = {
-                    k: v for k, v in manifest_dict["nodes"].items() if not k.startswith("test.")
-                }
+        self.manifest = parse_manifest(manifest=manifest_dict)
+        if keep_raw:
+            self.manifest_dict = manifest_dict
 
-            self.manifest = parse_manifest(manifest=manifest_dict)
+    def iter_columns(self) -> Iterator[CatalogColumn]:
+        """
+        Iterate over the catalog columns of the selected nodes.
 
-        with open(self.catalog_path, encoding="utf-8") as fp:
-            catalog_dict = json.load(fp)
+        Columns are read from the raw catalog kept by ``load_file`` when
+        available, which skips the Pydantic column objects entirely.
 
-            # Remove extra metadata fields to avoid Pydantic validation errors in dbt-artifacts-parser, remove after dbt-artifacts-parser fix
-            if "metadata" in catalog_dict:
-                if "invocation_started_at" in catalog_dict["metadata"]:
-                    del catalog_dict["metadata"]["invocation_started_at"]
+        Yields:
+            CatalogColumn per column, in catalog order
+        """
+        selected = self.selected_nodes()
+        if self.catalog_dict is not None:
+            yield from iter_catalog_columns(self.catalog_dict, selected)
+            return
 
-            self.catalog = parse_catalog(catalog=catalog_dict)
+        for node_id, catalog_node in self.catalog.nodes.items():
+            if selected is not None and node_id not in selected:
+                continue
+            # Get catalog columns for this node
+            columns = getattr(catalog_node, "columns", {}) or {}
 
-        return
+            for column_name, column in columns.items():
+                yield CatalogColumn(
+                    _catalog_value(column, "type"),
+                    _catalog_value(column, "index"),
+                    f"{node_id}.{column_name}",
+                    _catalog_value(column, "comment"),
+                    node_id,
+                )
 
     def extract_columns(self) -> dict[str, Any]:
         """
         Extract columns from the dbt project.
 
+        Only the properties selected by ``projection`` are extracted.
+
         Returns:
             Dictionary containing column information
         """
-        nodes: dict[str, Any] = {}
-        for node_id, catalog_node in self.catalog.nodes.items():
-            # Get catalog columns for this node
-            columns = getattr(catalog_node, "columns", {}) or {}
-
-            for column_name, column in columns.items():
-                # Convert column to dict and add computed fields
-                name = f"{node_id}.{column_name}"
-                column_dict = (
-                    column.model_dump()
-                    if hasattr(column, "model_dump")
-                    else (column.dict() if hasattr(column, "dict") else dict(column))
-                )
-                column_dict["name"] = name
-                column_dict["model_name"] = node_id
-                nodes[name] = column_dict
-
-        return nodes
+        properties = self.projection.properties("column")
+        if properties == list(CatalogColumn.__slots__):
+            return {column.name: column.as_dict() for column in self.iter_columns()}
+        return {
+            column.name: {name: getattr(column, name) for name in properties}
+            for column in self.iter_columns()
+        }
 
     def extract_models(self) -> dict[str, Any]:
         """
         Extract models from the dbt project.
 
+        Only the properties selected by ``projection`` are extracted.
+
         Returns:
             Dictionary containing model information
         """
         nodes: dict[str, Any] = {}
+        selected = self.selected_nodes()
+        getters = [
+            (name, _MODEL_PROPERTY_GETTERS[name]) for name in self.projection.properties("model")
+        ]
         for node_id, node in self.manifest.nodes.items():
-            # Get catalog columns for this node
-            catalog_node = self.catalog.nodes.get(node_id)
-            columns = getattr(catalog_node, "columns", {}) or {}
-
-            # Build a minimal node dict containing only the selected attributes
-            db = getattr(node, "database", None) or getattr(node, "database_name", None)
-            schema = getattr(node, "schema_", None) or getattr(node, "schema", None)
-            name = getattr(node, "name", None)
-
-            node_dict: dict[str, Any] = {
-                "fqn": f"{db}.{schema}.{name}",
-                "materialization": getattr(getattr(node, "config", None), "materialized", None),
-                "database": db,
-                "schema": schema,
-                "resource_type": getattr(node, "resource_type", None),
-                # "compiled_code": getattr(node, "compiled_code", None),
-                "columns": columns,
-            }
-
-            nodes[node_id] = node_dict
+            if selected is not None and node_id not in selected:
+                continue
+            nodes[node_id] = {name: getter(node) for name, getter in getters}
 
         return nodes
 
@@ -140,55 +286,139 @@ class DbtDependencyExtractor:
             Dictionary containing model dependency information
         """
         dependencies: dict[str, Any] = {}
+        selected = self.selected_nodes()
         for node_id, node in self.manifest.nodes.items():
+            if selected is not None and node_id not in selected:
+                continue
             dependencies[node_id] = node.depends_on.nodes
 
         return dependencies
 
-    def extract_column_dependencies(self) -> dict[str, list[str]]:
+    def extract_column_dependencies(
+        self, references: Optional[LineageReferences] = None
+    ) -> dict[str, list[str]]:
         """
         Extract column-level dependencies from the dbt project.
 
+        Args:
+            references: Lineage references computed elsewhere (e.g. in the
+                background by ``PipelinedExtraction``); computed here if None
+
         Returns:
             Dictionary mapping column FQN to list of dependent column FQNs.
             Format: {"model.package.model_name.column_name": ["upstream_model.column_name", ...]}
         """
-        extractor = DbtColumnLineageExtractor(self.manifest_path, self.catalog_path)
-        lineage = extractor.build_lineage_map()
+        if references is not None:
+            return self._resolve_lineage_references(references)
+
+        manifest: Artifact = self.manifest_path
+        catalog: Artifact = self.catalog_path
+        if self.manifest_dict is not None and self.catalog_dict is not None:
+            # Reuse the artifacts parsed by load_file
+            manifest, catalog = self.manifest_dict, self.catalog_dict
+        # Only the selected subgraph is parsed with sqlglot
+        references = build_lineage_references(
+            manifest,
+            catalog,
+            jobs=self.jobs,
+            cache=self._lineage_cache(),
+            models=self.selected_nodes(),
+        )
+
+        return self._resolve_lineage_references(references)
+
+    def selected_nodes(self) -> Optional[set[str]]:
+        """
+        Resolve ``select``/``exclude`` against the loaded manifest.
 
-        # Transform lineage into column: [depends_on_columns] format
+        Returns:
+            Unique IDs of the selected manifest nodes, or None if every node is selected
+        """
+        if not self.select and not self.exclude:
+            return None
+        if self._selected_nodes is None:
+            selector = NodeSelector(self.manifest.nodes)
+            self._selected_nodes = selector.select(self.select, self.exclude)
+        return self._selected_nodes
+
+    def _lineage_cache(self) -> Optional[BaseLineageCache]:
+        """Return the column lineage cache selected by ``self.cache``, if any."""
+        if isinstance(self.cache, BaseLineageCache):
+            return self.cache
+        if self.cache is True:
+            return LineageCache(self.project_path / "target" / DEFAULT_CACHE_DIRNAME)
+        if self.cache:
+            return LineageCache(self.cache)
+        return None
+
+    def _build_relation_index(self, node_ids: Iterable[str]) -> RelationIndex:
+        """Index the given nodes by table name, alias and qualified relation name."""
+        index = RelationIndex()
+        manifest_nodes = getattr(getattr(self, "manifest", None), "nodes", None) or {}
+        for node_id in node_ids:
+            node = manifest_nodes.get(node_id)
+            index.add(
+                node_id,
+                identifiers=(
+                    node_id.rsplit(".", 1)[-1],
+                    getattr(node, "name", None),
+                    getattr(node, "alias", None),
+                ),
+                schema=getattr(node, "schema_", None) or getattr(node, "schema", None),
+                database=getattr(node, "database", None),
+            )
+        return index
+
+    def relation_index(self) -> RelationIndex:
+        """
+        Index every node of the loaded manifest by its relation names.
+
+        Returns:
+            RelationIndex resolving table references to this project's nodes
+        """
+        manifest_nodes = getattr(getattr(self, "manifest", None), "nodes", None) or {}
+        return self._build_relation_index(manifest_nodes)
+
+    def _resolve_lineage_references(self, references: LineageReferences) -> dict[str, list[str]]:
+        """Resolve lineage references into column: [depends_on_columns] format."""
+        self.unresolved_references = {}
+        manifest_nodes = getattr(getattr(self, "manifest", None), "nodes", None) or {}
+        indexed = list(references)
+        if self.selected_nodes() is not None:
+            # Selected models may read from unselected models, which have no lineage
+            indexed += [
+                node_id
+                for node_id, node in manifest_nodes.items()
+                if node_id not in references
+                and getattr(node.resource_type, "value", node.resource_type)
+                in ("model", "snapshot")
+            ]
+        relation_index = self._build_relation_index(indexed)
         column_dependencies: dict[str, list[str]] = {}
 
-        for model_id, columns in lineage.items():
-            for column_name, node in columns.items():
-                # Build the full column identifier
-                column_fqn = f"{model_id}.{column_name}"
+        for model_id, columns in references.items():
+            # Upstream nodes of the model, used to disambiguate colliding table names
+            model_node = manifest_nodes.get(model_id)
+            depends_on = getattr(getattr(model_node, "depends_on", None), "nodes", None) or []
 
-                # Extract upstream column dependencies
+            for column_name, column_references in columns.items():
                 upstream_columns = []
-                if hasattr(node, "downstream") and node.downstream:
-                    for downstream_node in node.downstream:
-                        if hasattr(downstream_node, "name") and downstream_node.name:
-                            # The name contains the column name with the table alias
-                            # Example: "model_1.customer_id" or "a.first_name"
-                            parts = downstream_node.name.split(".")
-                            if len(parts) == 2:
-                                table_ref, col_name = parts
-
-                                # Extract model reference from the downstream node's table expression
-                                if hasattr(downstream_node, "expression"):
-                                    expr = downstream_node.expression
-                                    # Try to get the actual table/model name
-                                    if hasattr(expr, "this") and hasattr(expr.this, "this"):
-                                        table_name = str(expr.this.this)
-
-                                        # Find the corresponding model_id for this table reference
-                                        for mid in lineage.keys():
-                                            if mid.endswith(f".{table_name}"):
-                                                upstream_columns.append(f"{mid}.{col_name}")
-                                                break
-
-                column_dependencies[column_fqn] = upstream_columns
+                for reference in column_references:
+                    # Find the corresponding model_id for this table reference
+                    mid = relation_index.resolve(
+                        reference.table,
+                        schema=reference.schema,
+                        database=reference.database,
+                        candidates=depends_on,
+                    )
+                    if mid:
+                        upstream_columns.append(f"{mid}.{reference.column}")
+                    else:
+                        self.unresolved_references.setdefault(
+                            f"{model_id}.{column_name}", []
+                        ).append(reference)
+
+                column_dependencies[f"{model_id}.{column_name}"] = upstream_columns
 
         return column_dependencies
 
@@ -201,11 +431,28 @@ class DbtDependencyExtractor:
         """
         # Ensure manifest/catalog are loaded before extracting
         if not getattr(self, "manifest", None) or not getattr(self, "catalog", None):
-            self.load_file()
+            with measure_stage(self.metrics, "load") as stage:
+                self.load_file()
+                stage.count("manifest_nodes", len(self.manifest.nodes))
+                stage.count("catalog_nodes", len(self.catalog.nodes))
+
+        with measure_stage(self.metrics, "model_extraction") as stage:
+            models = self.extract_models()
+            stage.count("models", len(models))
+        with measure_stage(self.metrics, "column_extraction") as stage:
+            columns = self.extract_columns()
+            stage.count("columns", len(columns))
+        with measure_stage(self.metrics, "model_dependencies") as stage:
+            model_dependencies = self.extract_model_dependencies()
+            stage.count("dependencies", sum(map(len, model_dependencies.values())))
+        with measure_stage(self.metrics, "column_lineage") as stage:
+            column_dependencies = self.extract_column_dependencies()
+            stage.count("columns", len(column_dependencies))
+            stage.count("dependencies", sum(map(len, column_dependencies.values())))
 
         return {
-            "models": self.extract_models(),
-            "columns": self.extract_columns(),
-            "model_dependencies": self.extract_model_dependencies(),
-            "column_dependencies": self.extract_column_dependencies(),
+            "models": models,
+            "columns": columns,
+            "model_dependencies": model_dependencies,
+            "column_dependencies": column_dependencies,
         }
@@ -2,10 +2,13 @@
 Module for building and managing dependency graphs.
 """
 
+from collections.abc import Collection, Iterator, Sequence
 from typing import Any, Optional
 
 import networkx as nx
 
+from dbt_to_cypher.reachability import Impact, ReachabilityIndex
+
 
 class DependencyGraph:
     """
@@ -18,6 +21,8 @@ class DependencyGraph:
     def __init__(self):
         """Initialize an empty dependency graph."""
         self.graph = nx.DiGraph()
+        # (direction, relationship filter) -> (graph size when built, index)
+        self._reachability: dict[tuple, tuple[tuple[int, int], ReachabilityIndex]] = {}
 
     def add_model(self, model_name: str, metadata: Optional[dict] = None):
         """
@@ -28,6 +33,7 @@ class DependencyGraph:
             metadata: Additional model metadata
         """
         self.graph.add_node(model_name, node_type="model", **(metadata or {}))
+        self._reachability.clear()
 
     def add_column(self, model_name: str, column_name: str, metadata: Optional[dict] = None):
         """
@@ -40,6 +46,7 @@ class DependencyGraph:
         """
         column_id = f"{model_name}.{column_name}"
         self.graph.add_node(column_id, node_type="column", **(metadata or {}))
+        self._reachability.clear()
         # Ensure the model node exists and add an edge from model -> column
         if model_name not in self.graph:
             self.add_model(model_name)
@@ -55,6 +62,7 @@ class DependencyGraph:
             relationship: Type of relationship
         """
         self.graph.add_edge(source, target, relationship=relationship)
+        self._reachability.clear()
 
     def get_upstream_dependencies(self, node: str) -> set[str]:
         """
@@ -80,6 +88,167 @@ class DependencyGraph:
         """
         return set(self.graph.successors(node))
 
+    def get_all_upstream_dependencies(
+        self,
+        node: str,
+        max_depth: Optional[int] = None,
+        relationships: Optional[Collection[str]] = None,
+    ) -> set[str]:
+        """
+        Get the transitive upstream dependencies of a node.
+
+        Follows edges backwards like ``get_upstream_dependencies``, repeatedly.
+        Unlimited queries are answered from a cached reachability index that
+        is rebuilt after the graph changes.
+
+        Args:
+            node: Node identifier
+            max_depth: Maximum number of edges to follow (unlimited if None)
+            relationships: Only follow edges of these relationship types
+                (e.g. ``{"depends_on"}`` to skip ``has_column``); all if None
+
+        Returns:
+            Set of upstream node identifiers, excluding the node itself
+        """
+        return self._reachability_index("upstream", relationships).reachable(
+            self._checked(node), max_depth
+        )
+
+    def get_all_downstream_dependencies(
+        self,
+        node: str,
+        max_depth: Optional[int] = None,
+        relationships: Optional[Collection[str]] = None,
+    ) -> set[str]:
+        """
+        Get the transitive downstream dependencies of a node.
+
+        Follows edges forwards like ``get_downstream_dependencies``, repeatedly.
+        Unlimited queries are answered from a cached reachability index that
+        is rebuilt after the graph changes.
+
+        Args:
+            node: Node identifier
+            max_depth: Maximum number of edges to follow (unlimited if None)
+            relationships: Only follow edges of these relationship types
+                (e.g. ``{"depends_on"}`` to skip ``has_column``); all if None
+
+        Returns:
+            Set of downstream node identifiers, excluding the node itself
+        """
+        return self._reachability_index("downstream", relationships).reachable(
+            self._checked(node), max_depth
+        )
+
+    def get_impact(
+        self,
+        nodes: Sequence[str],
+        relationships: Optional[Collection[str]] = None,
+    ) -> dict[str, Impact]:
+        """
+        Find the nodes affected by a change to any of a batch of nodes.
+
+        Affected nodes are those that depend on a changed node, directly or
+        transitively (the ``get_all_upstream_dependencies`` direction). All
+        start nodes are traversed together in a single pass.
+
+        Args:
+            nodes: Changed node identifiers
+            relationships: Only follow edges of these relationship types
+                (e.g. ``{"depends_on"}`` for column-to-column lineage only); all if None
+
+        Returns:
+            Mapping of each affected node to its minimum distance from the
+            changed nodes and the changed nodes that reach it
+        """
+        for node in nodes:
+            self._checked(node)
+        return self._reachability_index("upstream", relationships).multi_source(nodes)
+
+    def _checked(self, node: str) -> str:
+        """Return the node, raising like networkx if it is not in the graph."""
+        if node not in self:
+            raise nx.NetworkXError(f"The node {node} is not in the digraph.")
+        return node
+
+    def _reachability_index(
+        self, direction: str, relationships: Optional[Collection[str]]
+    ) -> ReachabilityIndex:
+        """Return the cached reachability index for a direction and relationship filter."""
+        allowed = frozenset(relationships) if relationships is not None else None
+        key = (direction, allowed)
+        # The size check catches mutations made directly on self.graph
+        size = (self.number_of_nodes(), self.number_of_edges())
+        cached = self._reachability.get(key)
+        if cached is not None and cached[0] == size:
+            return cached[1]
+
+        edges = (
+            (source, target) if direction == "downstream" else (target, source)
+            for source, target, relationship in self.edges()
+            if allowed is None or relationship in allowed
+        )
+        index = ReachabilityIndex(edges)
+        self._reachability[key] = (size, index)
+        return index
+
+    def __contains__(self, node: object) -> bool:
+        """Return True if the node is in the graph."""
+        return node in self.graph
+
+    def number_of_nodes(self) -> int:
+        """Return the number of nodes."""
+        return int(self.graph.number_of_nodes())
+
+    def number_of_edges(self) -> int:
+        """Return the number of edges."""
+        return int(self.graph.number_of_edges())
+
+    def nodes(self) -> Iterator[tuple[str, dict[str, Any]]]:
+        """
+        Iterate over nodes in insertion order.
+
+        Yields:
+            (node, attributes) pairs; attributes include ``node_type`` when set
+        """
+        yield from self.graph.nodes(data=True)
+
+    def node_attributes(self, node: str) -> dict[str, Any]:
+        """
+        Get the attributes of a node.
+
+        Args:
+            node: Node identifier
+
+        Returns:
+            Node attributes, including ``node_type`` when set
+        """
+        return self.graph.nodes[node]  # type: ignore[no-any-return]
+
+    def node_type(self, node: str) -> Optional[str]:
+        """
+        Get the type of a node.
+
+        Args:
+            node: Node identifier
+
+        Returns:
+            ``"model"``, ``"column"``, or None for unknown or untyped nodes
+        """
+        if node not in self.graph:
+            return None
+        return self.graph.nodes[node].get("node_type")  # type: ignore[no-any-return]
+
+    def edges(self) -> Iterator[tuple[str, str, str]]:
+        """
+        Iterate over edges, grouped by source node in insertion order.
+
+        Yields:
+            (source, target, relationship) tuples
+        """
+        for source, target, relationship in self.graph.edges(data="relationship"):
+            yield source, target, relationship or "depends_on"
+
     def to_dict(self) -> dict[str, Any]:
         """
         Export the graph as a dictionary.
@@ -88,3 +257,18 @@ class DependencyGraph:
             Dictionary representation of the graph
         """
         return nx.node_link_data(self.graph)  # type: ignore[no-any-return]
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "DependencyGraph":
+        """
+        Rebuild a graph exported with ``to_dict``.
+
+        Args:
+            data: Dictionary representation of the graph
+
+        Returns:
+            DependencyGraph instance
+        """
+        graph = cls()
+        graph.graph = nx.node_link_graph(data, directed=True)
+        return graph
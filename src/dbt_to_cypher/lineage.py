@@ -0,0 +1,407 @@
+"""
+Module for running dbt-colibri column lineage on already loaded artifacts.
+
+Lineage can be computed serially or split across a process pool. Workers
+return plain ``ColumnReference`` tuples instead of sqlglot lineage nodes so
+that results are cheap to send back to the parent process.
+"""
+
+import logging
+import multiprocessing
+import os
+import threading
+from collections import defaultdict
+from collections.abc import Collection, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, NamedTuple, Optional, Union
+
+from dbt_to_cypher.artifacts import ArtifactSource, load_artifact
+
+if TYPE_CHECKING:
+    from dbt_colibri.lineage_extractor.extractor import DbtColumnLineageExtractor
+
+    from dbt_to_cypher.cache import BaseLineageCache
+
+logger = logging.getLogger(__name__)
+
+# Manifest/catalog given either as already loaded dicts, or as paths or bytes
+# (possibly compressed) read with load_artifact
+Artifact = Union[dict[str, Any], ArtifactSource]
+
+_reader_lock = threading.Lock()
+
+# Number of chunks per worker, so that slow models do not leave workers idle
+_CHUNKS_PER_WORKER = 4
+
+# Lineage extractor of the current worker process, set by _init_worker
+_worker_extractor: Optional["DbtColumnLineageExtractor"] = None
+
+# Manifest and catalog dicts inherited by forked workers, set while their pool runs
+_inherited_artifacts: Optional[tuple[dict[str, Any], dict[str, Any]]] = None
+
+
+class ColumnReference(NamedTuple):
+    """Upstream column referenced by a model column, as written in compiled SQL."""
+
+    table: str
+    schema: Optional[str]
+    database: Optional[str]
+    column: str
+
+
+# Lineage references per model: {model_id: {column_name: [ColumnReference, ...]}}
+LineageReferences = dict[str, dict[str, list[ColumnReference]]]
+
+
+class RelationIndex:
+    """
+    Lookup from relation names to dbt node unique IDs.
+
+    Each node is indexed under its bare table identifiers (name, alias, last
+    segment of the unique ID), under ``schema.identifier`` and under the fully
+    qualified ``database.schema.identifier``, so resolving the table referenced
+    in compiled SQL is a constant-time dictionary lookup.
+    """
+
+    def __init__(self):
+        """Initialize an empty relation index."""
+        self._relations: defaultdict[tuple[str, ...], list[str]] = defaultdict(list)
+
+    def add(
+        self,
+        node_id: str,
+        identifiers: Iterable[Optional[str]],
+        schema: Optional[str] = None,
+        database: Optional[str] = None,
+    ) -> None:
+        """
+        Index a node under its identifiers.
+
+        Args:
+            node_id: dbt unique ID of the node
+            identifiers: Table names the node can be referenced by (name, alias, ...)
+            schema: Schema of the relation
+            database: Database of the relation
+        """
+        schema_key = (schema or "").lower()
+        database_key = (database or "").lower()
+        for identifier in {i.lower() for i in identifiers if i}:
+            keys = [(identifier,), (schema_key, identifier), (database_key, schema_key, identifier)]
+            for key in keys:
+                node_ids = self._relations[key]
+                if node_id not in node_ids:
+                    node_ids.append(node_id)
+
+    def update(self, other: "RelationIndex") -> None:
+        """
+        Add the nodes indexed by another relation index.
+
+        Args:
+            other: Index to merge into this one
+        """
+        for key, node_ids in other._relations.items():
+            merged = self._relations[key]
+            merged.extend(node_id for node_id in node_ids if node_id not in merged)
+
+    def resolve(
+        self,
+        table: str,
+        schema: Optional[str] = None,
+        database: Optional[str] = None,
+        candidates: Optional[Collection[str]] = None,
+    ) -> Optional[str]:
+        """
+        Resolve a (possibly qualified) table reference to a single node ID.
+
+        The most qualified key available is tried first. When several nodes
+        share a name, ``candidates`` (typically the referencing model's
+        ``depends_on`` nodes) is used to disambiguate.
+
+        Args:
+            table: Table identifier as written in SQL
+            schema: Schema qualifier, if any
+            database: Database qualifier, if any
+            candidates: Node IDs to prefer when the reference is ambiguous
+
+        Returns:
+            The matching node ID, or None if there is no unambiguous match
+        """
+        table_key = table.lower()
+        schema_key = (schema or "").lower()
+        keys: list[tuple[str, ...]] = []
+        if schema_key and database:
+            keys.append((database.lower(), schema_key, table_key))
+        if schema_key:
+            keys.append((schema_key, table_key))
+        keys.append((table_key,))
+
+        for key in keys:
+            matches = self._relations.get(key)
+            if not matches:
+                continue
+            if len(matches) > 1 and candidates:
+                matches = [node_id for node_id in matches if node_id in candidates]
+            return matches[0] if len(matches) == 1 else None
+        return None
+
+
+class _LoadedArtifact:
+    """Stand-in for an artifact path whose JSON has already been loaded."""
+
+    def __init__(self, data: dict[str, Any]):
+        self.data = data
+
+
+@contextmanager
+def _loaded_artifact_reader() -> Iterator[None]:
+    """
+    Let dbt-colibri accept already loaded artifacts in place of file paths.
+
+    ``DbtColumnLineageExtractor`` only accepts paths and reads them through
+    ``json_utils.read_json``; wrapping that function while an extractor is
+    created lets us hand over the dicts parsed by ``DbtDependencyExtractor``
+    without touching disk again. Regular paths are still delegated to the
+    original reader, which is restored when the context exits.
+    """
+    from dbt_colibri.utils import json_utils
+
+    # Serializes threads creating extractors, so that each restores the original reader
+    with _reader_lock:
+        read_json = json_utils.read_json
+
+        def read_loaded_or_json(file_path: Any) -> Any:
+            if isinstance(file_path, _LoadedArtifact):
+                return file_path.data
+            return read_json(file_path)
+
+        json_utils.read_json = read_loaded_or_json
+        try:
+            yield
+        finally:
+            json_utils.read_json = read_json
+
+
+def create_lineage_extractor(
+    manifest: dict[str, Any],
+    catalog: dict[str, Any],
+    selected_models: Optional[list[str]] = None,
+) -> "DbtColumnLineageExtractor":
+    """
+    Create a dbt-colibri lineage extractor from raw manifest and catalog dicts.
+
+    Args:
+        manifest: Raw manifest dict (as loaded from ``manifest.json``)
+        catalog: Raw catalog dict (as loaded from ``catalog.json``)
+        selected_models: Optional list of model unique IDs to restrict lineage to
+
+    Returns:
+        DbtColumnLineageExtractor sharing the given dicts
+    """
+    from dbt_colibri.lineage_extractor.extractor import DbtColumnLineageExtractor
+
+    with _loaded_artifact_reader():
+        return DbtColumnLineageExtractor(
+            _LoadedArtifact(manifest), _LoadedArtifact(catalog), selected_models or []
+        )
+
+
+def _create_extractor(manifest: Artifact, catalog: Artifact) -> "DbtColumnLineageExtractor":
+    """Create a lineage extractor from loaded dicts or artifact sources."""
+    # Artifacts are read here rather than by dbt-colibri, which only reads plain files
+    return create_lineage_extractor(_read_artifact(manifest), _read_artifact(catalog))
+
+
+def _read_artifact(artifact: Artifact) -> dict[str, Any]:
+    """Return an artifact dict, reading it with ``load_artifact`` if given a path or bytes."""
+    if isinstance(artifact, dict):
+        return artifact
+    return load_artifact(artifact)  # type: ignore[no-any-return]
+
+
+def extract_lineage_references(lineage: dict[str, Any]) -> LineageReferences:
+    """
+    Reduce a dbt-colibri lineage map to the upstream columns each column reads.
+
+    Args:
+        lineage: Output of ``DbtColumnLineageExtractor.build_lineage_map()``
+
+    Returns:
+        Mapping of model ID to column name to upstream column references
+    """
+    references: LineageReferences = {}
+    for model_id, columns in lineage.items():
+        model_references: dict[str, list[ColumnReference]] = {}
+        for column_name, node in columns.items():
+            column_references = []
+            for downstream_node in getattr(node, "downstream", None) or []:
+                # The name contains the column name with the table alias
+                # Example: "model_1.customer_id" or "a.first_name"
+                name = getattr(downstream_node, "name", None)
+                parts = name.split(".") if name else []
+                if len(parts) != 2:
+                    continue
+
+                # The table expression holds the actual table/model name and qualifiers
+                expr: Any = getattr(downstream_node, "expression", None)
+                if hasattr(expr, "this") and hasattr(expr.this, "this"):
+                    column_references.append(
+                        ColumnReference(
+                            table=str(expr.this.this),
+                            schema=getattr(expr, "db", None) or None,
+                            database=getattr(expr, "catalog", None) or None,
+                            column=parts[1],
+                        )
+                    )
+            model_references[column_name] = column_references
+        references[model_id] = model_references
+    return references
+
+
+def _init_worker(manifest: Optional[Artifact] = None, catalog: Optional[Artifact] = None) -> None:
+    """Build the lineage extractor once per worker process, from inherited artifacts if none given."""
+    global _worker_extractor
+    if manifest is None or catalog is None:
+        assert _inherited_artifacts is not None, "no artifacts to inherit"
+        manifest, catalog = _inherited_artifacts
+    _worker_extractor = _create_extractor(manifest, catalog)
+
+
+def _lineage_worker(model_ids: list[str]) -> LineageReferences:
+    """Compute lineage references for a chunk of models in a worker process."""
+    assert _worker_extractor is not None, "worker not initialized"
+    _worker_extractor.selected_models = set(model_ids)
+    return extract_lineage_references(_worker_extractor.build_lineage_map())
+
+
+def _lineage_models(manifest: dict[str, Any]) -> list[str]:
+    """List the models dbt-colibri computes lineage for, in manifest order."""
+    return [
+        node_id
+        for node_id, node in manifest.get("nodes", {}).items()
+        if node.get("resource_type") in ("model", "snapshot")
+    ]
+
+
+def _compute_lineage_references(
+    manifest: Artifact,
+    catalog: Artifact,
+    models: Optional[Collection[str]],
+    jobs: int,
+) -> LineageReferences:
+    """Run dbt-colibri for the given models (all lineage models if None)."""
+    if models is not None and not models:
+        return {}
+    if jobs <= 1:
+        extractor = _create_extractor(manifest, catalog)
+        if models is not None:
+            extractor.selected_models = set(models)
+        return extract_lineage_references(extractor.build_lineage_map())
+
+    manifest_dict = _read_artifact(manifest)
+    # Chunk in manifest order so that merged results are deterministic
+    models = [
+        model_id
+        for model_id in _lineage_models(manifest_dict)
+        if models is None or model_id in models
+    ]
+    if not models:
+        return {}
+
+    chunk_size = max(1, -(-len(models) // (jobs * _CHUNKS_PER_WORKER)))
+    chunks = [models[i : i + chunk_size] for i in range(0, len(models), chunk_size)]
+    logger.info(f"Computing column lineage for {len(models)} models with {jobs} workers")
+
+    global _inherited_artifacts
+    context = multiprocessing.get_context()
+    initargs: tuple[Artifact, ...]
+    if context.get_start_method() == "fork":
+        # Forked workers inherit the loaded dicts, shared copy-on-write, instead
+        # of each receiving a pickled copy
+        _inherited_artifacts = (manifest_dict, _read_artifact(catalog))
+        initargs = ()
+    else:
+        initargs = (manifest_dict, catalog)
+
+    references: LineageReferences = {}
+    try:
+        with ProcessPoolExecutor(
+            max_workers=min(jobs, len(chunks)),
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=initargs,
+        ) as executor:
+            # map() yields results in submission order, which keeps the merge deterministic
+            for chunk_references in executor.map(_lineage_worker, chunks):
+                references.update(chunk_references)
+    finally:
+        _inherited_artifacts = None
+    return references
+
+
+def build_lineage_references(
+    manifest: Artifact,
+    catalog: Artifact,
+    jobs: int = 1,
+    cache: Optional["BaseLineageCache"] = None,
+    models: Optional[Collection[str]] = None,
+) -> LineageReferences:
+    """
+    Compute column lineage references for all (or the given) models.
+
+    With ``jobs > 1`` models are split into chunks that are processed by a
+    pool of worker processes. With a ``cache``, only models whose compiled SQL
+    or upstream schemas changed since a previous run are re-parsed. Results
+    are merged in manifest order, so the output is identical to a serial,
+    uncached run.
+
+    Args:
+        manifest: Manifest dict or path to ``manifest.json``
+        catalog: Catalog dict or path to ``catalog.json``
+        jobs: Number of worker processes; 0 uses all available CPUs
+        cache: Optional on-disk cache of per-model lineage
+        models: Unique IDs of the models to compute lineage for (all if None)
+
+    Returns:
+        Mapping of model ID to column name to upstream column references
+    """
+    if jobs == 0:
+        jobs = os.cpu_count() or 1
+
+    if cache is None:
+        return _compute_lineage_references(manifest, catalog, models, jobs)
+
+    manifest_dict = _read_artifact(manifest)
+    catalog_dict = _read_artifact(catalog)
+    selected = models
+    models = [
+        model_id
+        for model_id in _lineage_models(manifest_dict)
+        if selected is None or model_id in selected
+    ]
+    keys = {model_id: cache.model_key(manifest_dict, catalog_dict, model_id) for model_id in models}
+
+    cached: dict[str, Optional[dict[str, list[ColumnReference]]]] = {}
+    missing = []
+    for model_id in models:
+        hit, model_references = cache.get(keys[model_id])
+        if hit:
+            cached[model_id] = model_references
+        else:
+            missing.append(model_id)
+
+    computed = (
+        _compute_lineage_references(manifest_dict, catalog_dict, missing, jobs) if missing else {}
+    )
+    for model_id in missing:
+        # Models without lineage are cached too, so they are not retried every run
+        cache.put(keys[model_id], computed.get(model_id))
+    cache.prune()
+    cache.log_stats()
+
+    references: LineageReferences = {}
+    for model_id in models:
+        model_references = cached[model_id] if model_id in cached else computed.get(model_id)
+        if model_references is not None:
+            references[model_id] = model_references
+    return references
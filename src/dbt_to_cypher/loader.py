@@ -0,0 +1,253 @@
+"""
+Module for loading dependency graphs straight into Neo4j over Bolt.
+
+The loader runs the batched ``UNWIND`` statements of ``CypherGenerator`` in
+one transaction per batch: key constraints first, then node batches spread
+across a pool of writer threads sharing the driver's connection pool, then
+relationship batches in order on a single writer, since concurrent
+relationship writes lock the same nodes and would deadlock. Transactions
+that fail with a transient error are retried with exponential backoff.
+
+The official ``neo4j`` driver is only needed for ``Neo4jLoader.connect``;
+any object with the same ``session``/``begin_transaction``/``run`` interface
+can be passed to ``Neo4jLoader`` directly.
+"""
+
+import logging
+import time
+from collections.abc import Iterable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING, Any, NamedTuple, Optional
+
+from dbt_to_cypher.cypher import DEFAULT_BATCH_SIZE, CypherGenerator
+
+if TYPE_CHECKING:
+    from dbt_to_cypher.graph import DependencyGraph
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WORKERS = 4
+DEFAULT_MAX_RETRIES = 5
+DEFAULT_BACKOFF = 0.5
+MAX_BACKOFF = 30.0
+
+# Retryable driver errors, for drivers whose exceptions lack is_retryable()
+_RETRYABLE_ERRORS = {"TransientError", "ServiceUnavailable", "SessionExpired"}
+
+
+class LoadSummary(NamedTuple):
+    """Counts of a load into Neo4j."""
+
+    transactions: int
+    rows: int
+    retries: int
+
+
+def is_retryable(error: Exception) -> bool:
+    """
+    Tell whether a failed transaction may succeed when retried.
+
+    Args:
+        error: Exception raised by the driver
+
+    Returns:
+        True for transient errors (deadlocks, leader changes, lost connections)
+    """
+    check = getattr(error, "is_retryable", None)
+    if callable(check):
+        return bool(check())
+    return type(error).__name__ in _RETRYABLE_ERRORS
+
+
+class Neo4jLoader:
+    """
+    Write a dbt dependency graph to a Neo4j database through a Bolt driver.
+
+    The loader can be used as a context manager; a driver created by
+    ``connect`` is closed on exit.
+    """
+
+    def __init__(
+        self,
+        driver: Any,
+        database: Optional[str] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        workers: int = DEFAULT_WORKERS,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        backoff: float = DEFAULT_BACKOFF,
+    ):
+        """
+        Initialize the loader with a driver.
+
+        Args:
+            driver: ``neo4j.Driver`` or compatible object
+            database: Database to write to (default: the server's default database)
+            batch_size: Maximum number of rows per transaction
+            workers: Number of concurrent writers for node batches
+            max_retries: Maximum number of retries of a transaction
+            backoff: Delay before the first retry in seconds, doubled on each retry
+        """
+        if workers < 1:
+            raise ValueError("workers must be a positive integer")
+        if batch_size < 1:
+            raise ValueError("batch_size must be a positive integer")
+        self.driver = driver
+        self.database = database
+        self.batch_size = batch_size
+        self.workers = workers
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self._owns_driver = False
+
+    @classmethod
+    def connect(
+        cls,
+        uri: str,
+        auth: Optional[tuple[str, str]] = None,
+        workers: int = DEFAULT_WORKERS,
+        **kwargs: Any,
+    ) -> "Neo4jLoader":
+        """
+        Create a loader with a new pooled ``neo4j`` driver.
+
+        Args:
+            uri: Bolt or neo4j URI, e.g. ``neo4j://localhost:7687``
+            auth: Optional (user, password) pair
+            workers: Number of concurrent writers; the connection pool is sized to match
+            **kwargs: Further ``Neo4jLoader`` arguments
+
+        Returns:
+            Neo4jLoader owning the driver
+
+        Raises:
+            ImportError: If the ``neo4j`` package is not installed
+        """
+        try:
+            from neo4j import GraphDatabase
+        except ImportError as e:
+            raise ImportError(
+                "Loading into Neo4j requires the neo4j driver: pip install 'dbt-to-cypher[neo4j]'"
+            ) from e
+
+        driver = GraphDatabase.driver(uri, auth=auth, max_connection_pool_size=workers + 1)
+        loader = cls(driver, workers=workers, **kwargs)
+        loader._owns_driver = True
+        return loader
+
+    def close(self) -> None:
+        """Close the driver if it was created by ``connect``."""
+        if self._owns_driver:
+            self.driver.close()
+
+    def __enter__(self) -> "Neo4jLoader":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def load(
+        self,
+        graph: "DependencyGraph",
+        nodes: Optional[Iterable[str]] = None,
+        edges: Optional[Iterable[tuple[str, str, str]]] = None,
+    ) -> LoadSummary:
+        """
+        Write a graph with batched MERGE statements.
+
+        Args:
+            graph: DependencyGraph to load
+            nodes: Only write these nodes of the graph (all if None), e.g. to
+                load a graph in parts
+            edges: Only write these (source, target, relationship) edges (all if None)
+
+        Returns:
+            LoadSummary of the load
+        """
+        generator = CypherGenerator(graph)
+        summary = self.run_statements(
+            (query, {}) for query in generator.generate_constraint_queries()
+        )
+
+        summary = _add(
+            summary,
+            self._write_concurrently(generator.iter_node_batches(self.batch_size, nodes=nodes)),
+        )
+
+        summary = _add(
+            summary,
+            self.run_statements(generator.iter_relationship_batches(self.batch_size, edges=edges)),
+        )
+        logger.info(
+            f"Loaded {summary.rows} rows into Neo4j in {summary.transactions} transactions "
+            f"({summary.retries} retries)"
+        )
+        return summary
+
+    def run_statements(self, statements: Iterable[tuple[str, dict[str, Any]]]) -> LoadSummary:
+        """
+        Run statements in order, one transaction each.
+
+        Args:
+            statements: (statement, parameters) pairs
+
+        Returns:
+            LoadSummary of the statements
+        """
+        summary = LoadSummary(0, 0, 0)
+        for statement in statements:
+            summary = _add(summary, self._write(statement))
+        return summary
+
+    def _write_concurrently(self, statements: Iterable[tuple[str, dict[str, Any]]]) -> LoadSummary:
+        """
+        Run statements on the writer threads, one transaction each.
+
+        At most ``2 * workers`` statements are generated ahead of the writers,
+        so batches are built as they are written. On the first failed
+        statement, statements not yet started are cancelled and the error is
+        raised.
+        """
+        summary = LoadSummary(0, 0, 0)
+        max_in_flight = 2 * self.workers
+        in_flight: set[Future[LoadSummary]] = set()
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            try:
+                for statement in statements:
+                    if len(in_flight) >= max_in_flight:
+                        done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            summary = _add(summary, future.result())
+                    in_flight.add(executor.submit(self._write, statement))
+                while in_flight:
+                    done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        summary = _add(summary, future.result())
+            except BaseException:
+                for future in in_flight:
+                    future.cancel()
+                raise
+        return summary
+
+    def _write(self, statement: tuple[str, dict[str, Any]]) -> LoadSummary:
+        """Run a statement in its own transaction, retrying transient errors."""
+        query, parameters = statement
+        retries = 0
+        while True:
+            try:
+                with self.driver.session(database=self.database) as session:
+                    with session.begin_transaction() as tx:
+                        tx.run(query, parameters)
+                        tx.commit()
+                return LoadSummary(1, len(parameters.get("rows", ())), retries)
+            except Exception as e:
+                if retries >= self.max_retries or not is_retryable(e):
+                    raise
+                delay = min(self.backoff * 2**retries, MAX_BACKOFF)
+                retries += 1
+                logger.warning(f"Transient Neo4j error, retry {retries} in {delay:.1f}s: {e}")
+                time.sleep(delay)
+
+
+def _add(left: LoadSummary, right: LoadSummary) -> LoadSummary:
+    """Sum two load summaries."""
+    return LoadSummary(*(a + b for a, b in zip(left, right)))
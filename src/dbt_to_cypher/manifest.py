@@ -0,0 +1,298 @@
+"""
+Module for streaming dbt manifest files without full Pydantic validation.
+
+The lightweight loader reads ``manifest.json`` incrementally and keeps only the
+node fields needed to build the model-level graph, skipping test nodes and
+unrelated manifest sections (macros, docs, ...) while streaming. Compressed
+manifests are decompressed on the fly.
+"""
+
+import json
+import re
+from collections.abc import Collection, Iterator
+from typing import Any, NamedTuple, Optional, TextIO
+
+from dbt_to_cypher.artifacts import ArtifactSource, open_artifact_text
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_DEFAULT_CHUNK_SIZE = 1 << 20
+
+# Top-level manifest sections read by dbt-colibri column lineage
+LINEAGE_SECTIONS = frozenset(
+    {"metadata", "nodes", "sources", "exposures", "parent_map", "child_map"}
+)
+
+
+class NodeConfig(NamedTuple):
+    """Subset of a manifest node ``config`` block."""
+
+    materialized: Optional[str]
+
+
+class DependsOn(NamedTuple):
+    """Subset of a manifest node ``depends_on`` block."""
+
+    nodes: list[str]
+
+
+class ManifestNode(NamedTuple):
+    """
+    Projection of a manifest node.
+
+    Attribute names mirror the dbt-artifacts-parser models so that lightweight
+    and fully validated manifests can be consumed by the same code.
+    """
+
+    name: Optional[str]
+    alias: Optional[str]
+    database: Optional[str]
+    schema: Optional[str]
+    resource_type: Optional[str]
+    config: NodeConfig
+    depends_on: DependsOn
+    # Fields used by node selection
+    package_name: Optional[str] = None
+    original_file_path: Optional[str] = None
+    fqn: tuple[str, ...] = ()
+    tags: tuple[str, ...] = ()
+
+    @classmethod
+    def from_dict(cls, node: dict[str, Any]) -> "ManifestNode":
+        """Project a raw manifest node dict onto the fields used for extraction."""
+        config = node.get("config") or {}
+        depends_on = node.get("depends_on") or {}
+        return cls(
+            name=node.get("name"),
+            alias=node.get("alias"),
+            database=node.get("database"),
+            schema=node.get("schema"),
+            resource_type=node.get("resource_type"),
+            config=NodeConfig(materialized=config.get("materialized")),
+            depends_on=DependsOn(nodes=list(depends_on.get("nodes") or [])),
+            package_name=node.get("package_name"),
+            original_file_path=node.get("original_file_path"),
+            fqn=tuple(node.get("fqn") or ()),
+            tags=tuple(node.get("tags") or ()),
+        )
+
+
+class LightweightManifest(NamedTuple):
+    """Manifest holding only metadata and projected nodes."""
+
+    metadata: dict[str, Any]
+    nodes: dict[str, ManifestNode]
+
+    @classmethod
+    def from_dict(cls, manifest: dict[str, Any]) -> "LightweightManifest":
+        """Project a raw (possibly partial) manifest dict."""
+        return cls(
+            metadata=manifest.get("metadata") or {},
+            nodes={
+                node_id: ManifestNode.from_dict(node)
+                for node_id, node in (manifest.get("nodes") or {}).items()
+            },
+        )
+
+
+class _JsonStream:
+    """
+    Minimal incremental JSON reader over a text file handle.
+
+    Containers are walked entry by entry so that only one value has to be held
+    in memory at a time; scalar and selected values are decoded with the
+    stdlib decoder.
+    """
+
+    def __init__(self, fp: TextIO, chunk_size: int = _DEFAULT_CHUNK_SIZE):
+        self._fp = fp
+        self._chunk_size = chunk_size
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+        self._decoder = json.JSONDecoder()
+
+    def _fill(self) -> bool:
+        """Append more data to the buffer, returning False at end of file."""
+        if self._eof:
+            return False
+        # Grow reads with the pending buffer so large values are not re-scanned
+        # once per chunk
+        pending = len(self._buffer) - self._pos
+        data = self._fp.read(max(self._chunk_size, pending))
+        if not data:
+            self._eof = True
+            return False
+        self._buffer = self._buffer[self._pos :] + data
+        self._pos = 0
+        return True
+
+    def _error(self, message: str) -> json.JSONDecodeError:
+        return json.JSONDecodeError(message, self._buffer, self._pos)
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next character without consuming it."""
+        while True:
+            self._pos = _WHITESPACE.match(self._buffer, self._pos).end()  # type: ignore[union-attr]
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                raise self._error("Unexpected end of JSON input")
+
+    def _expect(self, char: str) -> None:
+        if self.peek() != char:
+            raise self._error(f"Expecting '{char}'")
+        self._pos += 1
+
+    def value(self) -> Any:
+        """Decode and return the next complete JSON value."""
+        self.peek()
+        while True:
+            try:
+                obj, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # A number ending exactly at the buffer boundary may be truncated
+            if end == len(self._buffer) and self._fill():
+                continue
+            self._pos = end
+            return obj
+
+    def items(self) -> Iterator[str]:
+        """
+        Iterate over the keys of the object at the current position.
+
+        After each key is yielded, the caller must consume the value with
+        ``value()``, ``items()``, ``elements()`` or ``skip()``.
+        """
+        self._expect("{")
+        if self.peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            key = self.value()
+            self._expect(":")
+            yield key
+            separator = self.peek()
+            self._pos += 1
+            if separator == "}":
+                return
+            if separator != ",":
+                raise self._error("Expecting ',' delimiter")
+
+    def elements(self) -> Iterator[None]:
+        """
+        Iterate over the array at the current position.
+
+        After each step the caller must consume the element value.
+        """
+        self._expect("[")
+        if self.peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            yield None
+            separator = self.peek()
+            self._pos += 1
+            if separator == "]":
+                return
+            if separator != ",":
+                raise self._error("Expecting ',' delimiter")
+
+    def skip(self) -> None:
+        """Consume the next value without materializing containers."""
+        char = self.peek()
+        if char == "{":
+            for _ in self.items():
+                self.skip()
+        elif char == "[":
+            for _ in self.elements():
+                self.skip()
+        else:
+            self.value()
+
+
+def iter_manifest_sections(
+    fp: TextIO,
+    sections: Collection[str],
+    chunk_size: int = _DEFAULT_CHUNK_SIZE,
+) -> Iterator[tuple[str, str, Any]]:
+    """
+    Stream entries of selected top-level manifest sections.
+
+    The ``nodes`` section is yielded entry by entry as ``(section, node_id, node)``;
+    other selected sections are yielded whole with an empty key. Test nodes and
+    unselected sections are skipped without being decoded into Python objects.
+
+    Args:
+        fp: Text file handle positioned at the start of a manifest
+        sections: Top-level keys to keep, e.g. ``{"metadata", "nodes"}``
+        chunk_size: Number of characters read from the file at a time
+
+    Yields:
+        Tuples of (section name, entry key, decoded value)
+    """
+    stream = _JsonStream(fp, chunk_size)
+    for section in stream.items():
+        if section not in sections:
+            stream.skip()
+        elif section == "nodes" and stream.peek() == "{":
+            for node_id in stream.items():
+                if node_id.startswith("test."):
+                    stream.skip()
+                else:
+                    yield section, node_id, stream.value()
+        else:
+            yield section, "", stream.value()
+
+
+def read_manifest_sections(
+    manifest_path: ArtifactSource,
+    sections: Collection[str] = LINEAGE_SECTIONS,
+) -> dict[str, Any]:
+    """
+    Stream a manifest file into a raw dict holding only the selected sections.
+
+    Args:
+        manifest_path: Path to ``manifest.json``, possibly compressed, or its bytes
+        sections: Top-level keys to keep (defaults to those used for column lineage)
+
+    Returns:
+        Partial manifest dict without test nodes
+
+    Raises:
+        json.JSONDecodeError: If the file is not valid JSON
+    """
+    manifest: dict[str, Any] = {"nodes": {}} if "nodes" in sections else {}
+    with open_artifact_text(manifest_path) as fp:
+        for section, key, value in iter_manifest_sections(fp, sections):
+            if section == "nodes" and key:
+                manifest["nodes"][key] = value
+            else:
+                manifest[section] = value
+    return manifest
+
+
+def load_lightweight_manifest(manifest_path: ArtifactSource) -> LightweightManifest:
+    """
+    Stream a manifest file and keep only the fields used for model extraction.
+
+    Args:
+        manifest_path: Path to ``manifest.json``, possibly compressed, or its bytes
+
+    Returns:
+        LightweightManifest with metadata and projected non-test nodes
+
+    Raises:
+        json.JSONDecodeError: If the file is not valid JSON
+    """
+    metadata: dict[str, Any] = {}
+    nodes: dict[str, ManifestNode] = {}
+    with open_artifact_text(manifest_path) as fp:
+        for section, key, value in iter_manifest_sections(fp, {"metadata", "nodes"}):
+            if section == "metadata":
+                metadata = value
+            else:
+                nodes[key] = ManifestNode.from_dict(value)
+    return LightweightManifest(metadata=metadata, nodes=nodes)
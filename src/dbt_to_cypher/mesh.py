@@ -0,0 +1,205 @@
+"""
+Module for extracting several dbt projects (a dbt mesh) into one set of dependencies.
+
+Projects are extracted independently, concurrently in a process pool, and
+their dependencies merged. Cross-project ``ref``s already appear in a
+project's ``depends_on`` under the upstream model's unique ID, so model
+edges line up once the projects are merged. Column references to tables of
+another project cannot be resolved inside the referencing project; they are
+stitched afterwards against the relations of all projects, accepting only
+matches among the referencing model's ``depends_on`` nodes.
+"""
+
+import logging
+import os
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, NamedTuple, Optional, Union
+
+from dbt_to_cypher.cache import BaseLineageCache, LineageCache
+from dbt_to_cypher.extractor import DbtDependencyExtractor
+from dbt_to_cypher.lineage import ColumnReference, RelationIndex
+from dbt_to_cypher.metrics import MetricsRecorder, measure_stage
+from dbt_to_cypher.projection import PropertyProjection
+
+logger = logging.getLogger(__name__)
+
+
+class ProjectDependencies(NamedTuple):
+    """Dependencies of one project, with what is needed to stitch it to others."""
+
+    # Result of DbtDependencyExtractor.extract_all
+    dependencies: dict[str, Any]
+    relations: RelationIndex
+    # Column ID -> references the project could not resolve to its own nodes
+    unresolved_references: dict[str, list[ColumnReference]]
+
+
+def extract_project(
+    project_path: Union[Path, str],
+    lightweight: bool = False,
+    cache: Union[bool, Path, str, BaseLineageCache] = False,
+    select: Optional[Sequence[str]] = None,
+    exclude: Optional[Sequence[str]] = None,
+    projection: Optional[PropertyProjection] = None,
+) -> ProjectDependencies:
+    """
+    Extract one project of a mesh; runs in a worker process.
+
+    Args:
+        project_path: Path to the dbt project directory
+        lightweight: Stream the manifest instead of validating it with Pydantic
+        cache: Cache column lineage per model on disk
+        select: dbt selection expressions; only selected nodes are extracted
+        exclude: dbt selection expressions of nodes to leave out
+        projection: Node properties to extract
+
+    Returns:
+        ProjectDependencies of the project
+    """
+    extractor = DbtDependencyExtractor(
+        str(project_path),
+        lightweight=lightweight,
+        cache=cache,
+        select=select,
+        exclude=exclude,
+        projection=projection,
+    )
+    dependencies = extractor.extract_all()
+    return ProjectDependencies(
+        dependencies, extractor.relation_index(), extractor.unresolved_references
+    )
+
+
+def _is_missing(value: Any) -> bool:
+    return value is None or (isinstance(value, (dict, list, str)) and not value)
+
+
+def _merge_nodes(merged: dict[str, Any], nodes: dict[str, Any]) -> None:
+    """Merge node attributes; values missing in one project are taken from another."""
+    for node_id, attrs in nodes.items():
+        existing = merged.get(node_id)
+        if existing is None:
+            merged[node_id] = dict(attrs)
+            continue
+        for name, value in attrs.items():
+            if _is_missing(existing.get(name)) and not _is_missing(value):
+                existing[name] = value
+
+
+def _merge_edges(merged: dict[str, list[str]], edges: dict[str, Any]) -> None:
+    """Merge upstream lists, keeping their order and dropping duplicates."""
+    for node_id, upstreams in edges.items():
+        existing = merged.setdefault(node_id, [])
+        existing.extend(upstream for upstream in upstreams if upstream not in existing)
+
+
+def merge_projects(projects: Sequence[ProjectDependencies]) -> dict[str, Any]:
+    """
+    Merge the dependencies of several projects and stitch cross-project column lineage.
+
+    A node extracted by several projects (e.g. a public model and its stub in
+    a downstream project's manifest) is merged into one, values present in
+    one project filling those missing in another.
+
+    Args:
+        projects: Extracted projects, in the order their attributes take precedence
+
+    Returns:
+        Dependencies in the format of ``extract_dependencies``
+    """
+    models: dict[str, Any] = {}
+    columns: dict[str, Any] = {}
+    model_dependencies: dict[str, list[str]] = {}
+    column_dependencies: dict[str, list[str]] = {}
+    relations = RelationIndex()
+    for project in projects:
+        _merge_nodes(models, project.dependencies["models"])
+        _merge_nodes(columns, project.dependencies["columns"])
+        _merge_edges(model_dependencies, project.dependencies["model_dependencies"])
+        _merge_edges(column_dependencies, project.dependencies["column_dependencies"])
+        relations.update(project.relations)
+
+    stitched = 0
+    for project in projects:
+        for column_id, references in project.unresolved_references.items():
+            model_id = column_id.rsplit(".", 1)[0]
+            # A cross-project ref is always among the model's depends_on
+            candidates = model_dependencies.get(model_id) or []
+            for reference in references:
+                upstream = relations.resolve(
+                    reference.table,
+                    schema=reference.schema,
+                    database=reference.database,
+                    candidates=candidates,
+                )
+                if upstream is None or upstream not in candidates:
+                    continue
+                upstream_column = f"{upstream}.{reference.column}"
+                upstreams = column_dependencies.setdefault(column_id, [])
+                if upstream_column not in upstreams:
+                    upstreams.append(upstream_column)
+                    stitched += 1
+    logger.info(f"Stitched {stitched} cross-project column dependencies")
+
+    return {
+        "models": models,
+        "columns": columns,
+        "model_dependencies": model_dependencies,
+        "column_dependencies": column_dependencies,
+    }
+
+
+def extract_projects(
+    project_paths: Sequence[Union[Path, str]],
+    lightweight: bool = False,
+    jobs: int = 1,
+    cache: Union[bool, Path, str, BaseLineageCache] = False,
+    select: Optional[Sequence[str]] = None,
+    exclude: Optional[Sequence[str]] = None,
+    metrics: Optional[MetricsRecorder] = None,
+    projection: Optional[PropertyProjection] = None,
+) -> dict[str, Any]:
+    """
+    Extract several dbt projects into one set of dependencies.
+
+    With ``jobs > 1`` projects are extracted concurrently in a pool of worker
+    processes, one project per task; column lineage within a project then
+    runs serially. Results are merged in the order of ``project_paths``, so
+    the output does not depend on ``jobs``.
+
+    Args:
+        project_paths: Paths to the dbt project directories
+        lightweight: Stream the manifests instead of validating them with Pydantic
+        jobs: Number of worker processes; 0 uses all CPUs
+        cache: Cache column lineage per model on disk (a path is shared by all projects)
+        select: dbt selection expressions, applied to each project
+        exclude: dbt selection expressions of nodes to leave out
+        metrics: Optional recorder measuring extraction and stitching
+        projection: Node properties to extract
+
+    Returns:
+        Dependencies in the format of ``extract_dependencies``
+    """
+    if jobs == 0:
+        jobs = os.cpu_count() or 1
+    if isinstance(cache, (Path, str)):
+        # Create or clear the shared cache once, before the workers use it
+        cache = LineageCache(cache)
+    arguments = [(path, lightweight, cache, select, exclude, projection) for path in project_paths]
+
+    with measure_stage(metrics, "project_extraction") as stage:
+        if jobs <= 1 or len(arguments) <= 1:
+            projects = [extract_project(*args) for args in arguments]
+        else:
+            logger.info(f"Extracting {len(arguments)} projects with {jobs} workers")
+            with ProcessPoolExecutor(max_workers=min(jobs, len(arguments))) as executor:
+                # map() yields results in submission order, which keeps the merge deterministic
+                projects = list(executor.map(extract_project, *zip(*arguments)))
+        stage.count("projects", len(projects))
+
+    with measure_stage(metrics, "stitching") as stage:
+        dependencies = merge_projects(projects)
+        stage.count("models", len(dependencies["models"]))
+    return dependencies
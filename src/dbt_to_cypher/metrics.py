@@ -0,0 +1,202 @@
+"""
+Module for per-stage timing, memory and counter instrumentation.
+
+A ``MetricsRecorder`` measures named pipeline stages (artifact loading,
+model and column extraction, column lineage, graph build, Cypher
+generation, ...). Each stage records wall and CPU time, the peak resident
+set size of the process, optionally the peak memory traced by
+``tracemalloc``, and item counts set by the stage. Finished stages are
+passed to hooks, so that a metrics client can forward them as they happen,
+and can be written as a JSON report.
+"""
+
+import json
+import logging
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from pathlib import Path
+from typing import Any, NamedTuple, Optional, TextIO, Union
+
+logger = logging.getLogger(__name__)
+
+
+class StageMetrics(NamedTuple):
+    """Measurements of one pipeline stage."""
+
+    name: str
+    wall_seconds: float
+    cpu_seconds: float
+    # Peak resident set size of the process so far, None where unavailable
+    peak_rss_bytes: Optional[int]
+    # Peak memory allocated during the stage, None unless tracing memory
+    peak_traced_bytes: Optional[int]
+    counts: dict[str, int]
+
+
+# Called with every finished stage
+MetricsHook = Callable[[StageMetrics], None]
+
+
+class Stage:
+    """Handle of a running stage, used to report item counts."""
+
+    __slots__ = ("name", "counts")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.counts: dict[str, int] = {}
+
+    def count(self, name: str, value: int) -> None:
+        """
+        Set an item count of the stage.
+
+        Args:
+            name: Counter name (e.g. ``"models"``)
+            value: Number of items
+        """
+        self.counts[name] = value
+
+
+def peak_rss_bytes() -> Optional[int]:
+    """Return the peak resident set size of the process, or None if unknown."""
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+    return int(peak if sys.platform == "darwin" else peak * 1024)
+
+
+class MetricsRecorder:
+    """
+    Record metrics of pipeline stages and pass them to hooks.
+
+    Stages may not be nested when tracing memory, since ``tracemalloc``
+    keeps a single peak.
+    """
+
+    def __init__(self, hooks: Iterable[MetricsHook] = (), trace_memory: bool = False):
+        """
+        Initialize the recorder.
+
+        Args:
+            hooks: Callables receiving each finished stage's StageMetrics
+            trace_memory: Measure peak allocations with ``tracemalloc``; this
+                slows allocation-heavy stages down noticeably
+        """
+        self.hooks = list(hooks)
+        self.trace_memory = trace_memory
+        self.stages: list[StageMetrics] = []
+
+    def add_hook(self, hook: MetricsHook) -> None:
+        """
+        Register a hook called with every finished stage.
+
+        Args:
+            hook: Callable receiving a StageMetrics
+        """
+        self.hooks.append(hook)
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[Stage]:
+        """
+        Measure the stage run inside the ``with`` block.
+
+        The stage is recorded even if the block raises.
+
+        Args:
+            name: Stage name
+
+        Yields:
+            Stage handle for reporting item counts
+        """
+        stage = Stage(name)
+        started_tracing = self.trace_memory and not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        if self.trace_memory:
+            tracemalloc.reset_peak()
+            traced_before, _ = tracemalloc.get_traced_memory()
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield stage
+        finally:
+            wall_seconds = time.perf_counter() - wall_start
+            cpu_seconds = time.process_time() - cpu_start
+            peak_traced = None
+            if self.trace_memory:
+                _, peak = tracemalloc.get_traced_memory()
+                peak_traced = max(0, peak - traced_before)
+            if started_tracing:
+                tracemalloc.stop()
+            self._finish(
+                StageMetrics(
+                    name=name,
+                    wall_seconds=wall_seconds,
+                    cpu_seconds=cpu_seconds,
+                    peak_rss_bytes=peak_rss_bytes(),
+                    peak_traced_bytes=peak_traced,
+                    counts=stage.counts,
+                )
+            )
+
+    def _finish(self, metrics: StageMetrics) -> None:
+        self.stages.append(metrics)
+        logger.debug(f"Stage {metrics.name} took {metrics.wall_seconds:.3f}s")
+        for hook in self.hooks:
+            try:
+                hook(metrics)
+            except Exception as e:
+                # A failing metrics client must not fail the run
+                logger.warning(f"Metrics hook {hook!r} failed: {e}")
+
+    def report(self) -> dict[str, Any]:
+        """
+        Build a machine-readable report of the recorded stages.
+
+        Returns:
+            Dictionary with one entry per stage, in execution order, and totals
+        """
+        return {
+            "stages": [stage._asdict() for stage in self.stages],
+            "total": {
+                "wall_seconds": sum(stage.wall_seconds for stage in self.stages),
+                "cpu_seconds": sum(stage.cpu_seconds for stage in self.stages),
+                "peak_rss_bytes": peak_rss_bytes(),
+            },
+        }
+
+    def write_json(self, output: Union[Path, str, TextIO]) -> None:
+        """
+        Write the report as JSON.
+
+        Args:
+            output: Path or writable text handle
+        """
+        if not isinstance(output, (Path, str)):
+            json.dump(self.report(), output, indent=2)
+            output.write("\n")
+            return
+        with open(output, "w", encoding="utf-8") as fp:
+            self.write_json(fp)
+
+
+def measure_stage(metrics: Optional[MetricsRecorder], name: str) -> AbstractContextManager[Stage]:
+    """
+    Measure a stage with ``metrics``, or only hand out a Stage if it is None.
+
+    Args:
+        metrics: Recorder, or None when instrumentation is disabled
+        name: Stage name
+
+    Returns:
+        Context manager yielding a Stage handle
+    """
+    if metrics is None:
+        return nullcontext(Stage(name))
+    return metrics.stage(name)
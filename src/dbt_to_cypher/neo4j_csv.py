@@ -0,0 +1,177 @@
+"""
+Module for exporting dependency graphs as ``neo4j-admin database import`` CSV files.
+
+Bulk import writes the store files directly and is much faster than running
+MERGE statements for the initial load of a large graph. One node file is
+written per label and a single relationship file holds all relationship types.
+"""
+
+import csv
+import logging
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any, Union
+
+from dbt_to_cypher.cypher import NODE_LABELS, exportable_properties
+from dbt_to_cypher.graph import DependencyGraph
+
+logger = logging.getLogger(__name__)
+
+# Header type suffixes understood by neo4j-admin; other values are imported as strings
+_CSV_TYPES = {bool: "boolean", int: "long", float: "double"}
+
+RELATIONSHIP_HEADER = [":START_ID", ":END_ID", ":TYPE"]
+RELATIONSHIPS_FILENAME = "relationships.csv"
+
+
+def _csv_value(value: Any) -> Any:
+    """Format a property value as understood by neo4j-admin."""
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return value
+
+
+class Neo4jCsvExporter:
+    """
+    Export a dbt dependency graph as CSV files for ``neo4j-admin database import``.
+
+    Node files use the same labels and key properties as ``CypherGenerator``
+    (``Model.name`` and ``Column.id``), so a bulk-imported graph can later be
+    updated with the statements of an incremental run.
+    """
+
+    def __init__(self, graph: DependencyGraph):
+        """
+        Initialize the exporter with a dependency graph.
+
+        Args:
+            graph: DependencyGraph instance to export
+        """
+        self.graph = graph
+
+    def node_header(self, node_type: str) -> list[str]:
+        """
+        Build the header of the node file of a node type.
+
+        Property columns are the union of the exportable properties of all
+        nodes of that type, typed when every value of a property has the
+        same numeric or boolean type.
+
+        Args:
+            node_type: Node type from ``NODE_LABELS``
+
+        Returns:
+            CSV header, starting with the ``key:ID`` and ``:LABEL`` columns
+        """
+        key = NODE_LABELS[node_type][1]
+        types: dict[str, Any] = {}
+        for _, attrs in self._nodes(node_type):
+            for name, value in exportable_properties(attrs).items():
+                if name == key:
+                    continue
+                # Mixed types fall back to strings
+                types[name] = type(value) if types.get(name, type(value)) is type(value) else str
+
+        header = [f"{key}:ID", ":LABEL"]
+        for name, value_type in types.items():
+            suffix = _CSV_TYPES.get(value_type)
+            header.append(f"{name}:{suffix}" if suffix else name)
+        return header
+
+    def iter_node_rows(self, node_type: str, header: list[str]) -> Iterator[list[Any]]:
+        """
+        Lazily generate the rows of the node file of a node type.
+
+        Args:
+            node_type: Node type from ``NODE_LABELS``
+            header: Header from ``node_header``
+
+        Yields:
+            CSV rows matching the header
+        """
+        label = NODE_LABELS[node_type][0]
+        properties = [column.split(":", 1)[0] for column in header[2:]]
+        for node, attrs in self._nodes(node_type):
+            props = exportable_properties(attrs)
+            yield [node, label, *(_csv_value(props.get(name)) for name in properties)]
+
+    def iter_relationship_rows(self) -> Iterator[list[str]]:
+        """
+        Lazily generate the rows of the relationship file.
+
+        Relationships to nodes without a known node type are skipped, since
+        those nodes are not exported and would fail the import.
+
+        Yields:
+            ``[start_id, end_id, type]`` rows
+        """
+        skipped = 0
+        for source, target, relationship in self.graph.edges():
+            if (
+                self.graph.node_type(source) not in NODE_LABELS
+                or self.graph.node_type(target) not in NODE_LABELS
+            ):
+                skipped += 1
+                continue
+            yield [source, target, relationship.upper().replace(" ", "_")]
+
+        if skipped:
+            logger.warning(f"Skipped {skipped} relationships to nodes without a node type")
+
+    def write(self, directory: Union[Path, str]) -> dict[str, Path]:
+        """
+        Write node and relationship CSV files to a directory.
+
+        Args:
+            directory: Output directory, created if missing
+
+        Returns:
+            Mapping of label (or ``"relationships"``) to the written file
+        """
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+
+        files: dict[str, Path] = {}
+        for node_type, (label, _) in NODE_LABELS.items():
+            path = directory / f"{label.lower()}s.csv"
+            header = self.node_header(node_type)
+            with open(path, "w", newline="", encoding="utf-8") as fp:
+                writer = csv.writer(fp)
+                writer.writerow(header)
+                writer.writerows(self.iter_node_rows(node_type, header))
+            files[label] = path
+
+        path = directory / RELATIONSHIPS_FILENAME
+        with open(path, "w", newline="", encoding="utf-8") as fp:
+            writer = csv.writer(fp)
+            writer.writerow(RELATIONSHIP_HEADER)
+            writer.writerows(self.iter_relationship_rows())
+        files["relationships"] = path
+
+        return files
+
+    @staticmethod
+    def import_command(files: dict[str, Path], database: str = "neo4j") -> str:
+        """
+        Build the ``neo4j-admin`` command that imports the written files.
+
+        Args:
+            files: Files returned by ``write``
+            database: Name of the database to import into
+
+        Returns:
+            Shell command
+        """
+        arguments = [
+            f"--relationships={path}" if name == "relationships" else f"--nodes={path}"
+            for name, path in files.items()
+        ]
+        return " ".join(["neo4j-admin database import full", *arguments, database])
+
+    def _nodes(self, node_type: str) -> Iterator[tuple[str, dict]]:
+        """Iterate over the nodes of a node type."""
+        for node, attrs in self.graph.nodes():
+            if attrs.get("node_type") == node_type:
+                yield node, attrs
@@ -0,0 +1,282 @@
+"""
+Module for running the stages of a dbt project export concurrently.
+
+The default pipeline runs artifact loading, extraction, column lineage,
+graph build and output one after the other. ``PipelinedExtraction``
+overlaps them:
+
+- ``manifest.json`` and ``catalog.json`` are loaded in two threads,
+- column lineage, by far the slowest stage, is computed in the background
+  in worker processes that read the artifacts themselves, while models,
+  columns and model dependencies are extracted and their statements emitted,
+- ``write_queries_in_background`` writes statements on a writer thread
+  while the next ones are generated.
+
+The model-level graph is emitted first and column lineage once it is
+computed, so a script holds the same statements as the sequential one in a
+different order. Every statement is a ``MERGE``, so the loaded graph is the
+same.
+"""
+
+import logging
+import os
+import queue
+import threading
+import weakref
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Optional, TextIO, Union
+
+from dbt_to_cypher.cache import BaseLineageCache
+from dbt_to_cypher.cypher import write_queries
+from dbt_to_cypher.extractor import DbtDependencyExtractor
+from dbt_to_cypher.lineage import LineageReferences, build_lineage_references
+from dbt_to_cypher.metrics import MetricsRecorder, measure_stage
+from dbt_to_cypher.projection import PropertyProjection
+
+logger = logging.getLogger(__name__)
+
+# Statements handed to the writer thread at once, and chunks queued at most
+DEFAULT_WRITE_CHUNK_SIZE = 512
+DEFAULT_MAX_PENDING_CHUNKS = 16
+
+
+class PipelinedExtraction:
+    """
+    Extract a dbt project with column lineage computed in the background.
+
+    ``extract_model_level`` returns everything but column lineage, which is
+    then collected with ``extract_column_dependencies``. The extraction can be
+    used as a context manager; background work still running on exit is
+    cancelled.
+    """
+
+    def __init__(
+        self,
+        project_path: Union[Path, str],
+        lightweight: bool = False,
+        jobs: int = 1,
+        cache: Union[bool, Path, str, BaseLineageCache] = False,
+        select: Optional[Sequence[str]] = None,
+        exclude: Optional[Sequence[str]] = None,
+        metrics: Optional[MetricsRecorder] = None,
+        projection: Optional[PropertyProjection] = None,
+    ):
+        """
+        Initialize the extraction; nothing runs until ``extract_model_level``.
+
+        Args:
+            project_path: Path to the dbt project directory
+            lightweight: Stream the manifest instead of validating it with Pydantic
+            jobs: Number of worker processes for column lineage; 0 uses all CPUs.
+                Lineage runs in a separate process even with one job
+            cache: Cache column lineage per model on disk
+            select: dbt selection expressions; only selected nodes are extracted
+            exclude: dbt selection expressions of nodes to leave out
+            metrics: Optional recorder measuring the model-level stages
+            projection: Node properties to extract (default: ``PropertyProjection()``)
+        """
+        self.jobs = jobs or os.cpu_count() or 1
+        self.metrics = metrics
+        self.extractor = DbtDependencyExtractor(
+            str(project_path),
+            lightweight=lightweight,
+            jobs=self.jobs,
+            cache=cache,
+            select=select,
+            exclude=exclude,
+            projection=projection,
+        )
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lineage: Optional[Future[LineageReferences]] = None
+
+    def _start_lineage(self) -> None:
+        """Submit column lineage of the selected models to a background executor."""
+        # Without a selection, this runs before load_file starts its loader
+        # threads; with one, after they have finished. With several jobs the
+        # process runs the lineage worker pool of build_lineage_references
+        self._executor = ProcessPoolExecutor(max_workers=1)
+        self._lineage = self._executor.submit(
+            build_lineage_references,
+            self.extractor.manifest_path,
+            self.extractor.catalog_path,
+            jobs=self.jobs,
+            cache=self.extractor._lineage_cache(),
+            models=self.extractor.selected_nodes(),
+        )
+
+    def extract_model_level(self) -> dict[str, Any]:
+        """
+        Load the artifacts, start column lineage and extract the rest.
+
+        Without a selection, column lineage starts before the artifacts are
+        loaded; with one, as soon as the manifest is loaded and the selection
+        resolved.
+
+        Returns:
+            Dependencies in the format of ``extract_dependencies``, with empty
+            ``column_dependencies``
+        """
+        extractor = self.extractor
+        if not extractor.select and not extractor.exclude:
+            self._start_lineage()
+
+        with measure_stage(self.metrics, "load") as stage:
+            extractor.load_file(concurrent=True)
+            # Lineage reads the artifacts itself, so the raw manifest is not needed
+            extractor.manifest_dict = None
+            stage.count("manifest_nodes", len(extractor.manifest.nodes))
+            stage.count("catalog_nodes", len(extractor.catalog.nodes))
+        if self._lineage is None:
+            self._start_lineage()
+
+        with measure_stage(self.metrics, "model_extraction") as stage:
+            models = extractor.extract_models()
+            stage.count("models", len(models))
+        with measure_stage(self.metrics, "column_extraction") as stage:
+            columns = extractor.extract_columns()
+            stage.count("columns", len(columns))
+        with measure_stage(self.metrics, "model_dependencies") as stage:
+            model_dependencies = extractor.extract_model_dependencies()
+            stage.count("dependencies", sum(map(len, model_dependencies.values())))
+
+        return {
+            "models": models,
+            "columns": columns,
+            "model_dependencies": model_dependencies,
+            "column_dependencies": {},
+        }
+
+    def extract_column_dependencies(self) -> dict[str, list[str]]:
+        """
+        Wait for column lineage and resolve it against the project's nodes.
+
+        Returns:
+            Column-level dependencies in the format of
+            ``DbtDependencyExtractor.extract_column_dependencies``
+
+        Raises:
+            RuntimeError: If ``extract_model_level`` has not been called
+        """
+        if self._lineage is None:
+            raise RuntimeError("extract_model_level must be called first")
+        column_dependencies = self.extractor.extract_column_dependencies(
+            references=self._lineage.result()
+        )
+        logger.info(
+            f"Column lineage computed for {len(column_dependencies)} columns "
+            f"({sum(map(len, column_dependencies.values()))} dependencies)"
+        )
+        return column_dependencies
+
+    def close(self) -> None:
+        """Shut down the background executor, cancelling lineage that has not started."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    def __enter__(self) -> "PipelinedExtraction":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+class PipelinedQueries(Iterator[str]):
+    """
+    Cypher statements of a pipelined extraction.
+
+    The extraction's background process is shut down once the statements
+    are exhausted, when ``close`` is called (also by the context manager) or
+    when the iterator is garbage collected, whether or not iteration started.
+    """
+
+    def __init__(self, queries: Iterator[str], pipeline: PipelinedExtraction):
+        """
+        Wrap the statements generated from a pipelined extraction.
+
+        Args:
+            queries: Cypher statements
+            pipeline: Extraction whose background work the statements wait for
+        """
+        self._queries = queries
+        self._finalizer = weakref.finalize(self, pipeline.close)
+
+    def __next__(self) -> str:
+        return next(self._queries)
+
+    def close(self) -> None:
+        """Stop generating statements and shut down the background process."""
+        close = getattr(self._queries, "close", None)
+        if close is not None:
+            close()
+        self._finalizer()
+
+    def __enter__(self) -> "PipelinedQueries":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def write_queries_in_background(
+    queries: Iterable[str],
+    fp: TextIO,
+    chunk_size: int = DEFAULT_WRITE_CHUNK_SIZE,
+    max_pending: int = DEFAULT_MAX_PENDING_CHUNKS,
+) -> int:
+    """
+    Stream Cypher statements to a file handle from a writer thread.
+
+    Statements are generated on the calling thread and handed over in
+    chunks through a bounded queue, so generation continues while earlier
+    statements are written and at most ``max_pending`` chunks are buffered.
+    The output is the same as with ``write_queries``.
+
+    Args:
+        queries: Cypher statements
+        fp: Writable text file handle
+        chunk_size: Number of statements handed to the writer at once
+        max_pending: Maximum number of chunks waiting to be written
+
+    Returns:
+        Number of statements written
+    """
+    chunks: queue.Queue[Optional[list[str]]] = queue.Queue(maxsize=max_pending)
+    errors: list[BaseException] = []
+
+    def writer() -> None:
+        while True:
+            chunk = chunks.get()
+            if chunk is None:
+                return
+            if not errors:
+                try:
+                    write_queries(chunk, fp)
+                except BaseException as e:
+                    # Keep draining so that the generating thread never blocks on a full queue
+                    errors.append(e)
+
+    thread = threading.Thread(target=writer, name="cypher-writer", daemon=True)
+    thread.start()
+    count = 0
+    try:
+        chunk: list[str] = []
+        for query in queries:
+            chunk.append(query)
+            if len(chunk) >= chunk_size:
+                chunks.put(chunk)
+                count += len(chunk)
+                chunk = []
+                if errors:
+                    break
+        if chunk and not errors:
+            chunks.put(chunk)
+            count += len(chunk)
+    finally:
+        chunks.put(None)
+        thread.join()
+    if errors:
+        raise errors[0]
+    return count
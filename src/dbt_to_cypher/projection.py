@@ -0,0 +1,125 @@
+"""
+Module for choosing which node properties are extracted.
+
+Only projected properties are read from the manifest and catalog and stored
+on graph nodes, so properties that are never exported cost no memory. Each
+node type has a default set; an allowlist replaces it and a denylist removes
+properties from it.
+"""
+
+from collections.abc import Iterable, Mapping
+from typing import Optional
+
+# Properties the extractor can read per node type, in output order
+MODEL_PROPERTIES = (
+    "fqn",
+    "materialization",
+    "database",
+    "schema",
+    "resource_type",
+    "name",
+    "alias",
+    "package_name",
+    "original_file_path",
+)
+COLUMN_PROPERTIES = ("type", "index", "name", "comment", "model_name")
+
+AVAILABLE_PROPERTIES: dict[str, tuple[str, ...]] = {
+    "model": MODEL_PROPERTIES,
+    "column": COLUMN_PROPERTIES,
+}
+
+DEFAULT_PROPERTIES: dict[str, tuple[str, ...]] = {
+    "model": ("fqn", "materialization", "database", "schema", "resource_type"),
+    "column": COLUMN_PROPERTIES,
+}
+
+
+def _parse_options(options: Iterable[str]) -> dict[str, list[str]]:
+    """Parse ``node_type:property,property`` options into a mapping."""
+    parsed: dict[str, list[str]] = {}
+    for option in options:
+        node_type, separator, names = option.partition(":")
+        if not separator:
+            raise ValueError(f"Expected NODE_TYPE:PROPERTY[,PROPERTY...], got '{option}'")
+        parsed.setdefault(node_type, []).extend(name for name in names.split(",") if name)
+    return parsed
+
+
+class PropertyProjection:
+    """Properties to extract for each node type."""
+
+    def __init__(
+        self,
+        include: Optional[Mapping[str, Iterable[str]]] = None,
+        exclude: Optional[Mapping[str, Iterable[str]]] = None,
+    ):
+        """
+        Initialize the projection.
+
+        Args:
+            include: Node type -> properties to extract instead of the defaults
+            exclude: Node type -> properties to leave out
+
+        Raises:
+            ValueError: If a node type or property is unknown
+        """
+        self._properties = {
+            node_type: list(defaults) for node_type, defaults in DEFAULT_PROPERTIES.items()
+        }
+        for node_type, names in (include or {}).items():
+            self._properties[node_type] = self._validate(node_type, names)
+        for node_type, names in (exclude or {}).items():
+            excluded = set(self._validate(node_type, names))
+            self._properties[node_type] = [
+                name for name in self._properties[node_type] if name not in excluded
+            ]
+
+    @staticmethod
+    def _validate(node_type: str, names: Iterable[str]) -> list[str]:
+        available = AVAILABLE_PROPERTIES.get(node_type)
+        if available is None:
+            raise ValueError(
+                f"Unknown node type '{node_type}', expected one of {sorted(AVAILABLE_PROPERTIES)}"
+            )
+        names = list(names)
+        unknown = [name for name in names if name not in available]
+        if unknown:
+            raise ValueError(
+                f"Unknown {node_type} properties {unknown}, expected some of {list(available)}"
+            )
+        return names
+
+    @classmethod
+    def parse(
+        cls, include: Iterable[str] = (), exclude: Iterable[str] = ()
+    ) -> "PropertyProjection":
+        """
+        Build a projection from command-line style options.
+
+        Args:
+            include: Options like ``model:name,schema`` replacing the defaults
+            exclude: Options like ``column:comment`` removing properties
+
+        Returns:
+            PropertyProjection
+
+        Raises:
+            ValueError: If an option is malformed or names an unknown property
+        """
+        return cls(_parse_options(include), _parse_options(exclude))
+
+    def properties(self, node_type: str) -> list[str]:
+        """
+        Return the properties extracted for a node type.
+
+        Args:
+            node_type: ``"model"`` or ``"column"``
+
+        Returns:
+            Property names, in output order
+        """
+        return self._properties.get(node_type, [])
+
+    def __repr__(self) -> str:
+        return f"PropertyProjection({self._properties!r})"
@@ -0,0 +1,274 @@
+"""
+Module for memoized transitive reachability queries on dependency graphs.
+
+A ``ReachabilityIndex`` interns the nodes of a set of edges to integer
+indices and condenses strongly connected components, so reachability is
+computed on a DAG of components. Results are memoized per component in an
+LRU bounded by the total number of nodes stored across closures, and reused
+by later walks that reach a memoized component, so repeated impact-analysis
+queries do not re-walk shared subgraphs.
+"""
+
+from collections import OrderedDict
+from collections.abc import Iterable, Sequence
+from typing import NamedTuple, Optional
+
+# Total number of nodes held across memoized closures
+DEFAULT_MEMO_SIZE = 1_000_000
+
+
+class Impact(NamedTuple):
+    """How a node is reached from a batch of start nodes."""
+
+    # Minimum number of edges from any start node
+    distance: int
+    # Start nodes the node is reachable from, in input order
+    sources: list[str]
+
+
+class ReachabilityIndex:
+    """
+    Transitive closure of a directed graph, computed on demand.
+
+    The index is immutable: build a new one when the graph changes.
+    """
+
+    def __init__(self, edges: Iterable[tuple[str, str]], memo_size: int = DEFAULT_MEMO_SIZE):
+        """
+        Build the index from (source, target) edges; queries follow edges forwards.
+
+        Args:
+            edges: Directed edges
+            memo_size: Maximum total number of nodes held across memoized
+                component closures; a closure larger than this is not memoized
+        """
+        self._ids: list[str] = []
+        self._index: dict[str, int] = {}
+        self._adjacency: list[list[int]] = []
+        for source, target in edges:
+            self._adjacency[self._intern(source)].append(self._intern(target))
+
+        self._components = self._strongly_connected_components()
+        self._members: list[list[int]] = [[] for _ in range(max(self._components, default=-1) + 1)]
+        for node, component in enumerate(self._components):
+            self._members[component].append(node)
+        self._component_adjacency: list[list[int]] = [[] for _ in self._members]
+        for component, members in enumerate(self._members):
+            successors = {
+                self._components[target]
+                for node in members
+                for target in self._adjacency[node]
+                if self._components[target] != component
+            }
+            self._component_adjacency[component] = sorted(successors)
+        # Components whose members reach each other: cycles and self-loops
+        self._cyclic = [
+            len(members) > 1 or members[0] in self._adjacency[members[0]]
+            for members in self._members
+        ]
+
+        self.memo_size = memo_size
+        self._memo: OrderedDict[int, frozenset[int]] = OrderedDict()
+        self._memo_stored = 0
+
+    def _intern(self, node: str) -> int:
+        index = self._index.get(node)
+        if index is None:
+            index = len(self._ids)
+            self._ids.append(node)
+            self._index[node] = index
+            self._adjacency.append([])
+        return index
+
+    def _strongly_connected_components(self) -> list[int]:
+        """Label each node with its component, using an iterative Tarjan's algorithm."""
+        adjacency = self._adjacency
+        count = len(adjacency)
+        order = [-1] * count
+        low = [0] * count
+        components = [-1] * count
+        on_stack = [False] * count
+        stack: list[int] = []
+        counter = 0
+        component_count = 0
+
+        for root in range(count):
+            if order[root] != -1:
+                continue
+            work = [(root, 0)]
+            while work:
+                node, position = work.pop()
+                if position == 0:
+                    order[node] = low[node] = counter
+                    counter += 1
+                    stack.append(node)
+                    on_stack[node] = True
+                recurse = False
+                successors = adjacency[node]
+                while position < len(successors):
+                    successor = successors[position]
+                    position += 1
+                    if order[successor] == -1:
+                        work.append((node, position))
+                        work.append((successor, 0))
+                        recurse = True
+                        break
+                    if on_stack[successor]:
+                        low[node] = min(low[node], order[successor])
+                if recurse:
+                    continue
+                if low[node] == order[node]:
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = False
+                        components[member] = component_count
+                        if member == node:
+                            break
+                    component_count += 1
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[node])
+        return components
+
+    def _closure(self, component: int) -> frozenset[int]:
+        """Return the nodes reachable from a component, excluding its own members."""
+        memo = self._memo
+        if component in memo:
+            memo.move_to_end(component)
+            return memo[component]
+
+        reached: set[int] = set()
+        seen = {component}
+        stack = list(self._component_adjacency[component])
+        seen.update(stack)
+        while stack:
+            current = stack.pop()
+            reached.update(self._members[current])
+            known = memo.get(current)
+            if known is not None:
+                # Reuse a memoized walk instead of descending again
+                reached |= known
+                continue
+            for successor in self._component_adjacency[current]:
+                if successor not in seen:
+                    seen.add(successor)
+                    stack.append(successor)
+
+        closure = frozenset(reached)
+        if len(closure) <= self.memo_size:
+            memo[component] = closure
+            self._memo_stored += len(closure)
+            while self._memo_stored > self.memo_size:
+                _, evicted = memo.popitem(last=False)
+                self._memo_stored -= len(evicted)
+        return closure
+
+    def reachable(self, node: str, max_depth: Optional[int] = None) -> set[str]:
+        """
+        Return the nodes reachable from a node by following one or more edges.
+
+        Args:
+            node: Start node
+            max_depth: Maximum number of edges to follow (unlimited if None)
+
+        Returns:
+            Reachable node identifiers; the start node is excluded
+        """
+        start = self._index.get(node)
+        if start is None:
+            return set()
+
+        if max_depth is not None:
+            reached: set[int] = set()
+            frontier = [start]
+            for _ in range(max_depth):
+                next_frontier = []
+                for current in frontier:
+                    for target in self._adjacency[current]:
+                        if target not in reached:
+                            reached.add(target)
+                            next_frontier.append(target)
+                if not next_frontier:
+                    break
+                frontier = next_frontier
+            reached.discard(start)
+            return {self._ids[index] for index in reached}
+
+        component = self._components[start]
+        result = {self._ids[index] for index in self._closure(component)}
+        if self._cyclic[component]:
+            result.update(self._ids[index] for index in self._members[component] if index != start)
+        return result
+
+    def multi_source(self, nodes: Sequence[str]) -> dict[str, Impact]:
+        """
+        Find everything reachable from a batch of start nodes in one traversal.
+
+        A breadth-first search from all start nodes at once gives minimum
+        distances. Which start nodes reach each node is then propagated as
+        bitmasks over the condensed components in topological order, so each
+        edge is visited once regardless of the number of start nodes.
+
+        Args:
+            nodes: Start nodes
+
+        Returns:
+            Mapping of every node reachable by one or more edges to its Impact;
+            a start node is included only if another start node (or a cycle) reaches it
+        """
+        # A start node given twice gets a single bit
+        nodes = list(dict.fromkeys(nodes))
+        starts: dict[int, int] = {}
+        for bit, node in enumerate(nodes):
+            index = self._index.get(node)
+            if index is not None:
+                starts[index] = starts.get(index, 0) | (1 << bit)
+
+        # Multi-source BFS; nodes count as reached once an edge leads to them
+        distance: dict[int, int] = {}
+        frontier = list(starts)
+        depth = 0
+        while frontier:
+            depth += 1
+            next_frontier = []
+            for current in frontier:
+                for target in self._adjacency[current]:
+                    if target not in distance:
+                        distance[target] = depth
+                        next_frontier.append(target)
+            frontier = next_frontier
+
+        # Tarjan numbers components in reverse topological order, so walking
+        # component numbers downwards visits every component after its predecessors
+        reached_by: dict[int, int] = {}
+        involved = {self._components[index] for index in distance}
+        involved.update(self._components[index] for index in starts)
+        for component in sorted(involved, reverse=True):
+            members = self._members[component]
+            if self._cyclic[component]:
+                mask = 0
+                for member in members:
+                    mask |= reached_by.get(member, 0) | starts.get(member, 0)
+                for member in members:
+                    reached_by[member] = mask
+            for member in members:
+                outgoing = reached_by.get(member, 0) | starts.get(member, 0)
+                if not outgoing:
+                    continue
+                for target in self._adjacency[member]:
+                    if self._components[target] != component:
+                        reached_by[target] = reached_by.get(target, 0) | outgoing
+
+        def sources(mask: int) -> list[str]:
+            # Walk only the set bits, lowest (first given) first
+            result = []
+            while mask:
+                low = mask & -mask
+                result.append(nodes[low.bit_length() - 1])
+                mask ^= low
+            return result
+
+        return {
+            self._ids[index]: Impact(distance=node_distance, sources=sources(reached_by[index]))
+            for index, node_distance in distance.items()
+        }
@@ -0,0 +1,166 @@
+"""
+Module for resolving dbt node selection syntax against a manifest.
+
+Supported syntax follows dbt's ``--select`` / ``--exclude``:
+
+- ``my_model`` or ``shop.staging.*``: node name or fqn (path) pattern
+- ``tag:nightly``, ``path:models/staging``, ``package:shop``, ``resource_type:model``
+- graph operators ``+selector`` (all parents), ``selector+`` (all children),
+  and depth-limited ``2+selector`` / ``selector+1``
+- selectors separated by spaces are unioned, comma-separated ones intersected
+
+Selection only needs each node's ``depends_on``, so it can be resolved before
+any column lineage is computed.
+"""
+
+import re
+from collections.abc import Iterable, Mapping
+from fnmatch import fnmatchcase
+from typing import Any, Optional
+
+_GRAPH_OPERATORS = re.compile(
+    r"^(?:(?P<parents_depth>\d*)(?P<parents>\+))?(?P<selector>.*?)"
+    r"(?:(?P<children>\+)(?P<children_depth>\d*))?$"
+)
+
+_METHODS = ("tag", "path", "package", "resource_type", "fqn")
+
+
+def _value(value: Any) -> Any:
+    """Unwrap enum values used by dbt-artifacts-parser models."""
+    return getattr(value, "value", value)
+
+
+def _matches(node: Any, method: str, pattern: str) -> bool:
+    """Tell whether a manifest node matches a selector method and value."""
+    if method == "tag":
+        tags = getattr(node, "tags", None) or []
+        if isinstance(tags, str):
+            tags = [tags]
+        return any(fnmatchcase(tag, pattern) for tag in tags)
+    if method == "path":
+        path = getattr(node, "original_file_path", None) or ""
+        pattern = pattern.rstrip("/")
+        return fnmatchcase(path, pattern) or path.startswith(f"{pattern}/")
+    if method == "package":
+        return fnmatchcase(getattr(node, "package_name", None) or "", pattern)
+    if method == "resource_type":
+        return bool(_value(getattr(node, "resource_type", None)) == pattern)
+
+    # fqn: a bare value matches the node name, otherwise an fqn prefix
+    # (package, directories, model name), each part possibly a wildcard
+    parts = pattern.split(".")
+    if len(parts) == 1 and fnmatchcase(getattr(node, "name", None) or "", pattern):
+        return True
+    fqn = list(getattr(node, "fqn", None) or [])
+    return len(parts) <= len(fqn) and all(
+        fnmatchcase(part, expected) for part, expected in zip(fqn, parts)
+    )
+
+
+def _walk(start: set[str], edges: Mapping[str, Iterable[str]], depth: Optional[int]) -> set[str]:
+    """Return the nodes reachable from ``start`` within ``depth`` steps (unlimited if None)."""
+    reached: set[str] = set()
+    frontier = list(start)
+    steps = 0
+    while frontier and (depth is None or steps < depth):
+        steps += 1
+        next_frontier = []
+        for node in frontier:
+            for neighbor in edges.get(node, ()):
+                if neighbor not in reached and neighbor not in start:
+                    reached.add(neighbor)
+                    next_frontier.append(neighbor)
+        frontier = next_frontier
+    return reached
+
+
+class NodeSelector:
+    """
+    Resolve dbt selection syntax against the nodes of a manifest.
+
+    Nodes are read through ``name``, ``fqn``, ``tags``, ``package_name``,
+    ``original_file_path``, ``resource_type`` and ``depends_on.nodes``, which
+    both dbt-artifacts-parser nodes and ``ManifestNode`` provide.
+    """
+
+    def __init__(self, nodes: Mapping[str, Any]):
+        """
+        Initialize the selector with manifest nodes.
+
+        Args:
+            nodes: Mapping of unique ID to manifest node
+        """
+        self.nodes = nodes
+        self.parents: dict[str, list[str]] = {}
+        self.children: dict[str, list[str]] = {}
+        for node_id, node in nodes.items():
+            parents = [
+                parent
+                for parent in getattr(getattr(node, "depends_on", None), "nodes", None) or []
+                if parent in nodes
+            ]
+            self.parents[node_id] = parents
+            for parent in parents:
+                self.children.setdefault(parent, []).append(node_id)
+
+    def select(
+        self,
+        select: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> set[str]:
+        """
+        Resolve ``--select`` and ``--exclude`` expressions to node unique IDs.
+
+        Args:
+            select: Selection expressions (all nodes if None or empty)
+            exclude: Exclusion expressions
+
+        Returns:
+            Unique IDs of the selected nodes
+
+        Raises:
+            ValueError: If an expression uses an unknown selector method
+        """
+        select = list(select or [])
+        selected = self._union(select) if select else set(self.nodes)
+        if exclude:
+            selected -= self._union(exclude)
+        return selected
+
+    def _union(self, expressions: Iterable[str]) -> set[str]:
+        selected: set[str] = set()
+        for expression in expressions:
+            for term in expression.split():
+                selected |= self._intersection(term)
+        return selected
+
+    def _intersection(self, term: str) -> set[str]:
+        result: Optional[set[str]] = None
+        for part in term.split(","):
+            nodes = self._resolve(part)
+            result = nodes if result is None else result & nodes
+        return result or set()
+
+    def _resolve(self, term: str) -> set[str]:
+        """Resolve a single selector with optional graph operators."""
+        match = _GRAPH_OPERATORS.match(term)
+        assert match is not None  # the pattern matches any string
+        selector = match.group("selector")
+        method, separator, pattern = selector.partition(":")
+        if not separator:
+            method, pattern = "fqn", selector
+        if method not in _METHODS:
+            raise ValueError(f"Unknown selector method '{method}' in '{term}'")
+
+        selected = {
+            node_id for node_id, node in self.nodes.items() if _matches(node, method, pattern)
+        }
+        result = set(selected)
+        if match.group("parents"):
+            depth = match.group("parents_depth")
+            result |= _walk(selected, self.parents, int(depth) if depth else None)
+        if match.group("children"):
+            depth = match.group("children_depth")
+            result |= _walk(selected, self.children, int(depth) if depth else None)
+        return result
@@ -0,0 +1,246 @@
+"""
+Module for saving and loading dependency graphs as compact binary snapshots.
+
+A snapshot stores a graph in the layout of ``CompactDependencyGraph``, so
+loading it is mostly a matter of reading arrays back:
+
+- an interned value table: node IDs first, then every distinct attribute
+  value, serialized once as a JSON list,
+- node type and relationship type codes,
+- outgoing and incoming edges as packed CSR (compressed sparse row) arrays,
+- one column of value-table codes per attribute name.
+
+Array sections are 8-byte aligned and little-endian. With ``mmap=True`` the
+edge arrays are memory-mapped instead of read, so opening a snapshot costs
+little more than decoding its value table.
+"""
+
+import json
+import mmap as mmap_module
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import Any, BinaryIO, Union
+
+from dbt_to_cypher.compact_graph import _MISSING, CompactDependencyGraph
+from dbt_to_cypher.graph import DependencyGraph
+
+MAGIC = b"DBTGRAPH"
+VERSION = 1
+# File suffix that save_graph_state writes as a snapshot
+SUFFIX = ".snapshot"
+
+# File layout: MAGIC, u32 header length, JSON header, then aligned sections
+_HEADER_LENGTH = struct.Struct("<I")
+_ALIGNMENT = 8
+
+# Section name -> array typecode; attribute columns use "I"
+_EDGE_SECTIONS = {
+    "out_offsets": "q",
+    "out_targets": "q",
+    "out_relationships": "H",
+    "in_offsets": "q",
+    "in_sources": "q",
+    "in_relationships": "H",
+}
+
+
+def _json_default(value: Any) -> Any:
+    """Convert attribute values JSON does not support (Pydantic models, enums)."""
+    if hasattr(value, "model_dump"):
+        return value.model_dump()
+    if hasattr(value, "value"):
+        return value.value
+    return str(value)
+
+
+class _ValueTable:
+    """Intern attribute values, telling apart equal values of different types (1, 1.0, True)."""
+
+    def __init__(self) -> None:
+        self.values: list[Any] = []
+        self._codes: dict[tuple, int] = {}
+
+    def code(self, value: Any) -> int:
+        try:
+            key: tuple = (type(value), value)
+            code = self._codes.get(key)
+        except TypeError:
+            key = ("json", json.dumps(value, sort_keys=True, default=_json_default))
+            code = self._codes.get(key)
+        if code is None:
+            code = len(self.values)
+            self.values.append(value)
+            self._codes[key] = code
+        return code
+
+
+def _native(values: array) -> bytes:
+    """Return array bytes in little-endian order."""
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def save(graph: DependencyGraph, path: Union[Path, str]) -> None:
+    """
+    Save a dependency graph as a binary snapshot.
+
+    Attribute values are stored as JSON; values JSON does not support are
+    converted (Pydantic models to dicts, enums to their values, others to
+    strings), and tuples are loaded back as lists.
+
+    Args:
+        graph: Graph to save, of any backend
+        path: Output file
+    """
+    if not isinstance(graph, CompactDependencyGraph):
+        graph = CompactDependencyGraph.from_graph(graph)
+    # Fold pending edges so that the CSR arrays are complete
+    graph = graph._folded()
+
+    node_count = graph.number_of_nodes()
+    table = _ValueTable()
+    for node in graph._ids:
+        table.code(node)
+    columns: dict[str, array] = {}
+    for name, values in graph._attributes.items():
+        # Code 0 marks nodes without the attribute
+        codes = array("I", [0]) * node_count
+        for index, value in enumerate(values):
+            if value is not _MISSING:
+                codes[index] = table.code(value) + 1
+        columns[name] = codes
+
+    sections: dict[str, bytes] = {
+        "values": json.dumps(table.values, default=_json_default).encode("utf-8"),
+        "node_types": _native(graph._node_type_codes),
+        "out_offsets": _native(graph._out_offsets),
+        "out_targets": _native(graph._out_targets),
+        "out_relationships": _native(graph._out_relationships),
+        "in_offsets": _native(graph._in_offsets),
+        "in_sources": _native(graph._in_sources),
+        "in_relationships": _native(graph._in_relationships),
+    }
+    for position, codes in enumerate(columns.values()):
+        sections[f"attribute_{position}"] = _native(codes)
+
+    layout: dict[str, list[int]] = {}
+    offset = 0
+    for name, data in sections.items():
+        layout[name] = [offset, len(data)]
+        offset += -(-len(data) // _ALIGNMENT) * _ALIGNMENT
+    header = json.dumps(
+        {
+            "version": VERSION,
+            "nodes": node_count,
+            "node_types": graph._node_types,
+            "relationships": graph._relationships,
+            "attributes": list(columns),
+            "sections": layout,
+        }
+    ).encode("utf-8")
+    prefix = len(MAGIC) + _HEADER_LENGTH.size + len(header)
+    header += b" " * (-prefix % _ALIGNMENT)
+
+    with open(path, "wb") as fp:
+        fp.write(MAGIC)
+        fp.write(_HEADER_LENGTH.pack(len(header)))
+        fp.write(header)
+        for data in sections.values():
+            fp.write(data)
+            fp.write(b"\0" * (-len(data) % _ALIGNMENT))
+
+
+def is_snapshot(path: Union[Path, str]) -> bool:
+    """
+    Tell whether a file is a binary snapshot.
+
+    Args:
+        path: File to check
+
+    Returns:
+        True if the file starts with the snapshot magic bytes
+    """
+    with open(path, "rb") as fp:
+        return fp.read(len(MAGIC)) == MAGIC
+
+
+def _read_header(fp: BinaryIO) -> tuple[dict[str, Any], int]:
+    if fp.read(len(MAGIC)) != MAGIC:
+        raise ValueError(f"Not a dependency graph snapshot: {fp.name}")
+    (length,) = _HEADER_LENGTH.unpack(fp.read(_HEADER_LENGTH.size))
+    header = json.loads(fp.read(length))
+    if header["version"] != VERSION:
+        raise ValueError(f"Unsupported snapshot version {header['version']}: {fp.name}")
+    return header, len(MAGIC) + _HEADER_LENGTH.size + length
+
+
+def load(path: Union[Path, str], mmap: bool = False) -> CompactDependencyGraph:
+    """
+    Load a graph saved with ``save``.
+
+    Args:
+        path: Snapshot file
+        mmap: Memory-map the edge arrays instead of reading them into memory;
+            pages are read on first access and the file must not be modified
+            while the graph is in use
+
+    Returns:
+        CompactDependencyGraph with the saved nodes, attributes and edges
+
+    Raises:
+        ValueError: If the file is not a snapshot of a supported version
+    """
+    with open(path, "rb") as fp:
+        header, data_start = _read_header(fp)
+        if mmap:
+            buffer: Any = mmap_module.mmap(fp.fileno(), 0, access=mmap_module.ACCESS_READ)
+        else:
+            fp.seek(0)
+            buffer = fp.read()
+    view = memoryview(buffer)
+
+    def section(name: str) -> memoryview:
+        offset, length = header["sections"][name]
+        return view[data_start + offset : data_start + offset + length]
+
+    def read_array(name: str, typecode: str, copy: bool = True) -> Any:
+        data = section(name)
+        if copy or sys.byteorder == "big":
+            values = array(typecode)
+            values.frombytes(data)
+            if sys.byteorder == "big":
+                values.byteswap()
+            return values
+        # Zero-copy view on the mapped file, read-only like the mapping
+        return data.cast(typecode)  # type: ignore[call-overload]
+
+    table = json.loads(section("values").tobytes())
+    node_count = header["nodes"]
+    ids = table[:node_count]
+    lookup = [_MISSING, *table]
+    attributes = {
+        name: list(map(lookup.__getitem__, read_array(f"attribute_{position}", "I")))
+        for position, name in enumerate(header["attributes"])
+    }
+    edges = {
+        name: read_array(name, typecode, copy=not mmap) for name, typecode in _EDGE_SECTIONS.items()
+    }
+
+    graph = CompactDependencyGraph()
+    graph._ids = ids
+    graph._index = dict(zip(ids, range(node_count)))
+    graph._node_type_codes = read_array("node_types", "H")
+    graph._node_types = header["node_types"]
+    graph._attributes = attributes
+    graph._relationships = header["relationships"]
+    graph._out_offsets = edges["out_offsets"]
+    graph._out_targets = edges["out_targets"]
+    graph._out_relationships = edges["out_relationships"]
+    graph._in_offsets = edges["in_offsets"]
+    graph._in_sources = edges["in_sources"]
+    graph._in_relationships = edges["in_relationships"]
+    return graph
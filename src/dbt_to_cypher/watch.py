@@ -0,0 +1,92 @@
+"""
+Module for detecting changes of dbt artifacts.
+
+``dbt compile`` and ``dbt docs generate`` rewrite ``target/manifest.json``
+and ``target/catalog.json`` in place, so a change is only reported once the
+files have stopped changing for a debounce interval; a rebuild never reads a
+half-written artifact. Files are polled, which works the same on every
+platform and file system (including network and container mounts).
+"""
+
+import os
+import time
+from collections.abc import Callable, Sequence
+from pathlib import Path
+from typing import Optional, Union
+
+# Seconds the artifacts must stay unchanged before a change is reported
+DEFAULT_DEBOUNCE = 1.0
+DEFAULT_POLL_INTERVAL = 0.25
+
+# (modification time in ns, size) per file; None if a file is missing
+Signature = Optional[tuple[tuple[int, int], ...]]
+
+
+def artifact_signature(paths: Sequence[Union[Path, str]]) -> Signature:
+    """
+    Return the modification times and sizes of files.
+
+    Args:
+        paths: Files to check
+
+    Returns:
+        Tuple of (mtime_ns, size) per file, or None if any file is missing
+    """
+    signature = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return None
+        signature.append((stat.st_mtime_ns, stat.st_size))
+    return tuple(signature)
+
+
+class ArtifactWatcher:
+    """Poll dbt artifacts and report debounced changes."""
+
+    def __init__(
+        self,
+        paths: Sequence[Union[Path, str]],
+        debounce: float = DEFAULT_DEBOUNCE,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        Initialize the watcher with the current state of the files.
+
+        Args:
+            paths: Files to watch (e.g. manifest.json and catalog.json)
+            debounce: Seconds the files must stay unchanged before a change
+                is reported
+            poll_interval: Seconds between two checks
+            sleep: Function used to wait between checks
+        """
+        self.paths = list(paths)
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self._sleep = sleep
+        self.signature = artifact_signature(self.paths)
+
+    def wait_for_change(self) -> None:
+        """
+        Block until the files changed and then stayed unchanged for ``debounce`` seconds.
+
+        Changes that are reverted within the debounce interval, and states
+        where a file is missing (e.g. while dbt replaces it), are not reported.
+        """
+        pending = self.signature
+        stable_since = time.monotonic()
+        while True:
+            self._sleep(self.poll_interval)
+            current = artifact_signature(self.paths)
+            if current != pending:
+                pending = current
+                stable_since = time.monotonic()
+            elif (
+                pending is not None
+                and pending != self.signature
+                and time.monotonic() - stable_since >= self.debounce
+            ):
+                self.signature = pending
+                return
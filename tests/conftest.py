@@ -1 +1,203 @@
 """Test configuration and fixtures."""
+
+import json
+
+import pytest
+
+
+def _model_node(
+    name: str, depends_on: list[str], sql: str, package: str = "shop", schema: str = "main"
+) -> dict:
+    """Build a minimal manifest v12 model node."""
+    return {
+        "database": "analytics",
+        "schema": schema,
+        "name": name,
+        "resource_type": "model",
+        "package_name": package,
+        "path": f"{name}.sql",
+        "original_file_path": f"models/{name}.sql",
+        "unique_id": f"model.{package}.{name}",
+        "fqn": [package, name],
+        "alias": name,
+        "checksum": {"name": "sha256", "checksum": name},
+        "config": {"materialized": "table"},
+        "depends_on": {"nodes": depends_on, "macros": []},
+        "raw_code": sql,
+        "compiled_code": sql,
+        "relation_name": f'"analytics"."{schema}"."{name}"',
+        "language": "sql",
+    }
+
+
+def _catalog_node(
+    name: str, columns: list[str], package: str = "shop", schema: str = "main"
+) -> dict:
+    """Build a minimal catalog v1 node."""
+    return {
+        "metadata": {
+            "type": "BASE TABLE",
+            "schema": schema,
+            "name": name,
+            "database": "analytics",
+        },
+        "columns": {
+            column: {"type": "INTEGER", "index": index, "name": column}
+            for index, column in enumerate(columns, start=1)
+        },
+        "stats": {},
+        "unique_id": f"model.{package}.{name}",
+    }
+
+
+@pytest.fixture
+def dbt_project(tmp_path):
+    """
+    Write a small compiled dbt project (manifest.json and catalog.json).
+
+    The project has two models, ``stg_orders`` and ``orders``, where ``orders``
+    selects from ``stg_orders``, plus a test node that extraction should skip.
+    """
+    stg_sql = "select 1 as order_id, 2 as customer_id"
+    orders_sql = 'select order_id, customer_id as buyer_id from "analytics"."main"."stg_orders"'
+    manifest = {
+        "metadata": {
+            "dbt_schema_version": "https://schemas.getdbt.com/dbt/manifest/v12.json",
+            "adapter_type": "duckdb",
+        },
+        "nodes": {
+            "model.shop.stg_orders": _model_node("stg_orders", [], stg_sql),
+            "model.shop.orders": _model_node("orders", ["model.shop.stg_orders"], orders_sql),
+            "test.shop.not_null_orders_order_id": {
+                "resource_type": "test",
+                "name": "not_null_orders_order_id",
+                "depends_on": {"nodes": ["model.shop.orders"], "macros": []},
+            },
+        },
+        "sources": {},
+        "macros": {
+            "macro.shop.noop": {
+                "name": "noop",
+                "resource_type": "macro",
+                "package_name": "shop",
+                "path": "macros/noop.sql",
+                "original_file_path": "macros/noop.sql",
+                "unique_id": "macro.shop.noop",
+                "macro_sql": "{% macro noop() %}{% endmacro %}",
+            }
+        },
+        "docs": {},
+        "exposures": {},
+        "metrics": {},
+        "groups": {},
+        "selectors": {},
+        "disabled": {},
+        "parent_map": {
+            "model.shop.stg_orders": [],
+            "model.shop.orders": ["model.shop.stg_orders"],
+        },
+        "child_map": {
+            "model.shop.stg_orders": ["model.shop.orders"],
+            "model.shop.orders": [],
+        },
+        "group_map": {},
+        "saved_queries": {},
+        "semantic_models": {},
+        "unit_tests": {},
+    }
+    catalog = {
+        "metadata": {"dbt_schema_version": "https://schemas.getdbt.com/dbt/catalog/v1.json"},
+        "nodes": {
+            "model.shop.stg_orders": _catalog_node("stg_orders", ["order_id", "customer_id"]),
+            "model.shop.orders": _catalog_node("orders", ["order_id", "buyer_id"]),
+        },
+        "sources": {},
+    }
+
+    target = tmp_path / "target"
+    target.mkdir()
+    (target / "manifest.json").write_text(json.dumps(manifest), encoding="utf-8")
+    (target / "catalog.json").write_text(json.dumps(catalog), encoding="utf-8")
+    return tmp_path
+
+
+def _write_project(project, nodes: dict, catalog_nodes: dict) -> None:
+    """Write manifest.json and catalog.json of a project with the given nodes."""
+    manifest = {
+        "metadata": {
+            "dbt_schema_version": "https://schemas.getdbt.com/dbt/manifest/v12.json",
+            "adapter_type": "duckdb",
+        },
+        "nodes": nodes,
+        "sources": {},
+        "macros": {},
+        "docs": {},
+        "exposures": {},
+        "metrics": {},
+        "groups": {},
+        "selectors": {},
+        "disabled": {},
+        "parent_map": {},
+        "child_map": {},
+        "group_map": {},
+        "saved_queries": {},
+        "semantic_models": {},
+        "unit_tests": {},
+    }
+    catalog = {
+        "metadata": {"dbt_schema_version": "https://schemas.getdbt.com/dbt/catalog/v1.json"},
+        "nodes": catalog_nodes,
+        "sources": {},
+    }
+    target = project / "target"
+    target.mkdir(parents=True)
+    (target / "manifest.json").write_text(json.dumps(manifest), encoding="utf-8")
+    (target / "catalog.json").write_text(json.dumps(catalog), encoding="utf-8")
+
+
+@pytest.fixture
+def dbt_mesh(tmp_path):
+    """
+    Write two projects of a dbt mesh.
+
+    ``core`` has the public model ``customers``; ``shop`` has ``orders``, which
+    joins ``stg_orders`` with ``core``'s ``customers``. The ``shop`` manifest
+    only knows ``customers`` through the cross-project ref in ``depends_on``.
+    """
+    core = tmp_path / "core"
+    _write_project(
+        core,
+        {
+            "model.core.customers": _model_node(
+                "customers", [], "select 1 as customer_id, 'a' as name", "core", "core"
+            )
+        },
+        {
+            "model.core.customers": _catalog_node(
+                "customers", ["customer_id", "name"], "core", "core"
+            )
+        },
+    )
+
+    shop = tmp_path / "shop"
+    orders_sql = (
+        "select o.order_id, c.name as customer_name "
+        'from "analytics"."main"."stg_orders" as o '
+        'join "analytics"."core"."customers" as c on c.customer_id = o.customer_id'
+    )
+    _write_project(
+        shop,
+        {
+            "model.shop.stg_orders": _model_node(
+                "stg_orders", [], "select 1 as order_id, 2 as customer_id"
+            ),
+            "model.shop.orders": _model_node(
+                "orders", ["model.shop.stg_orders", "model.core.customers"], orders_sql
+            ),
+        },
+        {
+            "model.shop.stg_orders": _catalog_node("stg_orders", ["order_id", "customer_id"]),
+            "model.shop.orders": _catalog_node("orders", ["order_id", "customer_name"]),
+        },
+    )
+    return [shop, core]
@@ -0,0 +1,119 @@
+"""Tests for reading artifacts with pluggable JSON backends and compression."""
+
+import gzip
+import json
+
+import pytest
+
+from dbt_to_cypher.artifacts import (
+    JSON_BACKEND_ENV,
+    find_artifact,
+    get_json_backend,
+    load_artifact,
+    open_artifact_text,
+)
+from dbt_to_cypher.extractor import DbtDependencyExtractor
+
+DOCUMENT = {"nodes": {"model.shop.orders": {"name": "orders", "description": "Commandes €"}}}
+
+
+def _compress(data, compression):
+    if compression == "gzip":
+        return gzip.compress(data)
+    if compression == "zstd":
+        zstandard = pytest.importorskip("zstandard")
+        return zstandard.ZstdCompressor().compress(data)
+    return data
+
+
+def _backend(name):
+    if name != "json":
+        pytest.importorskip(name)
+    return name
+
+
+@pytest.mark.parametrize("compression", [None, "gzip", "zstd"])
+@pytest.mark.parametrize("backend", ["orjson", "msgspec", "json"])
+def test_load_artifact_from_files_and_bytes(tmp_path, backend, compression):
+    """Test that every backend decodes plain and compressed files and bytes alike."""
+    data = _compress(json.dumps(DOCUMENT).encode("utf-8"), compression)
+    path = tmp_path / "manifest.json"
+    path.write_bytes(data)
+
+    assert load_artifact(path, _backend(backend)) == DOCUMENT
+    assert load_artifact(data, backend) == DOCUMENT
+    assert load_artifact(memoryview(data), backend) == DOCUMENT
+    with open_artifact_text(data) as fp:
+        assert json.load(fp) == DOCUMENT
+
+
+@pytest.mark.parametrize("backend", ["orjson", "msgspec", "json"])
+def test_invalid_json_raises_json_decode_error(tmp_path, backend):
+    """Test that all backends report invalid JSON with the stdlib error type."""
+    path = tmp_path / "manifest.json"
+    path.write_text('{"nodes": ')
+
+    with pytest.raises(json.JSONDecodeError):
+        load_artifact(path, _backend(backend))
+
+
+@pytest.mark.parametrize(
+    "document",
+    [
+        b'{"x": 123456789012345678901234567890}',
+        b"[-9223372036854775809, 18446744073709551616, -0.0, 0.1]",
+        b'{"rows": NaN, "max": Infinity, "huge": 1e400}',
+    ],
+)
+def test_auto_backend_decodes_like_stdlib(tmp_path, document):
+    """Test that installing a fast backend never changes decoded values."""
+    path = tmp_path / "catalog.json"
+    path.write_bytes(document)
+    expected = json.loads(document)
+
+    for source in (path, document):
+        # repr() tells 0.0 from -0.0 and compares NaN
+        assert repr(load_artifact(source, "auto")) == repr(expected)
+        assert repr(load_artifact(source, "json")) == repr(expected)
+
+
+def test_json_backend_selection(monkeypatch):
+    """Test backend selection by name, environment variable and preference."""
+    assert get_json_backend("json").name == "json"
+    monkeypatch.setenv(JSON_BACKEND_ENV, "json")
+    assert get_json_backend().name == "json"
+    monkeypatch.delenv(JSON_BACKEND_ENV)
+    assert get_json_backend().name in ("msgspec", "json")
+
+    with pytest.raises(ValueError):
+        get_json_backend("ujson")
+
+
+def test_find_artifact_prefers_plain_files(tmp_path):
+    """Test that compressed artifacts are found when the plain file is missing."""
+    assert find_artifact(tmp_path, "manifest.json") == tmp_path / "manifest.json"
+    (tmp_path / "manifest.json.gz").write_bytes(b"")
+    assert find_artifact(tmp_path, "manifest.json") == tmp_path / "manifest.json.gz"
+    (tmp_path / "manifest.json").write_bytes(b"")
+    assert find_artifact(tmp_path, "manifest.json") == tmp_path / "manifest.json"
+
+
+@pytest.mark.parametrize("lightweight", [False, True])
+def test_extractor_reads_compressed_and_in_memory_artifacts(dbt_project, tmp_path, lightweight):
+    """Test that gzip artifacts and artifacts given as bytes extract like plain files."""
+    expected = DbtDependencyExtractor(str(dbt_project), lightweight=lightweight).extract_all()
+    target = dbt_project / "target"
+    manifest = (target / "manifest.json").read_bytes()
+    catalog = (target / "catalog.json").read_bytes()
+
+    in_memory = DbtDependencyExtractor(
+        str(tmp_path), lightweight=lightweight, manifest=manifest, catalog=gzip.compress(catalog)
+    )
+    assert in_memory.extract_all() == expected
+
+    for name, data in (("manifest.json", manifest), ("catalog.json", catalog)):
+        (target / f"{name}.gz").write_bytes(gzip.compress(data))
+        (target / name).unlink()
+    compressed = DbtDependencyExtractor(str(dbt_project), lightweight=lightweight)
+    assert compressed.manifest_path == target / "manifest.json.gz"
+    assert compressed.extract_all() == expected
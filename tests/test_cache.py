@@ -0,0 +1,125 @@
+"""Tests for the on-disk column lineage cache."""
+
+import json
+import os
+
+import pytest
+
+from dbt_to_cypher import cache as cache_module
+from dbt_to_cypher.cache import BaseLineageCache, LineageCache, MemoryLineageCache
+from dbt_to_cypher.extractor import DbtDependencyExtractor
+from dbt_to_cypher.lineage import ColumnReference
+
+
+def test_put_get_roundtrip(tmp_path):
+    """Test storing and loading references, including models without lineage."""
+    cache = LineageCache(tmp_path / "cache")
+    references = {"id": [ColumnReference("orders", "main", None, "order_id")]}
+
+    cache.put("a", references)
+    cache.put("b", None)
+
+    assert cache.get("a") == (True, references)
+    assert cache.get("b") == (True, None)
+    assert cache.get("c") == (False, None)
+    assert (cache.hits, cache.misses) == (2, 1)
+
+
+def test_version_change_clears_cache(tmp_path, monkeypatch):
+    """Test that entries written by another library version are discarded."""
+    LineageCache(tmp_path).put("a", None)
+
+    monkeypatch.setattr(cache_module, "CACHE_FORMAT_VERSION", -1)
+    cache = LineageCache(tmp_path)
+
+    assert cache.get("a") == (False, None)
+
+
+def test_version_change_keeps_foreign_files(tmp_path, monkeypatch):
+    """Test that clearing the cache only removes its own entries."""
+    LineageCache(tmp_path).put("a", None)
+    (tmp_path / "important").mkdir()
+    (tmp_path / "important" / "data.txt").write_text("keep")
+    (tmp_path / "notes.txt").write_text("keep")
+
+    monkeypatch.setattr(cache_module, "CACHE_FORMAT_VERSION", -1)
+    LineageCache(tmp_path)
+
+    assert not (tmp_path / "a.json").exists()
+    assert (tmp_path / "important" / "data.txt").read_text() == "keep"
+    assert (tmp_path / "notes.txt").read_text() == "keep"
+
+
+def test_refuses_non_cache_directory(tmp_path):
+    """Test that a non-empty directory without a version stamp is left untouched."""
+    (tmp_path / "data.txt").write_text("keep")
+
+    with pytest.raises(ValueError):
+        LineageCache(tmp_path)
+
+    assert (tmp_path / "data.txt").read_text() == "keep"
+    assert not (tmp_path / "VERSION").exists()
+
+
+def test_prune_evicts_least_recently_used(tmp_path):
+    """Test that pruning keeps the cache within its size bound."""
+    cache = LineageCache(tmp_path, max_bytes=0)
+    cache.put("old", None)
+    cache.put("new", None)
+    os.utime(tmp_path / "old.json", (0, 0))
+    cache.max_bytes = (tmp_path / "new.json").stat().st_size
+
+    cache.prune()
+
+    assert not (tmp_path / "old.json").exists()
+    assert (tmp_path / "new.json").exists()
+
+
+def test_extractor_reuses_cached_lineage(dbt_project):
+    """Test that only models whose compiled SQL changed are recomputed."""
+    cache_dir = dbt_project / "target" / ".dbt_to_cypher_cache"
+    uncached = DbtDependencyExtractor(str(dbt_project)).extract_all()
+
+    first = LineageCache(cache_dir)
+    DbtDependencyExtractor(str(dbt_project), cache=first).extract_all()
+    assert (first.hits, first.misses) == (0, 2)
+
+    second = LineageCache(cache_dir)
+    cached = DbtDependencyExtractor(str(dbt_project), cache=second).extract_all()
+    assert (second.hits, second.misses) == (2, 0)
+    assert cached["column_dependencies"] == uncached["column_dependencies"]
+
+    manifest_path = dbt_project / "target" / "manifest.json"
+    manifest = json.loads(manifest_path.read_text())
+    manifest["nodes"]["model.shop.orders"]["compiled_code"] += " where 1 = 1"
+    manifest_path.write_text(json.dumps(manifest))
+
+    third = LineageCache(cache_dir)
+    DbtDependencyExtractor(str(dbt_project), cache=third).extract_all()
+    assert (third.hits, third.misses) == (1, 1)
+
+
+def test_memory_cache_prunes_unused_entries():
+    """Test that the in-memory cache keeps only entries used since the last prune."""
+    cache = MemoryLineageCache()
+    cache.put("kept", None)
+    cache.put("stale", None)
+    cache.prune()
+
+    assert cache.get("kept") == (True, None)
+    cache.prune()
+
+    assert cache.get("kept") == (True, None)
+    assert cache.get("stale") == (False, None)
+
+
+def test_caches_share_the_base_interface(tmp_path):
+    """Test that both caches are fully initialized BaseLineageCache implementations."""
+    for cache in (LineageCache(tmp_path), MemoryLineageCache()):
+        assert isinstance(cache, BaseLineageCache)
+        assert (cache.hits, cache.misses) == (0, 0)
+        cache.put("a", None)
+        assert cache.get("a") == (True, None)
+        cache.prune()
+        cache.log_stats()
+    assert not hasattr(MemoryLineageCache(), "directory")
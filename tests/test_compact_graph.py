@@ -0,0 +1,112 @@
+"""Tests for the compact graph backend."""
+
+import random
+
+import networkx as nx
+import pytest
+
+from dbt_to_cypher import compact_graph
+from dbt_to_cypher.compact_graph import CompactDependencyGraph
+from dbt_to_cypher.cypher import CypherGenerator
+from dbt_to_cypher.dbt_to_cypher import extract_dbt_project
+from dbt_to_cypher.graph import DependencyGraph
+
+
+def _build(graph):
+    graph.add_model("model_b", {"schema": "public", "rows": 2})
+    graph.add_column("model_a", "id", {"type": "INTEGER"})
+    graph.add_model("model_a", {"schema": "public"})
+    graph.add_column("model_b", "id", {"type": "INTEGER", "nullable": False})
+    graph.add_dependency("model_b", "model_a")
+    graph.add_dependency("model_b.id", "model_a.id")
+    # Reading adjacency in between must not lose later edges
+    graph.get_downstream_dependencies("model_b")
+    graph.add_dependency("model_b", "source.raw")
+    graph.add_dependency("model_b", "model_a", relationship="uses")
+    return graph
+
+
+def test_compact_graph_matches_networkx():
+    """Test that both backends expose the same nodes, edges and Cypher."""
+    expected = _build(DependencyGraph())
+    compact = _build(CompactDependencyGraph())
+
+    assert list(compact.nodes()) == list(expected.nodes())
+    assert list(compact.edges()) == list(expected.edges())
+    assert compact.number_of_edges() == expected.number_of_edges() == 5
+    for node, _ in expected.nodes():
+        assert compact.get_upstream_dependencies(node) == expected.get_upstream_dependencies(node)
+        assert compact.get_downstream_dependencies(node) == (
+            expected.get_downstream_dependencies(node)
+        )
+        assert compact.node_type(node) == expected.node_type(node)
+    assert CypherGenerator(compact).generate_all_queries() == (
+        CypherGenerator(expected).generate_all_queries()
+    )
+    assert CypherGenerator(compact).generate_batched_script(2) == (
+        CypherGenerator(expected).generate_batched_script(2)
+    )
+
+
+@pytest.mark.parametrize("min_fold_edges", [0, 1024])
+def test_interleaved_additions_and_reads(monkeypatch, min_fold_edges):
+    """Test that reads between additions see every edge, folded or not."""
+    monkeypatch.setattr(compact_graph, "_MIN_FOLD_EDGES", min_fold_edges)
+    folds = []
+    fold = CompactDependencyGraph._fold
+    monkeypatch.setattr(
+        CompactDependencyGraph, "_fold", lambda self: folds.append(None) or fold(self)
+    )
+    rng = random.Random(0)
+    expected = DependencyGraph()
+    compact = CompactDependencyGraph()
+
+    for i in range(500):
+        source, target = f"node_{rng.randrange(60)}", f"node_{rng.randrange(60)}"
+        relationship = rng.choice(["depends_on", "uses"])
+        for graph in (expected, compact):
+            graph.add_dependency(source, target, relationship)
+        assert compact.get_downstream_dependencies(source) == (
+            expected.get_downstream_dependencies(source)
+        )
+        assert compact.get_upstream_dependencies(target) == (
+            expected.get_upstream_dependencies(target)
+        )
+        assert compact.number_of_edges() == expected.number_of_edges()
+        if i % 50 == 0:
+            assert list(compact.edges()) == list(expected.edges())
+
+    assert list(compact.edges()) == list(expected.edges())
+    # Folding only once pending edges outnumber a fraction of the folded ones
+    # keeps the number of rebuilds logarithmic in the number of edges
+    assert len(folds) <= (40 if min_fold_edges == 0 else 0)
+
+
+def test_networkx_view_is_cached_until_modified():
+    """Test that the materialized DiGraph is reused and refreshed after changes."""
+    compact = _build(CompactDependencyGraph())
+
+    view = compact.graph
+    assert compact.graph is view
+    compact.add_dependency("model_a", "source.raw")
+    assert compact.graph is not view
+    assert compact.graph.has_edge("model_a", "source.raw")
+
+
+def test_compact_graph_networkx_roundtrip():
+    """Test converting to and from networkx."""
+    compact = _build(CompactDependencyGraph())
+
+    restored = CompactDependencyGraph.from_dict(compact.to_dict())
+
+    assert nx.utils.graphs_equal(restored.graph, compact.graph)
+    assert list(restored.edges()) == list(compact.edges())
+    with pytest.raises(nx.NetworkXError):
+        compact.get_upstream_dependencies("missing")
+
+
+def test_extract_dbt_project_with_compact_backend(dbt_project):
+    """Test that the backend does not change the generated script."""
+    assert extract_dbt_project(dbt_project, graph_backend="compact") == (
+        extract_dbt_project(dbt_project)
+    )
@@ -1,6 +1,12 @@
 """Tests for the CypherGenerator class."""
 
-from dbt_to_cypher.cypher import CypherGenerator
+import io
+
+import pytest
+
+from dbt_to_cypher import cypher
+from dbt_to_cypher.cypher import CypherGenerator, cypher_literal, write_queries
+from dbt_to_cypher.dbt_to_cypher import iter_cypher_queries
 from dbt_to_cypher.graph import DependencyGraph
 
 
@@ -69,3 +75,136 @@ def test_generate_all_queries():
     assert isinstance(script, str)
     assert "MERGE" in script
     assert script.endswith(";")
+
+
+def test_generate_batched_queries():
+    """Test grouping nodes by label and edges by type into UNWIND batches."""
+    graph = DependencyGraph()
+    for name in ("model_a", "model_b", "model_c"):
+        graph.add_model(name, {"schema": "public"})
+    graph.add_column("model_a", "id")
+    graph.add_dependency("model_b", "model_a")
+    graph.add_dependency("model_c", "model_a")
+    generator = CypherGenerator(graph)
+
+    statements = generator.generate_batched_queries(batch_size=2)
+    shapes = [statement for statement, _ in statements]
+
+    assert shapes == [
+        "CREATE CONSTRAINT model_name IF NOT EXISTS FOR (m:Model) REQUIRE m.name IS UNIQUE",
+        "CREATE CONSTRAINT column_id IF NOT EXISTS FOR (c:Column) REQUIRE c.id IS UNIQUE",
+        "UNWIND $rows AS row MERGE (n:Model {name: row.name}) SET n += row",
+        "UNWIND $rows AS row MERGE (n:Model {name: row.name}) SET n += row",
+        "UNWIND $rows AS row MERGE (n:Column {id: row.id}) SET n += row",
+        "UNWIND $rows AS row MATCH (s:Model {name: row.source}), (t:Column {id: row.target}) "
+        "MERGE (s)-[:HAS_COLUMN]->(t)",
+        "UNWIND $rows AS row MATCH (s:Model {name: row.source}), (t:Model {name: row.target}) "
+        "MERGE (s)-[:DEPENDS_ON]->(t)",
+    ]
+    assert statements[0][1] == {}
+    assert statements[2][1] == {
+        "rows": [
+            {"schema": "public", "name": "model_a"},
+            {"schema": "public", "name": "model_b"},
+        ]
+    }
+    assert statements[6][1] == {
+        "rows": [
+            {"source": "model_b", "target": "model_a"},
+            {"source": "model_c", "target": "model_a"},
+        ]
+    }
+
+
+def test_batched_rows_are_built_one_batch_at_a_time(monkeypatch):
+    """Test that a batch is emitted before the rows of later batches are built."""
+    graph = DependencyGraph()
+    for i in range(10):
+        graph.add_column(f"model_{i}", "id")
+    built = []
+    monkeypatch.setattr(cypher, "exportable_properties", lambda attrs: built.append(attrs) or {})
+
+    batches = CypherGenerator(graph).iter_node_batches(batch_size=3)
+    statement, parameters = next(batches)
+
+    assert "(n:Column" in statement
+    assert len(parameters["rows"]) == len(built) == 3
+    assert [len(parameters["rows"]) for _, parameters in batches] == [3, 3, 1, 3, 3, 3, 1]
+
+
+def test_generate_batched_script():
+    """Test inlining batch rows as Cypher literals."""
+    graph = DependencyGraph()
+    graph.add_model("model_a", {"description": 'say "hi"', "row count": 3, "enabled": True})
+    generator = CypherGenerator(graph)
+
+    script = generator.generate_batched_script()
+
+    assert script.endswith(
+        'UNWIND [{description: "say \\"hi\\"", `row count`: 3, enabled: true, '
+        'name: "model_a"}] AS row MERGE (n:Model {name: row.name}) SET n += row;'
+    )
+
+
+def test_cypher_literal_non_finite_floats():
+    """Test that NaN and infinities, which Cypher cannot express, become null."""
+    assert cypher_literal({"a": float("nan"), "b": [float("inf"), -float("inf"), 1.5]}) == (
+        "{a: null, b: [null, null, 1.5]}"
+    )
+
+
+def test_batch_size_must_be_positive():
+    """Test that a batch size of 0 is rejected rather than meaning unbatched."""
+    graph = DependencyGraph()
+    graph.add_model("model_a")
+
+    with pytest.raises(ValueError):
+        list(iter_cypher_queries(graph, batch_size=0))
+
+
+def test_generate_constraint_queries():
+    """Test that the script creates key constraints before loading data."""
+    graph = DependencyGraph()
+    graph.add_model("model_a")
+    generator = CypherGenerator(graph)
+
+    script = generator.generate_all_queries()
+
+    assert generator.generate_constraint_queries() == [
+        "CREATE CONSTRAINT model_name IF NOT EXISTS FOR (m:Model) REQUIRE m.name IS UNIQUE",
+        "CREATE CONSTRAINT column_id IF NOT EXISTS FOR (c:Column) REQUIRE c.id IS UNIQUE",
+    ]
+    assert script.startswith("CREATE CONSTRAINT model_name IF NOT EXISTS")
+
+
+def test_relationship_query_matches_label_and_key():
+    """Test that relationship statements match on the endpoint label and key."""
+    graph = DependencyGraph()
+    graph.add_model("model_a", {"schema": "public"})
+    graph.add_column("model_a", "id")
+    generator = CypherGenerator(graph)
+
+    assert generator.generate_node_queries()[0] == (
+        "MERGE (m:Model {name: 'model_a'}) SET m += {schema: 'public'}"
+    )
+    assert generator.generate_relationship_queries() == [
+        "MATCH (s:Model {name: 'model_a'}), (t:Column {id: 'model_a.id'}) "
+        "MERGE (s)-[:HAS_COLUMN]->(t)"
+    ]
+
+
+def test_write_queries_streams_script():
+    """Test that streamed statements match the generated script."""
+    graph = DependencyGraph()
+    graph.add_model("model_a", {"schema": "public"})
+    graph.add_column("model_a", "id")
+    generator = CypherGenerator(graph)
+    buffer = io.StringIO()
+
+    count = write_queries(generator.iter_all_queries(), buffer)
+
+    assert count == 5
+    assert buffer.getvalue() == generator.generate_all_queries() + "\n"
+    assert list(generator.iter_batched_script_queries(1)) == (
+        generator.generate_batched_script(1)[:-1].split(";\n")
+    )
@@ -1,8 +1,18 @@
 """Tests for the dbt_to_cypher module."""
 
+import json
+import sys
+
+import pytest
+
+from dbt_to_cypher import cli
 from dbt_to_cypher.dbt_to_cypher import (
+    analyze_impact,
     build_dependency_graph,
+    extract_dbt_project,
     generate_cypher_queries,
+    write_dbt_project,
+    write_impact_json,
 )
 from dbt_to_cypher.graph import DependencyGraph
 
@@ -83,3 +93,44 @@ def test_generate_cypher_queries_with_models():
 
     assert isinstance(cypher_script, str)
     assert "Model" in cypher_script or "model" in cypher_script.lower()
+
+
+def test_write_dbt_project_streams_to_file_and_stdout(dbt_project, tmp_path, capsys):
+    """Test that the streamed script matches the generated one."""
+    output = tmp_path / "out.cypher"
+
+    count = write_dbt_project(dbt_project, output)
+    write_dbt_project(dbt_project)
+
+    script = extract_dbt_project(dbt_project)
+    assert count == script.count(";\n") + 1
+    assert output.read_text() == script + "\n"
+    assert capsys.readouterr().out == script + "\n"
+
+
+def test_analyze_impact_writes_json(dbt_project, tmp_path):
+    """Test the project-level impact analysis and its JSON output."""
+    output = tmp_path / "impact.json"
+
+    impact = analyze_impact(
+        dbt_project, ["model.shop.stg_orders.customer_id"], relationships=["depends_on"]
+    )
+    write_impact_json(impact, output)
+
+    assert json.loads(output.read_text()) == {
+        "model.shop.orders.buyer_id": {
+            "distance": 1,
+            "sources": ["model.shop.stg_orders.customer_id"],
+        }
+    }
+
+
+def test_cli_rejects_non_positive_batch_size(dbt_project, monkeypatch, capsys):
+    """Test that --batch-size 0 is a usage error instead of silently unbatched output."""
+    monkeypatch.setattr(sys, "argv", ["dbt-to-cypher", str(dbt_project), "--batch-size", "0"])
+
+    with pytest.raises(SystemExit) as exc_info:
+        cli.main()
+
+    assert exc_info.value.code == 2
+    assert "--batch-size" in capsys.readouterr().err
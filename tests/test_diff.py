@@ -0,0 +1,92 @@
+"""Tests for the graph diff module."""
+
+import pytest
+
+from dbt_to_cypher.cypher import CypherGenerator
+from dbt_to_cypher.dbt_to_cypher import extract_dbt_project, generate_cypher_diff
+from dbt_to_cypher.diff import diff_graphs, load_graph_state, save_graph_state
+from dbt_to_cypher.graph import DependencyGraph
+
+
+def _graph(schema: str = "public") -> DependencyGraph:
+    graph = DependencyGraph()
+    graph.add_model("model_a", {"schema": schema})
+    graph.add_model("model_b", {"schema": "public"})
+    graph.add_column("model_a", "id")
+    graph.add_dependency("model_b", "model_a")
+    return graph
+
+
+def test_diff_identical_graphs():
+    """Test that identical graphs produce an empty diff."""
+    diff = diff_graphs(_graph(), _graph())
+
+    assert diff.is_empty()
+    assert generate_cypher_diff(_graph(), _graph()) == ""
+
+
+def test_diff_added_changed_removed():
+    """Test detecting added, changed and removed nodes and edges."""
+    previous = _graph()
+    previous.add_model("model_old")
+    previous.add_dependency("model_old", "model_b")
+    current = _graph(schema="analytics")
+    current.add_model("model_c")
+    current.add_dependency("model_c", "model_a")
+
+    diff = diff_graphs(previous, current)
+
+    assert diff.added_nodes == ["model_c"]
+    assert diff.changed_nodes == ["model_a"]
+    assert diff.removed_nodes == {"model_old": "model"}
+    assert diff.added_edges == [("model_c", "model_a", "depends_on")]
+    # The edge of the removed node is dropped by DETACH DELETE
+    assert diff.removed_edges == []
+
+
+def test_diff_relationship_type_change():
+    """Test that a changed relationship type is deleted and re-created."""
+    previous = _graph()
+    current = _graph()
+    current.add_dependency("model_b", "model_a", relationship="feeds")
+
+    diff = diff_graphs(previous, current)
+
+    assert diff.removed_edges == [("model_b", "model_a", "depends_on")]
+    assert diff.added_edges == [("model_b", "model_a", "feeds")]
+
+
+def test_generate_diff_queries():
+    """Test the Cypher emitted for a diff."""
+    previous = _graph()
+    previous.add_model("model_old")
+    current = _graph(schema="analytics")
+
+    queries = CypherGenerator(current).generate_diff_queries(diff_graphs(previous, current))
+
+    assert queries == [
+        "MATCH (m:Model {name: 'model_old'}) DETACH DELETE m",
+        "MERGE (m:Model {name: 'model_a'}) SET m = {name: 'model_a', schema: 'analytics'}",
+    ]
+
+
+@pytest.mark.parametrize("filename", ["state.json", "state.snapshot"])
+def test_save_and_load_graph_state(tmp_path, filename):
+    """Test that a saved graph state round-trips to an empty diff."""
+    graph = _graph()
+    graph.add_model("model_c", {"columns": {"id": object()}})
+    path = tmp_path / filename
+
+    save_graph_state(graph, path)
+
+    assert diff_graphs(load_graph_state(path), graph).is_empty()
+
+
+def test_extract_dbt_project_with_state(dbt_project, tmp_path):
+    """Test that a run against its own saved state emits nothing."""
+    state_path = tmp_path / "state.json"
+    full_script = extract_dbt_project(dbt_project, save_state=state_path)
+
+    assert "MERGE" in full_script
+    assert extract_dbt_project(dbt_project, state=state_path) == ""
+    assert extract_dbt_project(dbt_project, state=dbt_project / "target") == ""
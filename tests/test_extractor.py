@@ -1,8 +1,16 @@
 """Tests for the DbtDependencyExtractor class."""
 
+import builtins
+import multiprocessing
+from collections import Counter
 from pathlib import Path
 
+import pytest
+
+from dbt_to_cypher import lineage
+from dbt_to_cypher.dbt_to_cypher import build_dependency_graph
 from dbt_to_cypher.extractor import DbtDependencyExtractor
+from dbt_to_cypher.projection import PropertyProjection
 
 
 def test_extractor_initialization():
@@ -13,3 +21,132 @@ def test_extractor_initialization():
     assert extractor.project_path == project_path
     assert extractor.manifest_path == project_path / "target" / "manifest.json"
     assert extractor.catalog_path == project_path / "target" / "catalog.json"
+
+
+def test_lightweight_matches_full_manifest(dbt_project):
+    """Test that lightweight loading yields the same models and dependencies."""
+    full = DbtDependencyExtractor(str(dbt_project))
+    full.load_file()
+    lightweight = DbtDependencyExtractor(str(dbt_project), lightweight=True)
+    lightweight.load_file()
+
+    assert lightweight.extract_models() == full.extract_models()
+    assert lightweight.extract_model_dependencies() == full.extract_model_dependencies()
+
+
+@pytest.mark.parametrize("lightweight", [False, True])
+def test_extract_all_reads_each_artifact_once(dbt_project, monkeypatch, lightweight):
+    """Test that manifest and catalog are read from disk exactly once per run."""
+    opened: Counter = Counter()
+    real_open = builtins.open
+
+    def counting_open(file, *args, **kwargs):
+        opened[Path(file).name] += 1
+        return real_open(file, *args, **kwargs)
+
+    monkeypatch.setattr(builtins, "open", counting_open)
+    result = DbtDependencyExtractor(str(dbt_project), lightweight=lightweight).extract_all()
+
+    assert opened["manifest.json"] == 1
+    assert opened["catalog.json"] == 1
+    assert result["column_dependencies"]["model.shop.orders.buyer_id"] == [
+        "model.shop.stg_orders.customer_id"
+    ]
+
+
+@pytest.mark.parametrize("start_method", ["fork", "spawn"])
+def test_parallel_column_lineage_matches_serial(dbt_project, monkeypatch, start_method):
+    """Test that process-pool lineage returns the same result as a serial run."""
+    if start_method not in multiprocessing.get_all_start_methods():
+        pytest.skip(f"{start_method} is not available")
+    # Forked workers inherit the artifacts, spawned ones receive them pickled
+    context = multiprocessing.get_context(start_method)
+    monkeypatch.setattr(lineage.multiprocessing, "get_context", lambda: context)
+    serial = DbtDependencyExtractor(str(dbt_project)).extract_all()
+    parallel = DbtDependencyExtractor(str(dbt_project), jobs=2).extract_all()
+
+    assert parallel["column_dependencies"] == serial["column_dependencies"]
+    assert list(parallel["column_dependencies"]) == list(serial["column_dependencies"])
+    assert lineage._inherited_artifacts is None
+
+
+@pytest.mark.parametrize("lightweight", [False, True])
+def test_selection_limits_column_lineage(dbt_project, monkeypatch, lightweight):
+    """Test that only selected models are extracted and parsed for lineage."""
+    from dbt_to_cypher import lineage
+
+    parsed = []
+    real_compute = lineage._compute_lineage_references
+
+    def recording_compute(manifest, catalog, models, jobs):
+        parsed.append(set(models))
+        return real_compute(manifest, catalog, models, jobs)
+
+    monkeypatch.setattr(lineage, "_compute_lineage_references", recording_compute)
+    result = DbtDependencyExtractor(
+        str(dbt_project), lightweight=lightweight, select=["orders"]
+    ).extract_all()
+
+    assert parsed == [{"model.shop.orders"}]
+    assert list(result["models"]) == ["model.shop.orders"]
+    assert set(result["columns"]) == {"model.shop.orders.order_id", "model.shop.orders.buyer_id"}
+    # References to the unselected upstream model still resolve
+    assert result["column_dependencies"]["model.shop.orders.buyer_id"] == [
+        "model.shop.stg_orders.customer_id"
+    ]
+
+
+def test_default_projection_leaves_catalog_columns_off_models(dbt_project):
+    """Test that models only carry their scalar properties, not catalog column objects."""
+    result = DbtDependencyExtractor(str(dbt_project)).extract_all()
+
+    assert result["models"]["model.shop.orders"] == {
+        "fqn": "analytics.main.orders",
+        "materialization": "table",
+        "database": "analytics",
+        "schema": "main",
+        "resource_type": "model",
+    }
+    assert result["columns"]["model.shop.orders.buyer_id"] == {
+        "type": "INTEGER",
+        "index": 2,
+        "name": "model.shop.orders.buyer_id",
+        "comment": None,
+        "model_name": "model.shop.orders",
+    }
+
+
+@pytest.mark.parametrize("lightweight", [False, True])
+def test_projection_selects_extracted_properties(dbt_project, lightweight):
+    """Test that allowlists and denylists apply per node type at extraction."""
+    projection = PropertyProjection.parse(
+        include=["model:name,package_name"], exclude=["column:comment,model_name,index"]
+    )
+    result = DbtDependencyExtractor(
+        str(dbt_project), lightweight=lightweight, projection=projection
+    ).extract_all()
+
+    assert result["models"]["model.shop.orders"] == {"name": "orders", "package_name": "shop"}
+    assert result["columns"]["model.shop.orders.buyer_id"] == {
+        "type": "INTEGER",
+        "name": "model.shop.orders.buyer_id",
+    }
+    # Columns are still attached to their model without a model_name property
+    graph = build_dependency_graph(result)
+    assert graph.get_downstream_dependencies("model.shop.orders") >= {"model.shop.orders.buyer_id"}
+
+
+@pytest.mark.parametrize(
+    "projection",
+    [PropertyProjection(), PropertyProjection.parse(include=["column:model_name,type"])],
+)
+def test_raw_catalog_columns_match_pydantic_catalog(dbt_project, projection):
+    """Test that the raw catalog fast path yields the same columns as the Pydantic catalog."""
+    extractor = DbtDependencyExtractor(str(dbt_project), projection=projection, select=["orders"])
+    extractor.load_file()
+    fast = extractor.extract_columns()
+    extractor.catalog_dict = None
+    validated = extractor.extract_columns()
+
+    assert fast == validated
+    assert list(fast) == ["model.shop.orders.order_id", "model.shop.orders.buyer_id"]
@@ -1,6 +1,13 @@
 """Tests for the DependencyGraph class."""
 
+import random
+
+import networkx as nx
+import pytest
+
+from dbt_to_cypher.compact_graph import CompactDependencyGraph
 from dbt_to_cypher.graph import DependencyGraph
+from dbt_to_cypher.reachability import ReachabilityIndex
 
 
 def test_graph_initialization():
@@ -69,3 +76,128 @@ def test_get_downstream_dependencies():
 
     downstream = graph.get_downstream_dependencies("model_a")
     assert downstream == {"model_b", "model_c"}
+
+
+def test_to_dict_from_dict_roundtrip():
+    """Test rebuilding a graph from its dictionary export."""
+    graph = DependencyGraph()
+    graph.add_model("model_a", {"schema": "public"})
+    graph.add_column("model_a", "id")
+
+    restored = DependencyGraph.from_dict(graph.to_dict())
+
+    assert dict(restored.graph.nodes(data=True)) == dict(graph.graph.nodes(data=True))
+    assert list(restored.graph.edges(data=True)) == list(graph.graph.edges(data=True))
+
+
+def test_get_all_dependencies_depth_and_relationships():
+    """Test transitive queries with depth limits and relationship filters."""
+    graph = DependencyGraph()
+    graph.add_dependency("model_a", "model_b")
+    graph.add_dependency("model_b", "model_c")
+    graph.add_column("model_c", "id")
+
+    assert graph.get_all_downstream_dependencies("model_a") == {"model_b", "model_c", "model_c.id"}
+    assert graph.get_all_downstream_dependencies("model_a", max_depth=1) == {"model_b"}
+    assert graph.get_all_downstream_dependencies("model_a", relationships={"depends_on"}) == {
+        "model_b",
+        "model_c",
+    }
+    assert graph.get_all_upstream_dependencies("model_c.id") == {"model_a", "model_b", "model_c"}
+    assert graph.get_all_upstream_dependencies("model_c.id", max_depth=2) == {"model_b", "model_c"}
+
+
+def test_get_all_dependencies_invalidated_on_mutation():
+    """Test that the reachability index is rebuilt after the graph changes."""
+    graph = DependencyGraph()
+    graph.add_dependency("model_a", "model_b")
+    assert graph.get_all_downstream_dependencies("model_a") == {"model_b"}
+
+    graph.add_dependency("model_b", "model_c")
+    assert graph.get_all_downstream_dependencies("model_a") == {"model_b", "model_c"}
+
+    graph.graph.add_edge("model_c", "model_d")
+    assert graph.get_all_downstream_dependencies("model_a") == {"model_b", "model_c", "model_d"}
+
+
+@pytest.mark.parametrize("backend", [DependencyGraph, CompactDependencyGraph])
+def test_get_all_dependencies_match_networkx(backend):
+    """Test transitive queries against networkx on a random graph with cycles."""
+    rng = random.Random(7)
+    graph = backend()
+    for _ in range(300):
+        graph.add_dependency(f"n{rng.randrange(80)}", f"n{rng.randrange(80)}")
+    expected = graph.graph
+
+    for node in expected.nodes:
+        assert graph.get_all_downstream_dependencies(node) == nx.descendants(expected, node) - {
+            node
+        }
+        assert graph.get_all_upstream_dependencies(node) == nx.ancestors(expected, node) - {node}
+        assert graph.get_all_downstream_dependencies(node, max_depth=2) == (
+            set(nx.single_source_shortest_path_length(expected, node, cutoff=2)) - {node}
+        )
+
+
+@pytest.mark.parametrize("backend", [DependencyGraph, CompactDependencyGraph])
+def test_get_impact_matches_per_node_traversals(backend):
+    """Test the batch impact analysis against one traversal per changed node."""
+    rng = random.Random(11)
+    graph = backend()
+    for _ in range(300):
+        graph.add_dependency(f"n{rng.randrange(80)}", f"n{rng.randrange(80)}")
+    reverse = graph.graph.reverse()
+    changed = [f"n{i}" for i in rng.sample(range(80), 10)]
+
+    impact = graph.get_impact(changed)
+
+    expected: dict[str, tuple[int, list[str]]] = {}
+    for source in changed:
+        for node, distance in nx.single_source_shortest_path_length(reverse, source).items():
+            if node in changed:
+                continue
+            best, sources = expected.get(node, (distance, []))
+            expected[node] = (min(best, distance), [*sources, source])
+    actual = {
+        node: (value.distance, value.sources)
+        for node, value in impact.items()
+        if node not in changed
+    }
+    assert actual == expected
+
+
+def test_get_impact_follows_relationship_filter():
+    """Test impact analysis restricted to column lineage."""
+    graph = DependencyGraph()
+    graph.add_column("stg", "id")
+    graph.add_column("orders", "id")
+    graph.add_column("orders", "stg_id")
+    graph.add_dependency("orders.stg_id", "stg.id")
+    graph.add_dependency("orders", "stg")
+
+    impact = graph.get_impact(["stg.id"], relationships={"depends_on"})
+
+    assert impact == {"orders.stg_id": (1, ["stg.id"])}
+    assert graph.get_impact(["stg.id"])["orders"] == (2, ["stg.id"])
+
+
+def test_get_impact_ignores_repeated_start_nodes():
+    """Test that a start node given twice is reported once."""
+    graph = DependencyGraph()
+    graph.add_dependency("orders", "stg")
+    graph.add_dependency("stg", "raw")
+
+    impact = graph.get_impact(["raw", "stg", "raw"])
+
+    assert impact == {"stg": (1, ["raw"]), "orders": (1, ["raw", "stg"])}
+
+
+def test_reachability_memo_is_bounded_by_stored_nodes():
+    """Test that memoized closures never hold more nodes in total than the memo size."""
+    chain = [f"n{i}" for i in range(20)]
+    index = ReachabilityIndex(zip(chain, chain[1:]), memo_size=30)
+
+    for position, node in enumerate(chain):
+        assert index.reachable(node) == set(chain[position + 1 :])
+        assert sum(len(closure) for closure in index._memo.values()) <= 30
+    assert index._memo
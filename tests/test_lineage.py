@@ -0,0 +1,55 @@
+"""Tests for the lineage helpers."""
+
+import json
+
+from dbt_to_cypher.lineage import RelationIndex, create_lineage_extractor
+
+
+def _index() -> RelationIndex:
+    index = RelationIndex()
+    index.add("model.shop.orders", ["orders"], schema="main", database="analytics")
+    index.add("model.billing.orders", ["orders", "billing_orders"], schema="billing")
+    index.add("model.shop.customers", ["customers", "dim_customers"], schema="main")
+    return index
+
+
+def test_resolve_by_name_and_alias():
+    """Test resolving unique table names and aliases."""
+    index = _index()
+
+    assert index.resolve("customers") == "model.shop.customers"
+    assert index.resolve("DIM_CUSTOMERS") == "model.shop.customers"
+    assert index.resolve("billing_orders") == "model.billing.orders"
+    assert index.resolve("missing") is None
+
+
+def test_resolve_qualified_relation():
+    """Test that schema and database qualifiers disambiguate colliding names."""
+    index = _index()
+
+    assert index.resolve("orders", schema="main", database="analytics") == "model.shop.orders"
+    assert index.resolve("orders", schema="billing") == "model.billing.orders"
+
+
+def test_resolve_ambiguous_name():
+    """Test that an ambiguous bare name only resolves with candidates."""
+    index = _index()
+
+    assert index.resolve("orders") is None
+    assert index.resolve("orders", candidates=["model.billing.orders"]) == "model.billing.orders"
+
+
+def test_lineage_extractor_restores_dbt_colibri_reader(dbt_project):
+    """Test that handing loaded artifacts to dbt-colibri does not patch it for good."""
+    from dbt_colibri.utils import json_utils
+
+    read_json = json_utils.read_json
+    target = dbt_project / "target"
+    manifest = json.loads((target / "manifest.json").read_text())
+    catalog = json.loads((target / "catalog.json").read_text())
+
+    extractor = create_lineage_extractor(manifest, catalog)
+
+    assert extractor.manifest is manifest
+    assert extractor.catalog is catalog
+    assert json_utils.read_json is read_json
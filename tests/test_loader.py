@@ -0,0 +1,165 @@
+"""Tests for the Neo4j Bolt loader, run against an in-process fake driver."""
+
+import threading
+
+import pytest
+
+from dbt_to_cypher.cypher import CypherGenerator
+from dbt_to_cypher.graph import DependencyGraph
+from dbt_to_cypher.loader import LoadSummary, Neo4jLoader
+
+
+class TransientError(Exception):
+    """Stand-in for neo4j.exceptions.TransientError."""
+
+
+class FakeTransaction:
+    def __init__(self, driver):
+        self.driver = driver
+        self.statements = []
+
+    def run(self, query, parameters):
+        with self.driver.lock:
+            if self.driver.failures:
+                raise self.driver.failures.pop(0)
+        self.statements.append((query, parameters))
+
+    def commit(self):
+        with self.driver.lock:
+            self.driver.committed.extend(self.statements)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+class FakeSession:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def begin_transaction(self):
+        return FakeTransaction(self.driver)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+class FakeDriver:
+    """Records committed statements; raises queued failures on the next runs."""
+
+    def __init__(self, failures=()):
+        self.lock = threading.Lock()
+        self.failures = list(failures)
+        self.committed = []
+        self.databases = set()
+
+    def session(self, database=None):
+        self.databases.add(database)
+        return FakeSession(self)
+
+
+def _graph():
+    graph = DependencyGraph()
+    for i in range(5):
+        graph.add_model(f"model_{i}", {"schema": "public"})
+        graph.add_column(f"model_{i}", "id")
+        if i:
+            graph.add_dependency(f"model_{i}", f"model_{i - 1}")
+    return graph
+
+
+def test_load_writes_constraints_nodes_then_relationships():
+    """Test that nodes are loaded before relationships, in batches."""
+    driver = FakeDriver()
+
+    summary = Neo4jLoader(driver, database="lineage", batch_size=2, workers=3).load(_graph())
+
+    queries = [query for query, _ in driver.committed]
+    assert queries[0].startswith("CREATE CONSTRAINT model_name")
+    assert queries[1].startswith("CREATE CONSTRAINT column_id")
+    last_node = max(i for i, query in enumerate(queries) if "MERGE (n:" in query)
+    first_relationship = min(i for i, query in enumerate(queries) if "MERGE (s)-" in query)
+    assert last_node < first_relationship
+    # 10 nodes and 9 relationships in batches of 2 rows
+    assert summary == LoadSummary(transactions=2 + 6 + 5, rows=19, retries=0)
+    assert driver.databases == {"lineage"}
+
+
+def test_load_retries_transient_errors():
+    """Test that transient errors are retried."""
+    driver = FakeDriver(failures=[TransientError("deadlock"), TransientError("deadlock")])
+
+    summary = Neo4jLoader(driver, backoff=0).load(_graph())
+
+    assert summary.retries == 2
+    assert summary.rows == 19
+    assert len(driver.committed) == summary.transactions
+
+
+def test_load_raises_other_errors():
+    """Test that non-transient errors and exhausted retries are raised."""
+    with pytest.raises(ValueError):
+        Neo4jLoader(FakeDriver(failures=[ValueError("syntax")])).load(_graph())
+
+    failures = [TransientError("unavailable")] * 3
+    with pytest.raises(TransientError):
+        Neo4jLoader(FakeDriver(failures=failures), max_retries=2, backoff=0).load(_graph())
+
+
+def test_load_stops_after_a_failed_node_batch(monkeypatch):
+    """Test that batches are generated just ahead of the writers and dropped after a failure."""
+    graph = DependencyGraph()
+    for i in range(50):
+        graph.add_model(f"model_{i}")
+    generated = []
+    iter_node_batches = CypherGenerator.iter_node_batches
+
+    def counting_node_batches(self, *args, **kwargs):
+        for batch in iter_node_batches(self, *args, **kwargs):
+            generated.append(batch)
+            yield batch
+
+    run = FakeTransaction.run
+
+    def failing_run(self, query, parameters):
+        if parameters.get("rows") == [{"name": "model_1"}]:
+            raise ValueError("constraint violated")
+        run(self, query, parameters)
+
+    monkeypatch.setattr(CypherGenerator, "iter_node_batches", counting_node_batches)
+    monkeypatch.setattr(FakeTransaction, "run", failing_run)
+    driver = FakeDriver()
+
+    with pytest.raises(ValueError):
+        Neo4jLoader(driver, batch_size=1, workers=2).load(graph)
+
+    node_rows = [parameters["rows"] for _, parameters in driver.committed if "rows" in parameters]
+    # At most 2 * workers batches are in flight when the failure is seen
+    assert len(generated) <= 2 + 2 * 2
+    assert len(node_rows) < len(generated)
+    assert [{"name": "model_49"}] not in node_rows
+
+
+def test_load_part_of_a_graph():
+    """Test that a load can be restricted to some nodes and edges, e.g. column lineage."""
+    driver = FakeDriver()
+    graph = _graph()
+    graph.add_dependency("model_1.id", "model_0.id")
+
+    summary = Neo4jLoader(driver).load(
+        graph, nodes=["model_1.id"], edges=[("model_1.id", "model_0.id", "depends_on")]
+    )
+
+    rows = [parameters.get("rows") for _, parameters in driver.committed]
+    assert rows == [
+        None,
+        None,
+        [{"id": "model_1.id"}],
+        [{"source": "model_1.id", "target": "model_0.id"}],
+    ]
+    assert summary == LoadSummary(transactions=4, rows=2, retries=0)
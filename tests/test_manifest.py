@@ -0,0 +1,57 @@
+"""Tests for the streaming manifest loader."""
+
+import io
+import json
+
+import pytest
+
+from dbt_to_cypher.manifest import (
+    ManifestNode,
+    iter_manifest_sections,
+    load_lightweight_manifest,
+)
+
+
+def test_iter_manifest_sections_small_chunks():
+    """Test that values spanning chunk boundaries are decoded correctly."""
+    manifest = {
+        "metadata": {"adapter_type": "duckdb", "count": 12345},
+        "macros": {"macro.a": {"macro_sql": "x" * 100, "args": [1, [2, {"3": 4}]]}},
+        "nodes": {
+            "model.p.a": {"name": "a", "depends_on": {"nodes": []}},
+            "test.p.t": {"name": "t"},
+            "seed.p.s": {"name": "s", "rows": 1.5e3},
+        },
+        "parent_map": {"model.p.a": []},
+    }
+    fp = io.StringIO(json.dumps(manifest, indent=2))
+
+    entries = list(iter_manifest_sections(fp, {"metadata", "nodes"}, chunk_size=7))
+
+    assert entries == [
+        ("metadata", "", manifest["metadata"]),
+        ("nodes", "model.p.a", manifest["nodes"]["model.p.a"]),
+        ("nodes", "seed.p.s", manifest["nodes"]["seed.p.s"]),
+    ]
+
+
+def test_iter_manifest_sections_invalid_json():
+    """Test that truncated input raises a JSON decode error."""
+    fp = io.StringIO('{"nodes": {"model.p.a": {"name": ')
+
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_manifest_sections(fp, {"nodes"}))
+
+
+def test_load_lightweight_manifest(dbt_project):
+    """Test that the lightweight manifest keeps projected non-test nodes."""
+    manifest = load_lightweight_manifest(dbt_project / "target" / "manifest.json")
+
+    assert manifest.metadata["adapter_type"] == "duckdb"
+    assert set(manifest.nodes) == {"model.shop.stg_orders", "model.shop.orders"}
+
+    node = manifest.nodes["model.shop.orders"]
+    assert isinstance(node, ManifestNode)
+    assert node.schema == "main"
+    assert node.config.materialized == "table"
+    assert node.depends_on.nodes == ["model.shop.stg_orders"]
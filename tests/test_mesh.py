@@ -0,0 +1,102 @@
+"""Tests for multi-project (dbt mesh) extraction."""
+
+import io
+
+import pytest
+
+from dbt_to_cypher import cache as cache_module
+from dbt_to_cypher.dbt_to_cypher import write_dbt_project
+from dbt_to_cypher.lineage import ColumnReference, RelationIndex
+from dbt_to_cypher.mesh import ProjectDependencies, extract_projects, merge_projects
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_extract_projects_stitches_cross_project_lineage(dbt_mesh, jobs):
+    """Test that a column reading another project's model gets a real edge."""
+    dependencies = extract_projects(dbt_mesh, jobs=jobs)
+
+    assert list(dependencies["models"]) == [
+        "model.shop.stg_orders",
+        "model.shop.orders",
+        "model.core.customers",
+    ]
+    assert dependencies["model_dependencies"]["model.shop.orders"] == [
+        "model.shop.stg_orders",
+        "model.core.customers",
+    ]
+    assert dependencies["column_dependencies"]["model.shop.orders.customer_name"] == [
+        "model.core.customers.name"
+    ]
+    assert dependencies["column_dependencies"]["model.shop.orders.order_id"] == [
+        "model.shop.stg_orders.order_id"
+    ]
+
+
+def test_extract_projects_shares_one_cache(dbt_mesh, tmp_path):
+    """Test that workers share a cache opened once, even over a stale one."""
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+    (cache_dir / "VERSION").write_text("stale")
+    (cache_dir / "stale.json").write_text("{}")
+
+    expected = extract_projects(dbt_mesh)
+    cached = extract_projects(dbt_mesh, jobs=2, cache=cache_dir)
+
+    assert cached == expected
+    assert (cache_dir / "VERSION").read_text() == cache_module.cache_version()
+    assert not (cache_dir / "stale.json").exists()
+    assert list(cache_dir.glob("*.json"))
+    assert not list(cache_dir.glob("*.tmp"))
+
+
+def _project(models, model_dependencies, unresolved=None, relations=None):
+    dependencies = {
+        "models": models,
+        "columns": {},
+        "model_dependencies": model_dependencies,
+        "column_dependencies": {},
+    }
+    return ProjectDependencies(dependencies, relations or RelationIndex(), unresolved or {})
+
+
+def test_merge_projects_fills_stub_attributes():
+    """Test that a stub of a public model is completed by the project that owns it."""
+    stub = {"schema": "core", "materialization": None}
+    owned = {"schema": "core", "materialization": "table"}
+    relations = RelationIndex()
+    relations.add("model.core.customers", ["customers"], schema="core")
+    elsewhere = RelationIndex()
+    elsewhere.add("model.other.customers", ["customers"], schema="core")
+    reference = ColumnReference("customers", "core", None, "name")
+
+    merged = merge_projects(
+        [
+            _project(
+                {"model.shop.orders": {}, "model.core.customers": stub},
+                {"model.shop.orders": ["model.core.customers"]},
+                unresolved={"model.shop.orders.customer_name": [reference]},
+            ),
+            _project({"model.core.customers": owned}, {}, relations=relations),
+            # Same relation name, but not an upstream of orders
+            _project({"model.other.customers": {}}, {}, relations=elsewhere),
+        ]
+    )
+
+    assert merged["models"]["model.core.customers"] == owned
+    assert merged["column_dependencies"] == {
+        "model.shop.orders.customer_name": ["model.core.customers.name"]
+    }
+
+
+def test_write_dbt_project_combines_projects(dbt_mesh):
+    """Test that a list of projects is written as one script."""
+    output = io.StringIO()
+
+    write_dbt_project(dbt_mesh, output)
+
+    script = output.getvalue()
+    assert "MERGE (m:Model {name: 'model.core.customers'})" in script
+    assert (
+        "MATCH (s:Column {id: 'model.shop.orders.customer_name'}), "
+        "(t:Column {id: 'model.core.customers.name'}) MERGE (s)-[:DEPENDS_ON]->(t)"
+    ) in script
@@ -0,0 +1,67 @@
+"""Tests for per-stage metrics."""
+
+import io
+import json
+
+import pytest
+
+from dbt_to_cypher.dbt_to_cypher import write_dbt_project
+from dbt_to_cypher.metrics import MetricsRecorder, measure_stage
+
+
+def test_stage_records_time_counts_and_calls_hooks():
+    """Test that a stage is recorded, passed to hooks and kept when it raises."""
+    received = []
+
+    def failing_hook(metrics):
+        raise RuntimeError("metrics backend down")
+
+    recorder = MetricsRecorder(hooks=[received.append, failing_hook], trace_memory=True)
+    with recorder.stage("build") as stage:
+        data = [str(i) for i in range(10_000)]
+        stage.count("items", len(data))
+    with pytest.raises(ValueError):
+        with recorder.stage("broken"):
+            raise ValueError
+
+    assert [metrics.name for metrics in received] == ["build", "broken"]
+    build = received[0]
+    assert build.counts == {"items": 10_000}
+    assert build.wall_seconds >= 0 and build.cpu_seconds >= 0
+    assert build.peak_traced_bytes > 100_000
+
+    report = json.loads(json.dumps(recorder.report()))
+    assert [stage["name"] for stage in report["stages"]] == ["build", "broken"]
+    assert report["total"]["wall_seconds"] >= build.wall_seconds
+
+
+def test_measure_stage_without_recorder():
+    """Test that stages can report counts when metrics are disabled."""
+    with measure_stage(None, "load") as stage:
+        stage.count("nodes", 3)
+    assert stage.counts == {"nodes": 3}
+
+
+def test_pipeline_stages(dbt_project):
+    """Test that a run records every pipeline stage with item counts."""
+    recorder = MetricsRecorder()
+    write_dbt_project(dbt_project, io.StringIO(), metrics=recorder)
+
+    stages = {metrics.name: metrics for metrics in recorder.stages}
+    assert list(stages) == [
+        "load",
+        "model_extraction",
+        "column_extraction",
+        "model_dependencies",
+        "column_lineage",
+        "graph_build",
+        "cypher_generation",
+    ]
+    assert stages["model_extraction"].counts == {"models": 2}
+    assert stages["column_lineage"].counts["dependencies"] == 2
+    assert stages["cypher_generation"].counts["statements"] > 0
+    assert stages["graph_build"].peak_traced_bytes is None
+
+    output = io.StringIO()
+    recorder.write_json(output)
+    assert json.loads(output.getvalue())["stages"][0]["name"] == "load"
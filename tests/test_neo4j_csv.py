@@ -0,0 +1,65 @@
+"""Tests for the neo4j-admin CSV exporter."""
+
+import csv
+
+from dbt_to_cypher.dbt_to_cypher import export_dbt_project_csv
+from dbt_to_cypher.graph import DependencyGraph
+from dbt_to_cypher.neo4j_csv import Neo4jCsvExporter
+
+
+def _read(path):
+    with open(path, newline="", encoding="utf-8") as fp:
+        return list(csv.reader(fp))
+
+
+def test_write_node_and_relationship_files(tmp_path):
+    """Test the headers and rows of the written files."""
+    graph = DependencyGraph()
+    graph.add_model("model_a", {"schema": "public", "enabled": True, "rows": 3})
+    graph.add_model("model_b", {"schema": "public", "rows": "many"})
+    graph.add_column("model_a", "id", {"type": "INTEGER"})
+    graph.add_dependency("model_a", "model_b")
+    graph.add_dependency("model_a", "source.unknown")
+
+    files = Neo4jCsvExporter(graph).write(tmp_path)
+
+    assert _read(files["Model"]) == [
+        ["name:ID", ":LABEL", "schema", "enabled:boolean", "rows"],
+        ["model_a", "Model", "public", "true", "3"],
+        ["model_b", "Model", "public", "", "many"],
+    ]
+    assert _read(files["Column"]) == [
+        ["id:ID", ":LABEL", "type"],
+        ["model_a.id", "Column", "INTEGER"],
+    ]
+    # The relationship to the untyped source node is skipped
+    assert _read(files["relationships"]) == [
+        [":START_ID", ":END_ID", ":TYPE"],
+        ["model_a", "model_a.id", "HAS_COLUMN"],
+        ["model_a", "model_b", "DEPENDS_ON"],
+    ]
+
+
+def test_import_command(tmp_path):
+    """Test the neo4j-admin command built for the written files."""
+    files = Neo4jCsvExporter(DependencyGraph()).write(tmp_path)
+
+    assert Neo4jCsvExporter.import_command(files) == (
+        f"neo4j-admin database import full --nodes={tmp_path / 'models.csv'} "
+        f"--nodes={tmp_path / 'columns.csv'} "
+        f"--relationships={tmp_path / 'relationships.csv'} neo4j"
+    )
+
+
+def test_export_dbt_project_csv(dbt_project, tmp_path):
+    """Test exporting a dbt project end to end."""
+    files = export_dbt_project_csv(dbt_project, tmp_path / "import")
+
+    relationships = _read(files["relationships"])[1:]
+    assert ["model.shop.orders", "model.shop.stg_orders", "DEPENDS_ON"] in relationships
+    assert [
+        "model.shop.orders.buyer_id",
+        "model.shop.stg_orders.customer_id",
+        "DEPENDS_ON",
+    ] in relationships
+    assert len(_read(files["Column"])) == 5
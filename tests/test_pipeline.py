@@ -0,0 +1,106 @@
+"""Tests for pipelined extraction and output."""
+
+import gc
+import io
+
+import pytest
+
+from dbt_to_cypher.dbt_to_cypher import (
+    extract_dbt_project,
+    iter_dbt_project_queries,
+    write_dbt_project,
+)
+from dbt_to_cypher.pipeline import PipelinedExtraction, write_queries_in_background
+
+
+def _statements(script):
+    return script.rstrip(";\n").split(";\n")
+
+
+@pytest.mark.parametrize("batch_size", [None, 2])
+@pytest.mark.parametrize("lightweight", [False, True])
+def test_pipelined_script_has_sequential_statements(dbt_project, tmp_path, batch_size, lightweight):
+    """Test that the pipelined script holds the sequential statements, model level first."""
+    output = tmp_path / "out.cypher"
+
+    count = write_dbt_project(
+        dbt_project, output, lightweight=lightweight, batch_size=batch_size, pipelined=True
+    )
+
+    statements = _statements(output.read_text())
+    sequential = _statements(
+        extract_dbt_project(dbt_project, lightweight=lightweight, batch_size=batch_size)
+    )
+    assert count == len(statements)
+    assert sorted(statements) == sorted(sequential)
+    if batch_size is None:
+        lineage = [
+            i
+            for i, statement in enumerate(statements)
+            if "(s:Column" in statement and "(t:Column" in statement
+        ]
+        has_column = [i for i, statement in enumerate(statements) if "HAS_COLUMN" in statement]
+        assert lineage and min(lineage) > max(has_column)
+
+
+def test_pipelined_extraction_with_selection(dbt_project, tmp_path):
+    """Test that column lineage starts after loading when a selection must be resolved."""
+    state = tmp_path / "state.json"
+    queries = iter_dbt_project_queries(
+        dbt_project, select=["orders"], save_state=state, pipelined=True
+    )
+
+    assert sorted(queries) == sorted(
+        _statements(extract_dbt_project(dbt_project, select=["orders"]))
+    )
+    assert state.exists()
+
+
+def test_column_dependencies_require_model_level_first(dbt_project):
+    """Test that lineage cannot be collected before it was started."""
+    with PipelinedExtraction(dbt_project) as pipeline:
+        with pytest.raises(RuntimeError):
+            pipeline.extract_column_dependencies()
+
+
+def test_unconsumed_pipelined_queries_release_lineage_process(dbt_project, monkeypatch):
+    """Test that the lineage process is shut down even if iteration never starts."""
+    closed = []
+    close = PipelinedExtraction.close
+    monkeypatch.setattr(
+        PipelinedExtraction, "close", lambda self: closed.append(self._executor) or close(self)
+    )
+
+    with iter_dbt_project_queries(dbt_project, pipelined=True):
+        pass
+    assert closed and closed[0] is not None
+
+    closed.clear()
+    queries = iter_dbt_project_queries(dbt_project, pipelined=True)
+    del queries
+    gc.collect()
+    assert closed and closed[0] is not None
+
+
+def test_pipelined_rejects_state_and_meshes(dbt_project, tmp_path):
+    """Test that modes needing the complete graph up front are refused."""
+    with pytest.raises(ValueError):
+        iter_dbt_project_queries(dbt_project, state=tmp_path / "state.json", pipelined=True)
+    with pytest.raises(ValueError):
+        iter_dbt_project_queries([dbt_project, dbt_project], pipelined=True)
+
+
+def test_write_queries_in_background():
+    """Test that the writer thread writes everything in order and re-raises write errors."""
+    fp = io.StringIO()
+    queries = [f"RETURN {i}" for i in range(10)]
+
+    assert write_queries_in_background(iter(queries), fp, chunk_size=3, max_pending=1) == 10
+    assert fp.getvalue() == "".join(f"{query};\n" for query in queries)
+
+    class BrokenPipe(io.StringIO):
+        def write(self, text):
+            raise BrokenPipeError
+
+    with pytest.raises(BrokenPipeError):
+        write_queries_in_background(iter(queries * 100), BrokenPipe(), chunk_size=3, max_pending=1)
@@ -0,0 +1,38 @@
+"""Tests for node property projection."""
+
+import pytest
+
+from dbt_to_cypher.projection import DEFAULT_PROPERTIES, PropertyProjection
+
+
+def test_defaults():
+    """Test that the default projection extracts the default properties."""
+    projection = PropertyProjection()
+
+    assert projection.properties("model") == list(DEFAULT_PROPERTIES["model"])
+    assert projection.properties("column") == list(DEFAULT_PROPERTIES["column"])
+
+
+def test_parse_include_and_exclude():
+    """Test that an allowlist replaces the defaults and a denylist trims them."""
+    projection = PropertyProjection.parse(
+        include=["model:name,alias", "model:schema"], exclude=["column:comment"]
+    )
+
+    assert projection.properties("model") == ["name", "alias", "schema"]
+    assert "comment" not in projection.properties("column")
+    assert "type" in projection.properties("column")
+
+
+@pytest.mark.parametrize(
+    ("include", "message"),
+    [
+        (["model"], "Expected NODE_TYPE:PROPERTY"),
+        (["source:name"], "Unknown node type 'source'"),
+        (["model:columns"], "Unknown model properties"),
+    ],
+)
+def test_parse_rejects_invalid_options(include, message):
+    """Test that malformed options and unknown properties are reported."""
+    with pytest.raises(ValueError, match=message):
+        PropertyProjection.parse(include=include)
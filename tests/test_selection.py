@@ -0,0 +1,78 @@
+"""Tests for dbt node selection."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from dbt_to_cypher.selection import NodeSelector
+
+
+def _node(name, depends_on=(), tags=(), package="shop", directory="staging"):
+    return SimpleNamespace(
+        name=name,
+        resource_type="model",
+        package_name=package,
+        original_file_path=f"models/{directory}/{name}.sql",
+        fqn=[package, directory, name],
+        tags=list(tags),
+        depends_on=SimpleNamespace(nodes=list(depends_on)),
+    )
+
+
+@pytest.fixture
+def selector():
+    """raw_orders -> stg_orders -> orders -> revenue, plus an unrelated stg_customers."""
+    return NodeSelector(
+        {
+            "model.shop.raw_orders": _node("raw_orders", directory="raw"),
+            "model.shop.stg_orders": _node(
+                "stg_orders", ["model.shop.raw_orders"], tags=["nightly"]
+            ),
+            "model.shop.stg_customers": _node("stg_customers", tags=["nightly"]),
+            "model.shop.orders": _node(
+                "orders", ["model.shop.stg_orders"], tags=["finance"], directory="marts"
+            ),
+            "model.shop.revenue": _node(
+                "revenue", ["model.shop.orders"], package="finance", directory="marts"
+            ),
+        }
+    )
+
+
+@pytest.mark.parametrize(
+    "select, expected",
+    [
+        (["orders"], {"orders"}),
+        (["+orders"], {"raw_orders", "stg_orders", "orders"}),
+        (["1+orders"], {"stg_orders", "orders"}),
+        (["stg_orders+"], {"stg_orders", "orders", "revenue"}),
+        (["stg_orders+1"], {"stg_orders", "orders"}),
+        (["stg_*"], {"stg_orders", "stg_customers"}),
+        (["shop.marts.*"], {"orders"}),
+        (["tag:nightly"], {"stg_orders", "stg_customers"}),
+        (["path:models/marts"], {"orders", "revenue"}),
+        (["package:finance"], {"revenue"}),
+        (["tag:nightly,stg_orders+"], {"stg_orders"}),
+        (["orders revenue"], {"orders", "revenue"}),
+        (["orders", "revenue"], {"orders", "revenue"}),
+    ],
+)
+def test_select(selector, select, expected):
+    """Test node names, graph operators, methods, unions and intersections."""
+    assert selector.select(select) == {f"model.shop.{name}" for name in expected}
+
+
+def test_select_everything_by_default(selector):
+    """Test that no selection keeps every node, minus exclusions."""
+    assert selector.select() == set(selector.nodes)
+    assert selector.select(["resource_type:model"]) == set(selector.nodes)
+    assert selector.select(exclude=["tag:nightly", "revenue"]) == {
+        "model.shop.raw_orders",
+        "model.shop.orders",
+    }
+
+
+def test_unknown_method(selector):
+    """Test that an unknown selector method is rejected."""
+    with pytest.raises(ValueError, match="Unknown selector method 'owner'"):
+        selector.select(["owner:alice"])
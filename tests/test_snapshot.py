@@ -0,0 +1,79 @@
+"""Tests for binary graph snapshots."""
+
+import pytest
+
+from dbt_to_cypher import snapshot
+from dbt_to_cypher.compact_graph import CompactDependencyGraph
+from dbt_to_cypher.graph import DependencyGraph
+
+
+def _graph(backend: type[DependencyGraph]) -> DependencyGraph:
+    graph = backend()
+    graph.add_model("model_a", {"schema": "main", "rows": 10, "share": 0.5, "enabled": True})
+    graph.add_model("model_b", {"schema": "main", "rows": 1, "tags": ["nightly"], "owner": None})
+    graph.add_column("model_a", "id", {"type": "INTEGER", "index": 1})
+    graph.add_column("model_b", "a_id", {"type": "INTEGER", "index": 1, "nullable": 1})
+    graph.add_dependency("model_b", "model_a")
+    graph.add_dependency("model_b.a_id", "model_a.id")
+    graph.add_dependency("orphan", "model_a", relationship="reads")
+    return graph
+
+
+@pytest.mark.parametrize("backend", [DependencyGraph, CompactDependencyGraph])
+@pytest.mark.parametrize("mmap", [False, True])
+def test_snapshot_roundtrip(tmp_path, backend, mmap):
+    """Test that nodes, typed attributes and edges survive a save and load."""
+    graph = _graph(backend)
+    path = tmp_path / "graph.snapshot"
+
+    snapshot.save(graph, path)
+    loaded = snapshot.load(path, mmap=mmap)
+
+    assert snapshot.is_snapshot(path)
+    assert list(loaded.nodes()) == list(graph.nodes())
+    assert list(loaded.edges()) == list(graph.edges())
+    attrs = loaded.node_attributes("model_a")
+    # Equal values of different types are kept apart
+    assert [type(attrs[name]) for name in ("rows", "share", "enabled")] == [int, float, bool]
+    assert loaded.node_attributes("model_b.a_id")["nullable"] == 1
+    assert loaded.get_upstream_dependencies("model_a.id") == {"model_a", "model_b.a_id"}
+    assert loaded.get_all_upstream_dependencies("model_a") == {"model_b", "orphan"}
+
+
+def test_save_leaves_the_graph_unchanged(tmp_path):
+    """Test that saving a graph with unfolded edges does not fold them in place."""
+    graph = _graph(CompactDependencyGraph)
+    assert graph.get_upstream_dependencies("model_a") == {"model_b", "orphan"}
+    pending = len(graph._pending_sources)
+    overlay = graph._overlay_out
+    path = tmp_path / "graph.snapshot"
+
+    snapshot.save(graph, path)
+
+    assert pending and len(graph._pending_sources) == pending
+    assert graph._overlay_out is overlay
+    assert list(snapshot.load(path).edges()) == list(graph.edges())
+
+
+def test_loaded_snapshot_can_be_modified(tmp_path):
+    """Test that a memory-mapped graph can still be extended."""
+    path = tmp_path / "graph.snapshot"
+    snapshot.save(_graph(CompactDependencyGraph), path)
+    loaded = snapshot.load(path, mmap=True)
+
+    loaded.add_model("model_c", {"schema": "marts"})
+    loaded.add_dependency("model_c", "model_b")
+
+    assert loaded.get_downstream_dependencies("model_c") == {"model_b"}
+    assert loaded.get_upstream_dependencies("model_b") == {"model_c"}
+    assert loaded.node_attributes("model_c") == {"node_type": "model", "schema": "marts"}
+
+
+def test_load_rejects_other_files(tmp_path):
+    """Test that loading a file that is not a snapshot fails clearly."""
+    path = tmp_path / "graph.json"
+    path.write_text("{}", encoding="utf-8")
+
+    assert not snapshot.is_snapshot(path)
+    with pytest.raises(ValueError, match="Not a dependency graph snapshot"):
+        snapshot.load(path)
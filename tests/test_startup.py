@@ -0,0 +1,62 @@
+"""Tests that startup stays light, checked with ``python -X importtime``."""
+
+import subprocess
+import sys
+
+import pytest
+
+from dbt_to_cypher import cli
+from dbt_to_cypher.dbt_to_cypher import GRAPH_BACKENDS
+
+# Dependencies that are only needed once a project is processed
+HEAVY_MODULES = ("networkx", "dbt_artifacts_parser", "dbt_colibri", "sqlglot", "pydantic")
+
+
+def _importtime(*args: str) -> dict[str, int]:
+    """Run Python with -X importtime and return cumulative microseconds per module."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    cumulative: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, total, name = line[len("import time:") :].split("|")
+        cumulative[name.strip()] = int(total)
+    return cumulative
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        ("-c", "import dbt_to_cypher"),
+        ("-m", "dbt_to_cypher.cli", "--version"),
+        ("-m", "dbt_to_cypher.cli", "--help"),
+    ],
+)
+def test_startup_skips_heavy_dependencies(args):
+    """Test that importing the package and answering --version/--help stay light."""
+    modules = _importtime(*args)
+
+    loaded = {name.split(".")[0] for name in modules} & set(HEAVY_MODULES)
+    assert not loaded
+
+
+def test_public_api_is_imported_on_access():
+    """Test that lazily exported names resolve to the defining objects."""
+    import dbt_to_cypher
+    from dbt_to_cypher.extractor import DbtDependencyExtractor
+
+    assert dbt_to_cypher.DbtDependencyExtractor is DbtDependencyExtractor
+    assert set(dbt_to_cypher.__all__) <= set(dir(dbt_to_cypher))
+    with pytest.raises(AttributeError):
+        dbt_to_cypher.missing  # noqa: B018
+
+
+def test_cli_graph_backend_choices():
+    """Test that the CLI lists every graph backend."""
+    assert cli.GRAPH_BACKEND_CHOICES == list(GRAPH_BACKENDS)
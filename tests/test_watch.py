@@ -0,0 +1,101 @@
+"""Tests for watch mode."""
+
+import io
+import json
+
+from dbt_to_cypher import lineage
+from dbt_to_cypher.dbt_to_cypher import watch_dbt_project
+from dbt_to_cypher.watch import ArtifactWatcher, artifact_signature
+
+
+def test_watcher_waits_until_files_are_stable(tmp_path):
+    """Test that a change is reported once the file stops changing, not while it is written."""
+    path = tmp_path / "manifest.json"
+    path.write_text("{}")
+    writes = iter(["{", '{"nodes"', None, '{"nodes": {}}', None, None])
+    sleeps = []
+
+    def sleep(seconds):
+        sleeps.append(seconds)
+        content = next(writes)
+        if content is None:
+            return
+        if path.exists():
+            path.unlink()
+        path.write_text(content)
+
+    watcher = ArtifactWatcher([path], debounce=0, poll_interval=0.1, sleep=sleep)
+    watcher.wait_for_change()
+
+    # The first stable state after the change ends the wait
+    assert sleeps == [0.1, 0.1, 0.1]
+    assert watcher.signature == artifact_signature([path])
+
+
+def test_watcher_ignores_missing_files(tmp_path):
+    """Test that a file being replaced is not reported until it exists again."""
+    path = tmp_path / "catalog.json"
+    path.write_text("{}")
+    steps = iter([path.unlink, None, None, lambda: path.write_text("{ }"), None])
+
+    def sleep(seconds):
+        step = next(steps)
+        if step is not None:
+            step()
+
+    watcher = ArtifactWatcher([path], debounce=0, sleep=sleep)
+    watcher.wait_for_change()
+
+    assert path.exists()
+    assert artifact_signature([tmp_path / "missing.json"]) is None
+
+
+def test_watch_rebuilds_changed_models_only(dbt_project, monkeypatch):
+    """Test that a rebuild recomputes changed models and appends only the diff."""
+    parsed = []
+    real_compute = lineage._compute_lineage_references
+
+    def recording_compute(manifest, catalog, models, jobs):
+        parsed.append(set(models))
+        return real_compute(manifest, catalog, models, jobs)
+
+    output = io.StringIO()
+    initial_length = []
+
+    def edit_orders(self):
+        initial_length.append(len(output.getvalue()))
+        manifest_path = dbt_project / "target" / "manifest.json"
+        manifest = json.loads(manifest_path.read_text())
+        manifest["nodes"]["model.shop.orders"]["compiled_code"] = (
+            'select order_id, order_id as buyer_id from "analytics"."main"."stg_orders"'
+        )
+        manifest_path.write_text(json.dumps(manifest))
+
+    monkeypatch.setattr(lineage, "_compute_lineage_references", recording_compute)
+    monkeypatch.setattr(ArtifactWatcher, "wait_for_change", edit_orders)
+
+    watch_dbt_project(dbt_project, output, max_rebuilds=1)
+
+    assert parsed == [{"model.shop.stg_orders", "model.shop.orders"}, {"model.shop.orders"}]
+    # The initial build writes the full script, the rebuild only swaps one lineage edge
+    assert "CREATE CONSTRAINT" in output.getvalue()[: initial_length[0]]
+    assert output.getvalue()[initial_length[0] :].splitlines() == [
+        "MATCH (s:Column {id: 'model.shop.orders.buyer_id'})-[r:DEPENDS_ON]->"
+        "(t:Column {id: 'model.shop.stg_orders.customer_id'}) DELETE r;",
+        "MATCH (s:Column {id: 'model.shop.orders.buyer_id'}), "
+        "(t:Column {id: 'model.shop.stg_orders.order_id'}) MERGE (s)-[:DEPENDS_ON]->(t);",
+    ]
+
+
+def test_watch_keeps_graph_after_failed_rebuild(dbt_project, monkeypatch, tmp_path):
+    """Test that a broken artifact is logged and the output file keeps the last good script."""
+    output = tmp_path / "graph.cypher"
+
+    def break_manifest(self):
+        (dbt_project / "target" / "manifest.json").write_text("{")
+
+    monkeypatch.setattr(ArtifactWatcher, "wait_for_change", break_manifest)
+
+    watch_dbt_project(dbt_project, output, max_rebuilds=1)
+
+    assert "model.shop.orders" in output.read_text()